@@ -18,6 +18,8 @@ import abc
 
 from secuml.core.classif.conf import classifiers
 from secuml.core.classif.conf.classifiers import ClassifierType
+from secuml.core.classif.conf.classifiers \
+        import DEFAULT_WARM_START_MAX_TREES
 from secuml.core.classif.conf import ClassificationConf
 from secuml.core.classif.conf.hyperparam import HyperparamConf
 from secuml.core.classif.conf.test.unlabeled_labeled \
@@ -58,7 +60,10 @@ class ActiveLearningConfFactory(ConfFactory):
                                             classifier_conf, test_conf,
                                             logger,
                                             validation_conf=validation_conf)
-        return class_.from_args(args, main_model_conf, validation_conf, logger)
+        conf = class_.from_args(args, main_model_conf, validation_conf, logger)
+        if main_model_type is not None:
+            conf.set_model_update(args.warm_start, args.retune_every)
+        return conf
 
     def from_json(self, obj, logger):
         class_name = obj['__type__']
@@ -68,8 +73,13 @@ class ActiveLearningConfFactory(ConfFactory):
         if obj['validation_conf'] is None:
             return None
         validation_conf = TestDatasetConf(logger, None, obj['validation_conf'])
-        return self.methods[class_name].from_json(obj, main_model,
+        conf = self.methods[class_name].from_json(obj, main_model,
                                                   validation_conf, logger)
+        # Experiments created before the incremental model update have no
+        # warm_start and retune_every fields.
+        conf.set_model_update(obj.get('warm_start', False),
+                              obj.get('retune_every', 1))
+        return conf
 
 
 class InvalidInputArguments(SecuMLcoreException):
@@ -89,8 +99,17 @@ class ActiveLearningConf(Conf):
         self.budget = budget
         self.main_model_conf = main_model_conf
         self.validation_conf = validation_conf
+        self.warm_start = False
+        self.retune_every = 1
         self._set_strategy()
 
+    def set_model_update(self, warm_start, retune_every):
+        if retune_every < 1:
+            raise InvalidInputArguments('--retune-every must be greater '
+                                        'than or equal to 1.')
+        self.warm_start = warm_start
+        self.retune_every = retune_every
+
     def get_strategy(self, iteration):
         return self.strategy(iteration)
 
@@ -110,7 +129,9 @@ class ActiveLearningConf(Conf):
                 ('auto', exportFieldMethod.primitive),
                 ('budget', exportFieldMethod.primitive),
                 ('main_model_conf', exportFieldMethod.obj),
-                ('validation_conf', exportFieldMethod.obj)]
+                ('validation_conf', exportFieldMethod.obj),
+                ('warm_start', exportFieldMethod.primitive),
+                ('retune_every', exportFieldMethod.primitive)]
 
     @staticmethod
     def gen_main_model_parser(parser):
@@ -122,6 +143,33 @@ class ActiveLearningConf(Conf):
                            default='LogisticRegression',
                            help='Model class trained at each iteration. '
                                 'Default: LogisticRegression.')
+        group.add_argument('--retune-every',
+                           type=int,
+                           default=1,
+                           help='The hyperparameters of the model are '
+                                'optimized every RETUNE_EVERY iterations. '
+                                'In-between, the previous values are used. '
+                                'Default: 1.')
+        group.add_argument('--warm-start',
+                           action='store_true',
+                           default=False,
+                           help='When specified, the model is initialized '
+                                'with the model of the previous iteration '
+                                'when the hyperparameters are not optimized. '
+                                'The model is trained from scratch every '
+                                'RETUNE_EVERY iterations. '
+                                'Supported model classes: '
+                                'LogisticRegression (not with liblinear), '
+                                'RandomForest and GradientBoosting. '
+                                'RandomForest drops its oldest trees, and '
+                                'GradientBoosting is trained from scratch, '
+                                'beyond WARM_START_MAX_TREES trees.')
+        group.add_argument('--warm-start-max-trees',
+                           type=int,
+                           default=DEFAULT_WARM_START_MAX_TREES,
+                           help='Maximum number of trees of the warm-started '
+                                'RandomForest and GradientBoosting models. '
+                                'Default: %d.' % DEFAULT_WARM_START_MAX_TREES)
         HyperparamConf.gen_parser(group, None, True, subgroup=False)
 
     @staticmethod
@@ -31,7 +31,8 @@ class Datasets(object):
                                        labels_tools.label_str_to_bool(label),
                                        family)
         # Update the annotation count
-        self.num_annotations[label] += 1
+        if label is not None:
+            self.num_annotations[label] += 1
 
     def num_annotations(self, label='all'):
         return len(self.instances.annotations.get_annotated_ids(label=label))
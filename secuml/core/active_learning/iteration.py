@@ -14,12 +14,11 @@
 # You should have received a copy of the GNU General Public License along
 # with SecuML. If not, see <http://www.gnu.org/licenses/>.
 
-import time
-
 from .monitoring.labels import LabelsMonitoring
 from .monitoring.suggestions_accuracy import SuggestionsAccuracy
 from .queries import NoAnnotationBudget
 from .update_model import UpdateModel
+from secuml.core.tools import profiling
 from secuml.core.tools.core_exceptions import SecuMLcoreException
 
 
@@ -52,18 +51,30 @@ class Iteration(object):
         self.check_unlabeled_data()
         self.set_query_strategy()
         self.conf.logger.info('Start iteration n°%d' % self.iter_num)
-        start = time.time()
-        self.init_computations()
-        self.update_model()
-        self.generate_queries()
-        self.answer_queries()
-        self.global_execution_time = time.time() - start
+        profiling.start_profiling('iteration')
+        try:
+            with profiling.span('init_computations'):
+                self.init_computations()
+            with profiling.span('update_model'):
+                self.update_model()
+            with profiling.span('generate_queries'):
+                self.generate_queries()
+            with profiling.span('answer_queries'):
+                self.answer_queries()
+        finally:
+            self.profiler = profiling.stop_profiling()
+        self.global_execution_time = self.profiler.get_duration()
+        self.export_profiling()
         self.conf.logger.info('End iteration n°%d' % self.iter_num)
         self.conf.logger.info('Iteration n°%d: %f sec' % (
                                                    self.iter_num,
                                                    self.global_execution_time))
         return self.budget
 
+    # The spans of the iteration are available in self.profiler.
+    def export_profiling(self):
+        return
+
     def check_unlabeled_data(self):
         unlabeled_data = self.datasets.get_unlabeled_instances()
         if unlabeled_data.num_instances() == 0:
@@ -82,11 +93,13 @@ class Iteration(object):
     def final_computations(self):
         if not self.conf.auto:
             try:
-                self.update_annotated_instances()
+                with profiling.span('annotations_sync'):
+                    self.update_annotated_instances()
             except (NoAnnotationBudget) as e:
                 self.conf.logger.info(e)
                 pass
-        self.end_monitoring()
+        with profiling.span('suggestions_monitoring'):
+            self.end_monitoring()
         self.check_new_annotations()
 
     def end_monitoring(self):
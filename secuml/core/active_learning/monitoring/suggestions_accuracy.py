@@ -15,12 +15,16 @@
 # with SecuML. If not, see <http://www.gnu.org/licenses/>.
 
 import csv
-import matplotlib.pyplot as plt
 import os
 import os.path as path
-import pandas as pd
 
 from secuml.core.tools.plots.dataset import PlotDataset
+from secuml.core.tools.plots.evolution import Evolution
+from secuml.core.tools.plots.evolution import get_evolution
+from secuml.core.tools.plots.evolution import plot_evolution
+
+COUNTS = ['true_suggestions', 'false_suggestions', 'no_suggestion',
+          'num_suggestions', 'num_annotations']
 
 
 class SuggestionsAccuracyCounts(object):
@@ -49,12 +53,18 @@ class SuggestionsAccuracyCounts(object):
             self.false_suggestions += 1
             self.num_suggestions += 1
 
+    def get_accuracy(self):
+        if self.num_suggestions == 0:
+            return None
+        return self.true_suggestions / self.num_suggestions
+
+    # The figure is rendered on demand (see SuggestionsAccuracyCounts.plot).
     def export(self, monitoring_dir, evolution_dir):
         filename = '_'.join([self.labels_families, self.kind,
                              'suggestions.csv'])
         evolution_file = path.join(evolution_dir, filename)
         self.display_csv_line(evolution_file)
-        self.plot_evolution(evolution_file, monitoring_dir)
+        self.update_evolution(evolution_dir)
 
     def display_csv_line(self, evolution_file):
         if self.monitoring.iter_num == 1:
@@ -70,46 +80,43 @@ class SuggestionsAccuracyCounts(object):
     def display_csv_header(self, evolution_file):
         with open(evolution_file, 'w') as f:
             header = ['iteration']
-            header.extend(['true_suggestions', 'false_suggestions',
-                           'no_suggestion', 'num_suggestions',
-                           'num_annotations'])
+            header.extend(COUNTS)
             csv_writer = csv.writer(f)
             csv_writer.writerow(header)
 
-    def load_evolution(self, evolution_file):
-        with open(evolution_file, 'r') as f:
-            data = pd.read_csv(f, header=0, index_col=0)
-            return data
-
-    def plot_evolution(self, evolution_file, monitoring_dir):
-        data = self.load_evolution(evolution_file)
+    def update_evolution(self, evolution_dir):
+        filename = SuggestionsAccuracyCounts.get_evolution_file(
+                                evolution_dir, self.labels_families, self.kind)
+        evolution = get_evolution(filename, self.monitoring.iter_num,
+                                  self.new_evolution)
+        evolution.add_iteration(self.monitoring.iter_num,
+                                [self.true_suggestions, self.false_suggestions,
+                                 self.no_suggestion, self.num_suggestions,
+                                 self.num_annotations, self.get_accuracy()])
+        evolution.export(filename)
+
+    def new_evolution(self):
         if self.labels_families == 'labels':
             title = 'Labels Suggestions Accuracy'
         elif self.labels_families == 'families':
             title = 'Families Suggestions Accuracy'
-        plot = PlotDataset(data['true_suggestions'] /
-                           data['num_suggestions'], title)
-        iterations = list(range(self.monitoring.iter_num))
-        plt.clf()
-        max_value = 1
-        plt.plot(iterations, plot.values,
-                 label=plot.label,
-                 color=plot.color,
-                 linewidth=plot.linewidth,
-                 marker=plot.marker)
-        plt.ylim(0, max_value)
-        plt.xlabel('Iteration')
-        plt.ylabel('Suggestions Accuracy')
-        lgd = plt.legend(bbox_to_anchor=(0., 1.02, 1., .102), loc=3,
-                         ncol=2, mode='expand', borderaxespad=0.,
-                         fontsize='large')
-        filename = '_'.join([self.labels_families,
-                             self.kind,
-                             'suggestions.png'])
-        filename = path.join(monitoring_dir, filename)
-        plt.savefig(filename, bbox_extra_artists=(lgd,), bbox_inches='tight')
-        plt.clf()
-        self.data = data
+        evolution = Evolution(COUNTS + ['accuracy'], 'Suggestions Accuracy',
+                              ymax=1)
+        evolution.add_series('accuracy', PlotDataset(None, title))
+        return evolution
+
+    @staticmethod
+    def get_evolution_file(evolution_dir, labels_families, kind):
+        filename = '_'.join([labels_families, kind, 'suggestions.jsonl'])
+        return path.join(evolution_dir, filename)
+
+    @staticmethod
+    def plot(al_dir, iteration_dir, iter_num, labels_families, kind):
+        evolution_dir, monitoring_dir = get_dirs(al_dir, iteration_dir)
+        filename = '_'.join([labels_families, kind, 'suggestions.png'])
+        plot_evolution(SuggestionsAccuracyCounts.get_evolution_file(
+                                        evolution_dir, labels_families, kind),
+                       path.join(monitoring_dir, filename), iter_num)
 
 
 class SuggestionsAccuracyLabelsFamilies(object):
@@ -169,54 +176,58 @@ class SuggestionsAccuracy(object):
         self.labels_accuracy.generate()
         self.families_accuracy.generate()
 
+    # The figures are rendered on demand (see SuggestionsAccuracy.plot).
     def export(self, al_dir, iteration_dir):
         monitoring_dir, evolution_dir = self.get_ouput_dirs(al_dir,
                                                             iteration_dir)
         self.labels_accuracy.export(monitoring_dir, evolution_dir)
         self.families_accuracy.export(monitoring_dir, evolution_dir)
-        self.plot_evolution(monitoring_dir)
-
-    def plot_evolution(self, monitoring_dir):
-        iterations = list(range(1, self.monitoring.iter_num + 1))
-        plt.clf()
-        # Labels
-        data = self.labels_accuracy.high_confidence_counts.data
-        values = data['true_suggestions'] / data['num_suggestions']
-        plot = PlotDataset(values, 'Labels Suggestions')
-        max_value = 1
-        plt.plot(iterations, plot.values,
-                 label=plot.label,
-                 color=plot.color,
-                 linewidth=plot.linewidth,
-                 marker=plot.marker)
-        # Families
-        data = self.families_accuracy.high_confidence_counts.data
-        values = data['true_suggestions'] / data['num_suggestions']
-        plot = PlotDataset(values, 'Families Suggestions')
-        max_value = 1
-        plt.plot(iterations, plot.values,
-                 label=plot.label,
-                 color='purple',
-                 linewidth=plot.linewidth,
-                 marker=plot.marker)
-        # Plot
-        plt.ylim(0, max_value)
-        plt.xlabel('Iteration')
-        plt.ylabel('Suggestions Accuracy')
-        lgd = plt.legend(bbox_to_anchor=(0., 1.02, 1., .102), loc=3,
-                         ncol=2, mode='expand', borderaxespad=0.,
-                         fontsize='large')
-        filename = path.join(monitoring_dir,
-                             'labels_families_high_confidence_suggestions.png')
-        plt.savefig(filename, bbox_extra_artists=(lgd,), bbox_inches='tight')
-        plt.clf()
+        self.update_evolution(evolution_dir)
+
+    def update_evolution(self, evolution_dir):
+        filename = SuggestionsAccuracy.get_evolution_file(evolution_dir)
+        evolution = get_evolution(filename, self.monitoring.iter_num,
+                                  self.new_evolution)
+        labels = self.labels_accuracy.high_confidence_counts.get_accuracy()
+        families = self.families_accuracy.high_confidence_counts.get_accuracy()
+        evolution.add_iteration(self.monitoring.iter_num, [labels, families])
+        evolution.export(filename)
+
+    def new_evolution(self):
+        evolution = Evolution(['labels', 'families'], 'Suggestions Accuracy',
+                              ymax=1)
+        evolution.add_series('labels', PlotDataset(None, 'Labels Suggestions'))
+        families = PlotDataset(None, 'Families Suggestions')
+        families.set_color('purple')
+        evolution.add_series('families', families)
+        return evolution
 
     def get_ouput_dirs(self, al_dir, iteration_dir):
-        monitoring_dir = path.join(iteration_dir, 'suggestions_accuracy')
+        evolution_dir, monitoring_dir = get_dirs(al_dir, iteration_dir)
         os.makedirs(monitoring_dir)
-
-        evolution_dir = path.join(al_dir, 'suggestions_accuracy')
         if self.monitoring.iter_num == 1:
             os.makedirs(evolution_dir)
-
         return monitoring_dir, evolution_dir
+
+    @staticmethod
+    def get_evolution_file(evolution_dir):
+        return path.join(evolution_dir,
+                         'labels_families_high_confidence_suggestions.jsonl')
+
+    @staticmethod
+    def plot(al_dir, iteration_dir, iter_num):
+        evolution_dir, monitoring_dir = get_dirs(al_dir, iteration_dir)
+        plot_evolution(
+            SuggestionsAccuracy.get_evolution_file(evolution_dir),
+            path.join(monitoring_dir,
+                      'labels_families_high_confidence_suggestions.png'),
+            iter_num)
+        for labels_families in ['labels', 'families']:
+            for kind in ['all', 'high_confidence']:
+                SuggestionsAccuracyCounts.plot(al_dir, iteration_dir,
+                                               iter_num, labels_families, kind)
+
+
+def get_dirs(al_dir, iteration_dir):
+    return (path.join(al_dir, 'suggestions_accuracy'),
+            path.join(iteration_dir, 'suggestions_accuracy'))
@@ -19,6 +19,7 @@ import csv
 import os.path as path
 import time
 
+from secuml.core.tools import profiling
 from secuml.core.tools.core_exceptions import SecuMLcoreException
 
 
@@ -30,12 +31,16 @@ class Queries(object):
         self.annotation_queries = []
 
     def run(self, predictions, already_queried=None):
-        self._set_predictions(predictions)
-        self.run_models()
-        start_time = time.time()
-        self.generate_queries(already_queried=already_queried)
-        self.exec_time = time.time() - start_time
-        self.export()
+        with profiling.span(self.__class__.__name__):
+            self._set_predictions(predictions)
+            with profiling.span('run_models'):
+                self.run_models()
+            start_time = time.time()
+            with profiling.span('generate_queries'):
+                self.generate_queries(already_queried=already_queried)
+            self.exec_time = time.time() - start_time
+            with profiling.span('export'):
+                self.export()
 
     def get_ids(self):
         return [q.instance_id for q in self.annotation_queries]
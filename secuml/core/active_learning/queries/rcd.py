@@ -21,6 +21,7 @@ import random
 import time
 
 from secuml.core.clustering.clusters import Clusters
+from secuml.core.tools import profiling
 from secuml.core.tools.core_exceptions import SecuMLcoreException
 
 from .categories import Categories
@@ -62,7 +63,8 @@ class RcdQueries(Queries):
 
     def run(self, predictions, already_queried=None):
         Queries.run(self, predictions, already_queried=already_queried)
-        self._gen_clustering_visu()
+        with profiling.span('clustering_visu'):
+            self._gen_clustering_visu()
 
     def _set_predictions(self, predictions):
         if self.proba_min is not None and self.proba_max is not None:
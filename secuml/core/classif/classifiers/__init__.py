@@ -15,14 +15,17 @@
 # with SecuML. If not, see <http://www.gnu.org/licenses/>.
 
 import abc
+import copy
 import time
 
+from sklearn.base import clone
 from sklearn.externals import joblib
 from sklearn.model_selection import StratifiedKFold
 from sklearn.model_selection import GridSearchCV
 from sklearn.pipeline import Pipeline
 
 from secuml.core.data.predictions import Predictions
+from secuml.core.tools import profiling
 from secuml.core.tools.core_exceptions import SecuMLcoreException
 
 
@@ -47,6 +50,7 @@ class Classifier(object):
     # conf: ClassifierConf
     def __init__(self, conf):
         self.conf = conf
+        self.warm_started = False
         self._create_pipeline()
 
     def get_coefs(self):
@@ -67,17 +71,71 @@ class Classifier(object):
         annotations = instances.get_annotations(ground_truth)
         return annotations.get_supervision(self.conf.multiclass)
 
-    def training(self, instances):
+    # tune_hyperparam: when False, the hyperparameters are not optimized and
+    # the best values previously stored in the configuration are used.
+    # init_classifier: the fitted model of init_classifier is used to
+    # warm-start the training when the model class supports it.
+    def training(self, instances, tune_hyperparam=True, init_classifier=None):
         execution_time = 0
         start = time.time()
-        self._set_best_hyperparam(instances)
+        with profiling.span('hyperparameters'):
+            if tune_hyperparam:
+                self._set_best_hyperparam(instances)
+            else:
+                self._set_hyperparam_values()
+            if init_classifier is not None:
+                self._warm_start(init_classifier)
         execution_time += time.time() - start
         start = time.time()
-        self._fit(instances)
+        with profiling.span('fit'):
+            self._fit(instances)
         execution_time += time.time() - start
-        predictions = self._get_predictions(instances)
+        self._end_warm_start()
+        with profiling.span('predict'):
+            predictions = self._get_predictions(instances)
         return predictions, execution_time
 
+    def _set_hyperparam_values(self):
+        hyperparam_conf = self.conf.hyperparam_conf
+        if hyperparam_conf is not None and hyperparam_conf.values is not None:
+            self.pipeline.set_params(
+                                **hyperparam_conf.values.get_best_values())
+
+    # The warm-started model has been fitted on the data transformed by the
+    # preprocessing steps (e.g. scaler) of the previous model. These fitted
+    # steps are kept as is, and only the model step is fitted (see _fit).
+    def _warm_start(self, init_classifier):
+        init_model = init_classifier.pipeline.named_steps['model']
+        model = self._warm_start_model(copy.deepcopy(init_model))
+        if model is None:
+            return
+        steps = {name: copy.deepcopy(step)
+                 for name, step in init_classifier.pipeline.steps[:-1]}
+        self.pipeline.set_params(model=model, **steps)
+        self.warm_started = True
+
+    # Returns None if the model cannot be warm-started: it is then trained
+    # from scratch. Otherwise, returns init_model with warm_start enabled.
+    def _warm_start_model(self, init_model):
+        self.conf.logger.warning('%s does not support warm start. '
+                                 'The model is trained from scratch.'
+                                 % self.__class__.__name__)
+        return None
+
+    # The following calls to fit must not reuse the fitted model.
+    def _end_warm_start(self):
+        self.warm_started = False
+        model = self.pipeline.named_steps['model']
+        if 'warm_start' in model.get_params():
+            model.set_params(warm_start=False)
+
+    # Applies the fitted preprocessing steps of the pipeline, i.e. all the
+    # steps but the model.
+    def _preprocess(self, features):
+        for _, step in self.pipeline.steps[:-1]:
+            features = step.transform(features)
+        return features
+
     def _get_predictions(self, instances):
         predictions = self.apply_pipeline(instances)
         if instances.has_ground_truth():
@@ -96,13 +154,20 @@ class Classifier(object):
         cv_test_conf = CvConf(self.conf.logger, None, num_folds)
         cv_datasets = cv_test_conf.gen_datasets(self.conf, train_instances)
         for fold_id, datasets in enumerate(cv_datasets._datasets):
+            # The folds are fitted on a copy of the pipeline: the trained
+            # model is exported, and warm-starts the next active learning
+            # iteration.
+            fold_classifier = copy.copy(self)
+            fold_classifier.pipeline = clone(self.pipeline)
             start = time.time()
-            self.pipeline.fit(datasets.train_instances.features.get_values(),
-                              self.get_supervision(datasets.train_instances))
+            fold_classifier.pipeline.fit(
+                            datasets.train_instances.features.get_values(),
+                            self.get_supervision(datasets.train_instances))
             train_time = time.time() - start
-            cv_predictions, test_time = self.testing(datasets.test_instances)
-            cv_monitoring.add_fold(self, train_time, cv_predictions,
-                                   test_time, fold_id)
+            cv_predictions, test_time = fold_classifier.testing(
+                                                       datasets.test_instances)
+            cv_monitoring.add_fold(fold_classifier, train_time,
+                                   cv_predictions, test_time, fold_id)
 
     def apply_pipeline(self, instances):
         num_instances = instances.num_instances()
@@ -141,7 +206,8 @@ class Classifier(object):
 
     def testing(self, instances):
         start = time.time()
-        predictions = self._get_predictions(instances)
+        with profiling.span('predict'):
+            predictions = self._get_predictions(instances)
         exec_time = time.time() - start
         return predictions, exec_time
 
@@ -178,11 +244,20 @@ class SupervisedClassifier(Classifier):
         self.pipeline.set_params(**best_values)
 
     def _fit(self, train_instances):
-        self.pipeline.fit(train_instances.features.get_values(),
-                          self.get_supervision(train_instances))
-
-    def training(self, train_instances):
-        predictions, exec_time = Classifier.training(self, train_instances)
+        features = train_instances.features.get_values()
+        supervision = self.get_supervision(train_instances)
+        if self.warm_started:
+            model = self.pipeline.named_steps['model']
+            model.fit(self._preprocess(features), supervision)
+        else:
+            self.pipeline.fit(features, supervision)
+
+    def training(self, train_instances, tune_hyperparam=True,
+                 init_classifier=None):
+        predictions, exec_time = Classifier.training(
+                                            self, train_instances,
+                                            tune_hyperparam=tune_hyperparam,
+                                            init_classifier=init_classifier)
         if self.conf.multiclass:
             self.class_labels = self.pipeline.named_steps['model'].classes_
         return predictions, exec_time
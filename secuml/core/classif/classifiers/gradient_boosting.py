@@ -25,3 +25,18 @@ class GradientBoosting(SupervisedClassifier):
     def _get_pipeline(self):
         return [('scaler', StandardScaler()),
                 ('model', GradientBoostingClassifier())]
+
+    # New trees are fitted on the current training data and added to the
+    # trees of the previous model. Each boosting stage depends on the previous
+    # ones, so the oldest trees cannot be removed: the model is trained from
+    # scratch when it would exceed warm_start_max_trees trees.
+    def _warm_start_model(self, init_model):
+        num_trees = self.pipeline.named_steps['model'].n_estimators
+        n_estimators = init_model.n_estimators + num_trees
+        if n_estimators > self.conf.warm_start_max_trees:
+            self.conf.logger.info('The model would exceed %d trees. '
+                                  'It is trained from scratch.'
+                                  % self.conf.warm_start_max_trees)
+            return None
+        init_model.set_params(warm_start=True, n_estimators=n_estimators)
+        return init_model
@@ -30,3 +30,9 @@ class LogisticRegression(SupervisedClassifier):
                                                    multi_class='ovr',
                                                    solver=self.conf.optim_algo,
                                                    fit_intercept=False))]
+
+    # The coefficients of the previous model initialize the optimization.
+    # It has no effect with the liblinear solver.
+    def _warm_start_model(self, init_model):
+        init_model.set_params(warm_start=True)
+        return init_model
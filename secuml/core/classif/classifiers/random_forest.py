@@ -25,3 +25,17 @@ class RandomForest(SupervisedClassifier):
     def _get_pipeline(self):
         return [('scaler', StandardScaler()),
                 ('model', RandomForestClassifier())]
+
+    # New trees are fitted on the current training data and added to the
+    # trees of the previous model. The oldest trees are removed so that the
+    # forest holds at most warm_start_max_trees trees.
+    def _warm_start_model(self, init_model):
+        num_trees = self.pipeline.named_steps['model'].n_estimators
+        num_prev_trees = len(init_model.estimators_)
+        num_kept = min(num_prev_trees,
+                       max(0, self.conf.warm_start_max_trees - num_trees))
+        init_model.estimators_ = init_model.estimators_[num_prev_trees -
+                                                        num_kept:]
+        init_model.set_params(warm_start=True,
+                              n_estimators=num_kept + num_trees)
+        return init_model
@@ -45,7 +45,9 @@ class Sssvdd(Classifier):
     def cv_monitoring(self, train_instances, cv_monitoring):
         raise NoCvMonitoring(self)
 
-    def training(self, train_instances):
+    # SSSVDD does not support hyperparameter tuning and warm start.
+    def training(self, train_instances, tune_hyperparam=True,
+                 init_classifier=None):
         exec_time = 0
 
         # Scaling and training
@@ -100,14 +102,15 @@ class Sssvdd(Classifier):
             return Predictions([], instances.ids, False)
         features = instances.features.get_values()
         preprocessed_features = self.scaler.transform(features)
-        predicted_scores = np.apply_along_axis(predict_score, 1,
-                                               preprocessed_features,
-                                               self.c, self.r)
+        predicted_scores = predict_score(preprocessed_features, self.c,
+                                         self.r)
         predicted_labels = predicted_scores > 0
         return Predictions(predicted_labels, instances.ids, False,
                            scores=predicted_scores)
 
 
+# The following functions are vectorized: x may be a single instance or a
+# matrix with one instance per row.
 def predict_label(x, center, r):
     return predict_score(x, center, r) > 0
 
@@ -116,123 +119,86 @@ def predict_score(x, center, r):
     return square_distance_to_center(x, center) - pow(r, 2)
 
 
-def objective(x, unlabeled_features, labeled_features, labels, kappa, nu_U,
-              nu_L):
-    R, gamma, c = get_values(x)
-    # Unlabeled sum
-    num_unlabeled_instances = unlabeled_features.shape[0]
-    sum_U = 0
-    for i in range(num_unlabeled_instances):
-        sum_U += _l(R * R -
-                    square_distance_to_center(unlabeled_features[i, :], c))
-    # Labeled sum
-    sum_L = 0
-    num_labeled_instances = labeled_features.shape[0]
-    if num_labeled_instances > 0:
-        for i in range(num_labeled_instances):
-            square_dist = square_distance_to_center(labeled_features[i, :], c)
-            sum_L += _l(labels[i] * (R * R - square_dist) - gamma)
-    obj = R * R
-    obj -= kappa * gamma
-    obj += nu_U * sum_U
-    obj += nu_L * sum_L
-    return obj
+def distance_to_center(x, center):
+    return np.sqrt(square_distance_to_center(x, center))
 
 
-def distance_to_center(x_i, center):
-    return np.linalg.norm(x_i - center)
+def square_distance_to_center(x, center):
+    diff = x - center
+    return np.einsum('...j,...j->...', diff, diff)
 
 
-def square_distance_to_center(x_i, center):
-    return np.dot(x_i - center, x_i - center)
-
-
-def partial_derivatives_r(x_i, x):
+# The loss _l and its derivative l_prime are evaluated on the margins of the
+# unlabeled and labeled instances.
+def _margins_U(x, unlabeled_features):
     R, _, c = get_values(x)
-    return 2 * R * l_prime(R * R - square_distance_to_center(x_i, c))
+    return R * R - square_distance_to_center(unlabeled_features, c)
 
 
-def partial_derivatives_c(x_i, x):
-    R, _, c = get_values(x)
-    return 2 * (x_i - c) * l_prime(R * R - square_distance_to_center(x_i, c))
-
-
-def partial_derivatives_r_star(x_i, y_i, x):
+def _margins_L(x, labeled_features, labels):
     R, gamma, c = get_values(x)
-    square_dist = square_distance_to_center(x_i, c)
-    return 2 * y_i * R * l_prime(y_i * (R * R - square_dist) - gamma)
+    square_dist = square_distance_to_center(labeled_features, c)
+    return labels * (R * R - square_dist) - gamma
 
 
-def partial_derivatives_gamma_star(x_i, y_i, x):
-    R, gamma, c = get_values(x)
-    return -l_prime(y_i * (R * R - square_distance_to_center(x_i, c)) - gamma)
+def objective(x, unlabeled_features, labeled_features, labels, kappa, nu_U,
+              nu_L):
+    R, gamma, _ = get_values(x)
+    sum_U = np.sum(_l(_margins_U(x, unlabeled_features)))
+    sum_L = np.sum(_l(_margins_L(x, labeled_features, labels)))
+    obj = R * R
+    obj -= kappa * gamma
+    obj += nu_U * sum_U
+    obj += nu_L * sum_L
+    return obj
 
 
-def partial_derivatives_c_star(x_i, y_i, x):
-    R, gamma, c = get_values(x)
-    square_dist = square_distance_to_center(x_i, c)
-    return 2 * y_i * (x_i - c) * l_prime(y_i * (R * R - square_dist) - gamma)
+# sum_i weights_i * 2 * (x_i - c) computed without building x_i - c.
+def _sum_c(features, weights, c):
+    return 2 * (np.dot(weights, features) - np.sum(weights) * c)
 
 
 def gradient_r(x, unlabeled_features, labeled_features, labels, nu_U, nu_L):
     R, _, _ = get_values(x)
-
-    # Unlabeled sum
-    num_unlabeled_instances = unlabeled_features.shape[0]
-    sum_U = 0
-    for i in range(num_unlabeled_instances):
-        sum_U += partial_derivatives_r(unlabeled_features[i, :], x)
-
-    # Labeled sum
-    sum_L = 0
-    num_labeled_instances = labeled_features.shape[0]
-    if num_labeled_instances > 0:
-        for i in range(num_labeled_instances):
-            sum_L += partial_derivatives_r_star(
-                labeled_features[i, :], labels[i], x)
-
+    l_prime_U = l_prime(_margins_U(x, unlabeled_features))
+    l_prime_L = l_prime(_margins_L(x, labeled_features, labels))
+    sum_U = 2 * R * np.sum(l_prime_U)
+    sum_L = 2 * R * np.dot(labels, l_prime_L)
     return 2 * R + nu_U * sum_U + nu_L * sum_L
 
 
 def gradient_gamma(x, labeled_features, labels, kappa, nu_L):
-    # Labeled sum
-    sum_L = 0
-    num_labeled_instances = labeled_features.shape[0]
-    if num_labeled_instances > 0:
-        for i in range(num_labeled_instances):
-            sum_L += partial_derivatives_gamma_star(
-                labeled_features[i, :], labels[i], x)
-
-    return -kappa + nu_L * sum_L
+    l_prime_L = l_prime(_margins_L(x, labeled_features, labels))
+    return -kappa - nu_L * np.sum(l_prime_L)
 
 
 def gradient_c(x, unlabeled_features, labeled_features, labels, nu_U, nu_L):
-    # Unlabeled sum
-    num_unlabeled_instances = unlabeled_features.shape[0]
-    sum_U = 0
-    for i in range(num_unlabeled_instances):
-        sum_U += partial_derivatives_c(unlabeled_features[i, :], x)
-
-    # Labeled sum
-    sum_L = 0
-    num_labeled_instances = labeled_features.shape[0]
-    if num_labeled_instances > 0:
-        for i in range(num_labeled_instances):
-            sum_L += partial_derivatives_c_star(
-                labeled_features[i, :], labels[i], x)
-
-    res = nu_U * sum_U + nu_L * sum_L
+    _, _, c = get_values(x)
+    l_prime_U = l_prime(_margins_U(x, unlabeled_features))
+    l_prime_L = l_prime(_margins_L(x, labeled_features, labels))
+    res = np.zeros(c.shape)
+    if unlabeled_features.shape[0] > 0:
+        res += nu_U * _sum_c(unlabeled_features, l_prime_U, c)
+    if labeled_features.shape[0] > 0:
+        res += nu_L * _sum_c(labeled_features, labels * l_prime_L, c)
     return res
 
 
+# The margins are computed once for the three components of the gradient.
 def gradient(x, unlabeled_features, labeled_features, labels, kappa, nu_U,
              nu_L):
-    g_r = gradient_r(x, unlabeled_features,
-                     labeled_features, labels, nu_U, nu_L)
-    g_gamma = gradient_gamma(x, labeled_features, labels, kappa, nu_L)
-    return np.concatenate((np.array([g_r, g_gamma]),
-                          gradient_c(x, unlabeled_features, labeled_features,
-                                     labels, nu_U, nu_L)))
+    R, _, c = get_values(x)
+    l_prime_U = l_prime(_margins_U(x, unlabeled_features))
+    l_prime_L = l_prime(_margins_L(x, labeled_features, labels))
+    g_r = 2 * R + 2 * R * (nu_U * np.sum(l_prime_U) +
+                           nu_L * np.dot(labels, l_prime_L))
+    g_gamma = -kappa - nu_L * np.sum(l_prime_L)
+    g_c = np.zeros(c.shape)
+    if unlabeled_features.shape[0] > 0:
+        g_c += nu_U * _sum_c(unlabeled_features, l_prime_U, c)
+    if labeled_features.shape[0] > 0:
+        g_c += nu_L * _sum_c(labeled_features, labels * l_prime_L, c)
+    return np.concatenate((np.array([g_r, g_gamma]), g_c))
 
 
 # the features have been scaled before
@@ -247,35 +213,30 @@ def gen_x_init(unlabeled_features, labeled_features, labels):
 
 def benign_instances_center_radius(unlabeled_features, labeled_features,
                                    labels):
-    benign_features = labeled_features[~np.array(labels)]
+    benign_features = labeled_features[~np.array(labels, dtype=bool)]
     if unlabeled_features.shape[0] > 0:
         benign_features = np.concatenate((benign_features, unlabeled_features))
     center = np.mean(benign_features, axis=0)
-    radius = np.mean(np.apply_along_axis(
-        distance_to_center, 1, benign_features, center))
+    radius = np.mean(distance_to_center(benign_features, center))
     return center, radius
 
 
 def _l(t):
     delta = 0.
     eps = 0.5
-    if t <= delta - eps:
-        return delta - t
-    elif delta - eps <= t and t <= delta + eps:
-        return pow(delta + eps - t, 2) / (4. * eps)
-    else:
-        return 0
+    return np.where(t <= delta - eps, delta - t,
+                    np.where(t <= delta + eps,
+                             np.square(delta + eps - t) / (4. * eps),
+                             0.))
 
 
 def l_prime(t):
     delta = 0.
     eps = 0.5
-    if t <= delta - eps:
-        return -1.
-    elif delta - eps <= t and t <= delta + eps:
-        return -0.5 * ((delta - t) / eps + 1.)
-    else:
-        return 0
+    return np.where(t <= delta - eps, -1.,
+                    np.where(t <= delta + eps,
+                             -0.5 * ((delta - t) / eps + 1.),
+                             0.))
 
 
 def get_values(x):
@@ -64,6 +64,7 @@ class AlertsConf(Conf):
                  default=4,
                  help='Number of clusters built from the alerts. '
                       'Default: 4.')
+        cluster_conf.ClusteringConf.gen_silhouette_parser(alerts_group)
 
     @staticmethod
     def from_args(args, logger):
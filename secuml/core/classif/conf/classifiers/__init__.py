@@ -25,6 +25,8 @@ from secuml.core.conf import exportFieldMethod
 
 classifier_conf_factory = None
 
+DEFAULT_WARM_START_MAX_TREES = 1000
+
 
 def get_factory():
     global classifier_conf_factory
@@ -152,6 +154,34 @@ class SupervisedClassifierConf(ClassifierConf):
         HyperparamConf.gen_parser(parser, model_class, True)
 
 
+# Ensembles of trees that can be warm-started by active learning (see
+# Classifier._warm_start). warm_start_max_trees bounds the number of trees
+# kept across the iterations.
+class TreesEnsembleConf(SupervisedClassifierConf):
+
+    def __init__(self, multiclass, hyperparam_conf, logger,
+                 warm_start_max_trees=DEFAULT_WARM_START_MAX_TREES):
+        SupervisedClassifierConf.__init__(self, multiclass, hyperparam_conf,
+                                          logger)
+        self.warm_start_max_trees = warm_start_max_trees
+
+    def fields_to_export(self):
+        fields = SupervisedClassifierConf.fields_to_export(self)
+        fields.append(('warm_start_max_trees', exportFieldMethod.primitive))
+        return fields
+
+    # --warm-start-max-trees is defined by the active learning parser only.
+    @staticmethod
+    def max_trees_from_args(args):
+        return getattr(args, 'warm_start_max_trees',
+                       DEFAULT_WARM_START_MAX_TREES)
+
+    # Configurations created before warm_start_max_trees have no such field.
+    @staticmethod
+    def max_trees_from_json(obj):
+        return obj.get('warm_start_max_trees', DEFAULT_WARM_START_MAX_TREES)
+
+
 class UnsupervisedClassifierConf(ClassifierConf):
 
     def __init__(self, hyperparam_conf, logger):
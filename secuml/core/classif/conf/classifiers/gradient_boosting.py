@@ -15,17 +15,19 @@
 # with SecuML. If not, see <http://www.gnu.org/licenses/>.
 
 from secuml.core.classif.classifiers.gradient_boosting import GradientBoosting
-from . import SupervisedClassifierConf
+from . import TreesEnsembleConf
 
 
-class GradientBoostingConf(SupervisedClassifierConf):
+class GradientBoostingConf(TreesEnsembleConf):
 
     def _get_model_class(self):
         return GradientBoosting
 
     @staticmethod
     def from_json(multiclass, hyperparam_conf, obj, logger):
-        return GradientBoostingConf(multiclass, hyperparam_conf, logger)
+        max_trees = TreesEnsembleConf.max_trees_from_json(obj)
+        return GradientBoostingConf(multiclass, hyperparam_conf, logger,
+                                    warm_start_max_trees=max_trees)
 
     def is_probabilist(self):
         return True
@@ -80,8 +82,10 @@ class GradientBoostingConf(SupervisedClassifierConf):
 
     @staticmethod
     def gen_parser(parser):
-        SupervisedClassifierConf.gen_parser(parser, GradientBoostingConf)
+        TreesEnsembleConf.gen_parser(parser, GradientBoostingConf)
 
     @staticmethod
     def from_args(args, hyperparam_conf, logger):
-        return GradientBoostingConf(args.multiclass, hyperparam_conf, logger)
+        max_trees = TreesEnsembleConf.max_trees_from_args(args)
+        return GradientBoostingConf(args.multiclass, hyperparam_conf, logger,
+                                    warm_start_max_trees=max_trees)
@@ -16,17 +16,19 @@
 
 from secuml.core.classif.classifiers.random_forest import RandomForest
 
-from . import SupervisedClassifierConf
+from . import TreesEnsembleConf
 
 
-class RandomForestConf(SupervisedClassifierConf):
+class RandomForestConf(TreesEnsembleConf):
 
     def _get_model_class(self):
         return RandomForest
 
     @staticmethod
     def from_json(multiclass, hyperparam_conf, obj, logger):
-        return RandomForestConf(multiclass, hyperparam_conf, logger)
+        max_trees = TreesEnsembleConf.max_trees_from_json(obj)
+        return RandomForestConf(multiclass, hyperparam_conf, logger,
+                                warm_start_max_trees=max_trees)
 
     def is_probabilist(self):
         return True
@@ -73,8 +75,10 @@ class RandomForestConf(SupervisedClassifierConf):
 
     @staticmethod
     def gen_parser(parser):
-        SupervisedClassifierConf.gen_parser(parser, RandomForestConf)
+        TreesEnsembleConf.gen_parser(parser, RandomForestConf)
 
     @staticmethod
     def from_args(args, hyperparam_conf, logger):
-        return RandomForestConf(args.multiclass, hyperparam_conf, logger)
+        max_trees = TreesEnsembleConf.max_trees_from_args(args)
+        return RandomForestConf(args.multiclass, hyperparam_conf, logger,
+                                warm_start_max_trees=max_trees)
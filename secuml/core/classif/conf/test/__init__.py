@@ -58,6 +58,13 @@ class TestConf(Conf):
                                  'TemporalSplit, CutoffTime, TemporalCv, and '
                                  'SlidingWindow require timestamped '
                                  'instances.')
+        validation_group.add_argument(
+                            '--folds-n-jobs',
+                            type=int,
+                            default=1,
+                            help='Number of folds trained and tested in '
+                                 'parallel with Cv, TemporalCv, and '
+                                 'SlidingWindow. Default: 1.')
         for method in methods:
             method_group = parser.add_argument_group(method + ' arguments')
             get_factory().gen_parser(method, method_group)
@@ -90,13 +97,24 @@ class OneFoldTestConf(TestConf):
 
 class SeveralFoldsTestConf(TestConf):
 
-    def __init__(self, logger, alerts_conf, num_folds):
+    def __init__(self, logger, alerts_conf, num_folds, n_jobs=1):
         TestConf.__init__(self, logger, alerts_conf)
         self.num_folds = num_folds
+        self.n_jobs = n_jobs
+
+    @staticmethod
+    def n_jobs_from_json(obj):
+        # Configurations exported before n_jobs was introduced.
+        return obj.get('n_jobs', 1)
+
+    @staticmethod
+    def n_jobs_from_args(args):
+        return args.folds_n_jobs
 
     def fields_to_export(self):
         fields = TestConf.fields_to_export(self)
-        fields.extend([('num_folds', exportFieldMethod.primitive)])
+        fields.extend([('num_folds', exportFieldMethod.primitive),
+                       ('n_jobs', exportFieldMethod.primitive)])
         return fields
 
     def gen_datasets(self, classifier_conf, instances, cv=None):
@@ -22,8 +22,9 @@ from . import SeveralFoldsTestConf
 
 class CvConf(SeveralFoldsTestConf):
 
-    def __init__(self, logger, alerts_conf, num_folds):
-        SeveralFoldsTestConf.__init__(self, logger, alerts_conf, num_folds)
+    def __init__(self, logger, alerts_conf, num_folds, n_jobs=1):
+        SeveralFoldsTestConf.__init__(self, logger, alerts_conf, num_folds,
+                                      n_jobs=n_jobs)
         self.method = 'cv'
 
     def get_exp_name(self):
@@ -42,12 +43,14 @@ class CvConf(SeveralFoldsTestConf):
     @staticmethod
     def from_args(args, logger):
         alerts_conf = SeveralFoldsTestConf.alert_conf_from_args(args, logger)
-        return CvConf(logger, alerts_conf, args.num_folds_val)
+        return CvConf(logger, alerts_conf, args.num_folds_val,
+                      n_jobs=SeveralFoldsTestConf.n_jobs_from_args(args))
 
     @staticmethod
     def from_json(obj, logger):
         alerts_conf = SeveralFoldsTestConf.alert_conf_from_json(obj, logger)
-        return CvConf(logger, alerts_conf, obj['num_folds'])
+        return CvConf(logger, alerts_conf, obj['num_folds'],
+                      n_jobs=SeveralFoldsTestConf.n_jobs_from_json(obj))
 
     def _gen_cv_split(self, classifier_conf, instances):
         annotations = instances.get_annotations(False)
@@ -62,7 +65,7 @@ class CvConf(SeveralFoldsTestConf):
         # cv_split with instance_ids instead of indexes
         cv_split = [None for _ in range(self.num_folds)]
         for i, (train_indexes, test_indexes) in enumerate(split):
-            train_ids = [instances.ids.ids[t] for t in train_indexes]
-            test_ids = [instances.ids.ids[t] for t in test_indexes]
+            train_ids = instances.ids.get_ids_from_indexes(train_indexes)
+            test_ids = instances.ids.get_ids_from_indexes(test_indexes)
             cv_split[i] = (train_ids, test_ids)
         return cv_split
@@ -37,10 +37,11 @@ def _gen_sliding_windows(t_start, num_train_buckets, num_test_buckets, delta):
 class SlidingWindowConf(SeveralFoldsTestConf):
 
     def __init__(self, logger, alerts_conf, num_buckets, num_train_buckets,
-                 num_test_buckets):
+                 num_test_buckets, n_jobs=1):
         num_folds = _compute_num_folds(num_buckets, num_train_buckets,
                                        num_test_buckets)
-        SeveralFoldsTestConf.__init__(self, logger, alerts_conf, num_folds)
+        SeveralFoldsTestConf.__init__(self, logger, alerts_conf, num_folds,
+                                      n_jobs=n_jobs)
         self.method = 'sliding_window'
         self.num_buckets = num_buckets
         self.num_train_buckets = num_train_buckets
@@ -83,8 +84,10 @@ class SlidingWindowConf(SeveralFoldsTestConf):
     @staticmethod
     def from_args(args, logger):
         alerts_conf = SeveralFoldsTestConf.alert_conf_from_args(args, logger)
-        return SlidingWindowConf(logger, alerts_conf, args.num_buckets,
-                                 args.num_train_buckets, args.num_test_buckets)
+        return SlidingWindowConf(
+                        logger, alerts_conf, args.num_buckets,
+                        args.num_train_buckets, args.num_test_buckets,
+                        n_jobs=SeveralFoldsTestConf.n_jobs_from_args(args))
 
     @staticmethod
     def from_json(obj, logger):
@@ -93,7 +96,9 @@ class SlidingWindowConf(SeveralFoldsTestConf):
                                  alerts_conf,
                                  obj['num_buckets'],
                                  obj['num_train_buckets'],
-                                 obj['num_test_buckets'])
+                                 obj['num_test_buckets'],
+                                 n_jobs=SeveralFoldsTestConf.n_jobs_from_json(
+                                                                        obj))
 
     def _gen_cv_split(self, classifier_conf, instances):
         t_indexes, t_start, t_end = instances.get_sorted_timestamps()
@@ -19,8 +19,9 @@ from . import SeveralFoldsTestConf
 
 class TemporalCvConf(SeveralFoldsTestConf):
 
-    def __init__(self, logger, alerts_conf, num_folds):
-        SeveralFoldsTestConf.__init__(self, logger, alerts_conf, num_folds)
+    def __init__(self, logger, alerts_conf, num_folds, n_jobs=1):
+        SeveralFoldsTestConf.__init__(self, logger, alerts_conf, num_folds,
+                                      n_jobs=n_jobs)
         self.method = 'temporal_cv'
 
     def get_exp_name(self):
@@ -31,7 +32,9 @@ class TemporalCvConf(SeveralFoldsTestConf):
     @staticmethod
     def from_json(obj, logger):
         alerts_conf = SeveralFoldsTestConf.alert_conf_from_json(obj, logger)
-        return TemporalCvConf(logger, alerts_conf, obj['num_folds'])
+        n_jobs = SeveralFoldsTestConf.n_jobs_from_json(obj)
+        return TemporalCvConf(logger, alerts_conf, obj['num_folds'],
+                              n_jobs=n_jobs)
 
     @staticmethod
     def gen_parser(parser):
@@ -44,7 +47,9 @@ class TemporalCvConf(SeveralFoldsTestConf):
     @staticmethod
     def from_args(args, logger):
         alerts_conf = SeveralFoldsTestConf.alert_conf_from_args(args, logger)
-        return TemporalCvConf(logger, alerts_conf, args.num_folds_val_temp)
+        n_jobs = SeveralFoldsTestConf.n_jobs_from_args(args)
+        return TemporalCvConf(logger, alerts_conf, args.num_folds_val_temp,
+                              n_jobs=n_jobs)
 
     def _gen_cv_split(self, classifier_conf, instances):
         t_indexes, t_start, t_end = instances.get_sorted_timestamps()
@@ -51,7 +51,7 @@ class BinaryIndicators(object):
         if self.auc:
             self.add_auc(fold_id, predictions)
         if self.probabilist:
-            self.add_proba_fold(fold_id, predictions, threshold=None)
+            self.add_proba_fold(fold_id, predictions)
         else:
             self.add_non_proba_fold(fold_id, predictions)
 
@@ -107,23 +107,38 @@ class BinaryIndicators(object):
             false_positive_rate = fp / (fp + tn)
         return false_positive_rate
 
-    def add_proba_fold(self, fold_id, predictions, threshold=None):
-        if threshold is None:
-            for threshold in self.thresholds:
-                self.add_proba_fold(
-                    fold_id, predictions, threshold=threshold)
-        else:
-            probas = predictions.probas
-            predicted_labels = np.array(probas) > threshold / 100
-            precision, recall, f_score = self.compute_precision_recall_fscore(
-                                                    predictions.ground_truth,
-                                                    predicted_labels)
-            false_positive_rate = self.compute_fpr(
-                predictions.ground_truth, predicted_labels)
-            self.fold_perf[threshold][fold_id, :] = [precision, recall,
-                                                     1-precision,
-                                                     false_positive_rate,
-                                                     f_score]
+    # The indicators are computed for all the thresholds at once from the
+    # numbers of positive and negative instances above each threshold.
+    # The special cases of compute_precision_recall_fscore and compute_fpr
+    # are handled in the same way.
+    def add_proba_fold(self, fold_id, predictions):
+        ground_truth = np.asarray(predictions.ground_truth, dtype=bool)
+        probas = np.asarray(predictions.probas)
+        thresholds = np.array([t / 100 for t in self.thresholds])
+        positives = np.sort(probas[ground_truth])
+        negatives = np.sort(probas[~ground_truth])
+        num_pos = len(positives)
+        num_neg = len(negatives)
+        # predicted_labels = probas > threshold
+        tp = num_pos - np.searchsorted(positives, thresholds, side='right')
+        fp = num_neg - np.searchsorted(negatives, thresholds, side='right')
+        pred_pos = tp + fp
+        pred_neg = num_pos + num_neg - pred_pos
+        with np.errstate(divide='ignore', invalid='ignore'):
+            precision = np.where(pred_pos > 0, tp / pred_pos, 0)
+            f_score = np.where(tp > 0, 2 * tp / (pred_pos + num_pos), 0)
+            recall = np.where(num_pos > 0, tp / num_pos, 0)
+            false_positive_rate = np.where(num_neg > 0, fp / num_neg, 0)
+        # Some ground-truth labels are never predicted.
+        missing = ((num_pos > 0) & (pred_pos == 0)) | \
+            ((num_neg > 0) & (pred_neg == 0))
+        precision[missing] = 0
+        f_score[missing] = 0
+        for t, threshold in enumerate(self.thresholds):
+            self.fold_perf[threshold][fold_id, :] = [precision[t], recall[t],
+                                                     1 - precision[t],
+                                                     false_positive_rate[t],
+                                                     f_score[t]]
 
     def add_non_proba_fold(self, fold_id, predictions):
         precision, recall, f_score = self.compute_precision_recall_fscore(
@@ -14,7 +14,11 @@
 # You should have received a copy of the GNU General Public License along
 # with SecuML. If not, see <http://www.gnu.org/licenses/>.
 
+from collections import OrderedDict
+import json
+import numpy as np
 import os.path as path
+import pandas as pd
 
 from secuml.core.data.labels_tools import label_bool_to_str
 from secuml.core.data.predictions import InconsistentPredictions
@@ -23,10 +27,12 @@ from secuml.core.tools.plots.dataset import PlotDataset
 from secuml.core.tools.color import get_error_color
 
 
+# For each predicted value, only the number of predictions, and the number of
+# right predictions are stored.
 class PredictionBarplot(object):
 
     def __init__(self, has_ground_truth):
-        self.predictions = {}
+        self.counts = OrderedDict()
         self.multiclass = None
         self.has_ground_truth = has_ground_truth
 
@@ -35,40 +41,63 @@ class PredictionBarplot(object):
             self.multiclass = predictions.info.multiclass
         elif self.multiclass != predictions.info.multiclass:
             raise InconsistentPredictions()
-        for instance_id, prediction, label in zip(predictions.ids.ids,
-                                                  predictions.values,
-                                                  predictions.ground_truth):
-            if prediction not in self.predictions:
-                self.predictions[prediction] = []
-            self.predictions[prediction].append({'instance_id': instance_id,
-                                                 'ground_truth_label': label})
+        values = np.empty(len(predictions.values), dtype=object)
+        values[:] = predictions.values
+        ground_truth = np.empty(len(predictions.ground_truth), dtype=object)
+        ground_truth[:] = predictions.ground_truth
+        # pd.factorize keeps the order of appearance of the values.
+        codes, uniques = pd.factorize(values)
+        num_values = len(uniques)
+        all_counts = np.bincount(codes, minlength=num_values)
+        right_counts = np.bincount(codes[values == ground_truth],
+                                   minlength=num_values)
+        for value, num_all, num_right in zip(uniques, all_counts,
+                                             right_counts):
+            if value not in self.counts:
+                self.counts[value] = {'all': 0, 'right': 0}
+            self.counts[value]['all'] += int(num_all)
+            self.counts[value]['right'] += int(num_right)
+
+    def _get_counts(self, value, kind):
+        counts = self.counts[value]
+        if kind == 'wrong':
+            return counts['all'] - counts['right']
+        return counts[kind]
 
     # error: None  -> display all instances
     #        True  -> display wrong predictions
     #        False -> display right predictions
     def _display(self, barplot, labels, error=None):
         if error is not None:
-            values = [len([p for p in self.predictions[l]
-                           if (p['ground_truth_label'] == l) == error])
-                      for l in labels]
-            label = 'wrong predictions' if error else 'right predictions'
+            kind = 'wrong' if error else 'right'
+            label = '%s predictions' % kind
         else:
-            values = [len(self.predictions[l]) for l in labels]
+            kind = 'all'
             label = 'all'
+        values = [self._get_counts(l, kind) for l in labels]
         dataset = PlotDataset(values, label)
         dataset.set_color(get_error_color(error))
         barplot.add_dataset(dataset)
 
-    def display(self, directory):
-        labels = list(self.predictions.keys())
+    def _get_xlabels(self, labels):
         if self.multiclass:
-            xlabels = labels
-        else:
-            xlabels = [label_bool_to_str(l) for l in labels]
-        barplot = BarPlot(xlabels)
+            return labels
+        return [label_bool_to_str(l) for l in labels]
+
+    def display(self, directory):
+        labels = list(self.counts.keys())
+        barplot = BarPlot(self._get_xlabels(labels))
         if not self.has_ground_truth:
             self._display(barplot, labels)
         else:
             self._display(barplot, labels, error=False)
             self._display(barplot, labels, error=True)
         barplot.export_to_json(path.join(directory, 'pred_barplot.json'))
+        self.export_summary(directory, labels)
+
+    def export_summary(self, directory, labels):
+        counts = {kind: [self._get_counts(l, kind) for l in labels]
+                  for kind in ['all', 'right', 'wrong']}
+        summary = {'values': self._get_xlabels(labels), 'counts': counts}
+        with open(path.join(directory, 'pred_summary.json'), 'w') as f:
+            json.dump(summary, f, indent=2)
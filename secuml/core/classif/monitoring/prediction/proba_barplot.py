@@ -14,6 +14,8 @@
 # You should have received a copy of the GNU General Public License along
 # with SecuML. If not, see <http://www.gnu.org/licenses/>.
 
+import json
+import numpy as np
 import os.path as path
 
 from secuml.core.data.labels_tools import BENIGN, MALICIOUS
@@ -23,33 +25,36 @@ from secuml.core.tools.plots.dataset import PlotDataset
 from secuml.core.tools.color import get_label_color
 
 
+NUM_BINS = 10
+
+
+# Only the number of predictions in each bin is stored.
+# The instances of a given bin are queried from the DB when they are
+# displayed.
 class ProbaBarplot(object):
 
     def __init__(self, has_ground_truth):
-        self.ranges = [[] for i in range(10)]
         self.labels = ['0-10%', '10-20%', '20-30%', '30-40%', '40-50%',
                        '50-60%', '60-70%', '70-80%', '80-90%', '90-100%']
         self.has_ground_truth = has_ground_truth
+        self.counts = {label: np.zeros(NUM_BINS, dtype=int)
+                       for label in ['all', MALICIOUS, BENIGN]}
 
     def add_fold(self, predictions):
-        for instance_id, proba, label in zip(predictions.ids.ids,
-                                             predictions.probas,
-                                             predictions.ground_truth):
-            # Prb if proba == 1
-            if proba == 1:
-                proba = 0.999999
-            self.ranges[int(proba * 10)].append({'instance_id': instance_id,
-                                                 'ground_truth_label': label})
+        probas = np.asarray(predictions.probas, dtype=float)
+        # proba == 1 belongs to the last bin
+        bins = np.minimum((probas * NUM_BINS).astype(int), NUM_BINS - 1)
+        ground_truth = np.asarray(predictions.ground_truth, dtype=object)
+        for label in self.counts:
+            if label == 'all':
+                label_bins = bins
+            else:
+                label_bins = bins[ground_truth == label_str_to_bool(label)]
+            self.counts[label] += np.bincount(label_bins, minlength=NUM_BINS)
 
     # label: 'all', MALICIOUS or BENIGN
     def display_label(self, barplot, label):
-        if label != 'all':
-            label_bool = label_str_to_bool(label)
-            ranges = [[x for x in l if x['ground_truth_label'] == label_bool]
-                      for l in self.ranges]
-        else:
-            ranges = self.ranges
-        dataset = PlotDataset(list(map(len, ranges)), label)
+        dataset = PlotDataset(self.counts[label], label)
         dataset.set_color(get_label_color(label))
         barplot.add_dataset(dataset)
 
@@ -61,3 +66,11 @@ class ProbaBarplot(object):
             self.display_label(barplot, MALICIOUS)
             self.display_label(barplot, BENIGN)
         barplot.export_to_json(path.join(directory, 'pred_barplot.json'))
+        self.export_summary(directory)
+
+    def export_summary(self, directory):
+        summary = {'bins': self.labels,
+                   'counts': {label: counts.tolist()
+                              for label, counts in self.counts.items()}}
+        with open(path.join(directory, 'pred_summary.json'), 'w') as f:
+            json.dump(summary, f, indent=2)
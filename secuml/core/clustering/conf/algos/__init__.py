@@ -22,10 +22,12 @@ from secuml.core.projection.conf import algos as projection_conf
 
 class ClusteringConf(Conf):
 
-    def __init__(self, logger, num_clusters, projection_conf=None):
+    def __init__(self, logger, num_clusters, projection_conf=None,
+                 silhouette_sample_size=None):
         Conf.__init__(self, logger)
         self.num_clusters = num_clusters
         self.projection_conf = projection_conf
+        self.silhouette_sample_size = silhouette_sample_size
         self.algo = None
 
     def set_num_clusters(self, num_clusters):
@@ -40,6 +42,7 @@ class ClusteringConf(Conf):
     def fields_to_export(self):
         return [('num_clusters', exportFieldMethod.primitive),
                 ('projection_conf', exportFieldMethod.obj),
+                ('silhouette_sample_size', exportFieldMethod.primitive),
                 ('algo', exportFieldMethod.obj_class)]
 
     @staticmethod
@@ -48,6 +51,7 @@ class ClusteringConf(Conf):
         parser.add_argument('--num-clusters',
                             type=int,
                             default=4)
+        ClusteringConf.gen_silhouette_parser(parser)
         # Projection parameters
         projection_group = parser.add_argument_group('Projection parameters')
         projection_group.add_argument(
@@ -67,6 +71,24 @@ class ClusteringConf(Conf):
                                       type=int,
                                       default=None)
 
+    @staticmethod
+    def gen_silhouette_parser(parser):
+        parser.add_argument(
+                '--silhouette-sample-size',
+                type=int,
+                default=None,
+                help='Number of instances used to estimate the silhouette. '
+                     'The instances are sampled in each cluster according '
+                     'to its size. '
+                     'By default, the silhouette is computed on all the '
+                     'instances.')
+
+    @staticmethod
+    def silhouette_sample_size_from_args(args):
+        if not hasattr(args, 'silhouette_sample_size'):
+            return None
+        return args.silhouette_sample_size
+
     @staticmethod
     def proj_conf_from_args(args, logger):
         if (not hasattr(args, 'projection_algo')
@@ -78,8 +100,9 @@ class ClusteringConf(Conf):
 
     @staticmethod
     def from_json(obj, proj_conf, logger):
-        return ClusteringConf(logger, obj['num_clusters'],
-                              projection_conf=proj_conf)
+        return ClusteringConf(
+                    logger, obj['num_clusters'], projection_conf=proj_conf,
+                    silhouette_sample_size=obj.get('silhouette_sample_size'))
 
 
 clustering_conf_factory = None
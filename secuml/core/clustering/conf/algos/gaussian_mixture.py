@@ -20,9 +20,11 @@ from . import ClusteringConf
 
 class GaussianMixtureConf(ClusteringConf):
 
-    def __init__(self, logger, num_clusters, projection_conf=None):
+    def __init__(self, logger, num_clusters, projection_conf=None,
+                 silhouette_sample_size=None):
         ClusteringConf.__init__(self, logger, num_clusters,
-                                projection_conf=projection_conf)
+                                projection_conf=projection_conf,
+                                silhouette_sample_size=silhouette_sample_size)
         self.algo = GaussianMixture
         self.covariance_type = 'diag'
         self.init_params = 'kmeans'
@@ -30,8 +32,12 @@ class GaussianMixtureConf(ClusteringConf):
 
     @staticmethod
     def from_args(args, proj_conf, logger):
-        return GaussianMixtureConf(logger, args.num_clusters, proj_conf)
+        sample_size = ClusteringConf.silhouette_sample_size_from_args(args)
+        return GaussianMixtureConf(logger, args.num_clusters, proj_conf,
+                                   silhouette_sample_size=sample_size)
 
     @staticmethod
     def from_json(obj, proj_conf, logger):
-        return GaussianMixtureConf(logger, obj['num_clusters'], proj_conf)
+        return GaussianMixtureConf(
+                logger, obj['num_clusters'], proj_conf,
+                silhouette_sample_size=obj.get('silhouette_sample_size'))
@@ -25,7 +25,10 @@ class ClusteringEvaluation(object):
         self.instances = instances
         self.assigned_clusters = assigned_clusters
         self.distortion = Distortion(clustering_algo)
-        self.silhouette = Silhouette(instances)
+        sample_size = None
+        if clustering_algo is not None:
+            sample_size = clustering_algo.conf.silhouette_sample_size
+        self.silhouette = Silhouette(instances, sample_size=sample_size)
         self.performance = PerformanceIndicators()
 
     def gen_eval(self, output_dir, quick=False):
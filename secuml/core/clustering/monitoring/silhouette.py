@@ -17,32 +17,75 @@
 import matplotlib.pyplot as plt
 import numpy as np
 import os.path as path
+from sklearn.metrics import pairwise_distances
 from sklearn.metrics import silhouette_samples
 
 from secuml.core.tools.color import colors
 
+# Maximum number of distances computed at once.
+MAX_BLOCK_DISTANCES = 10 ** 7
+
 
 class Silhouette(object):
 
-    def __init__(self, instances):
+    # sample_size: when set, the silhouette is estimated from a stratified
+    # sample of the instances (sample_size instances split among the clusters
+    # according to their size, with at least one instance per cluster).
+    def __init__(self, instances, sample_size=None):
         self.instances = instances
+        self.sample_size = sample_size
         self.distances = None
+        self.num_sampled = None
 
     def gen_eval(self, output_dir, assigned_clusters, quick=False):
         if quick:
             self.silhouette_avg = 0
             return
+        assigned_clusters = np.asarray(assigned_clusters)
         if self.distances is not None:
             self.silhouette_values = silhouette_samples(self.distances,
                                                         assigned_clusters,
                                                         metric='precomputed')
+            self.silhouette_avg = np.mean(self.silhouette_values)
         else:
             features = self.instances.features.get_values()
-            self.silhouette_values = silhouette_samples(features,
+            if self.sample_size is None:
+                self.silhouette_values = silhouette_by_blocks(
+                                                        features,
+                                                        assigned_clusters)
+                self.silhouette_avg = np.mean(self.silhouette_values)
+            else:
+                assigned_clusters = self._sampled_silhouette(
+                                                        features,
                                                         assigned_clusters)
-        self.silhouette_avg = np.mean(self.silhouette_values)
         self.dispaly_silhouette(output_dir, assigned_clusters)
 
+    # Returns the clusters of the sampled instances.
+    def _sampled_silhouette(self, features, assigned_clusters):
+        num_instances = len(assigned_clusters)
+        clusters, counts = np.unique(assigned_clusters, return_counts=True)
+        selection = []
+        for cluster, count in zip(clusters, counts):
+            cluster_indexes = np.where(assigned_clusters == cluster)[0]
+            num_sampled = max(1, int(round(self.sample_size * count /
+                                           num_instances)))
+            if num_sampled < count:
+                cluster_indexes = np.random.choice(cluster_indexes,
+                                                   num_sampled, replace=False)
+            selection.append(np.sort(cluster_indexes))
+        selection = np.concatenate(selection)
+        self.num_sampled = len(selection)
+        sampled_clusters = assigned_clusters[selection]
+        self.silhouette_values = silhouette_by_blocks(features[selection],
+                                                      sampled_clusters)
+        # The mean silhouette of each cluster is weighted by the size of the
+        # cluster, since the smallest clusters may be oversampled.
+        cluster_means = [np.mean(self.silhouette_values[
+                                        sampled_clusters == cluster])
+                         for cluster in clusters]
+        self.silhouette_avg = np.average(cluster_means, weights=counts)
+        return sampled_clusters
+
     # Code from a scikit-learn example:
     # Selecting the number of clusters with silhouette analysis on KMeans
     # clustering
@@ -81,4 +124,39 @@ class Silhouette(object):
     def to_json(self):
         obj = {}
         obj['silhouette_avg'] = self.silhouette_avg
+        obj['num_sampled_instances'] = self.num_sampled
         return obj
+
+
+# Same values as sklearn.metrics.silhouette_samples. The distances are computed
+# by blocks of rows and only their sums to each cluster are kept.
+def silhouette_by_blocks(features, assigned_clusters):
+    num_instances = features.shape[0]
+    _, labels = np.unique(assigned_clusters, return_inverse=True)
+    num_clusters = labels.max() + 1
+    one_hot = np.zeros((num_instances, num_clusters))
+    one_hot[np.arange(num_instances), labels] = 1
+    counts = one_hot.sum(axis=0)
+    values = np.zeros(num_instances)
+    block_size = max(1, MAX_BLOCK_DISTANCES // num_instances)
+    for start in range(0, num_instances, block_size):
+        end = min(start + block_size, num_instances)
+        rows = np.arange(end - start)
+        block_labels = labels[start:end]
+        cluster_sums = np.dot(pairwise_distances(features[start:end],
+                                                 features),
+                              one_hot)
+        # Mean distance to the other instances of the same cluster
+        own_counts = counts[block_labels] - 1
+        with np.errstate(divide='ignore', invalid='ignore'):
+            a = cluster_sums[rows, block_labels] / own_counts
+        # Mean distance to the instances of the nearest other cluster
+        cluster_means = cluster_sums / counts
+        cluster_means[rows, block_labels] = np.inf
+        b = cluster_means.min(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            block_values = (b - a) / np.maximum(a, b)
+        # The silhouette of the instances alone in their cluster is 0.
+        block_values[own_counts == 0] = 0
+        values[start:end] = np.nan_to_num(block_values)
+    return values
@@ -14,6 +14,9 @@
 # You should have received a copy of the GNU General Public License along
 # with SecuML. If not, see <http://www.gnu.org/licenses/>.
 
+import numpy as np
+import pandas as pd
+
 from secuml.core.data import labels_tools
 from secuml.core.data.labels_tools import BENIGN, MALICIOUS
 from secuml.core.tools.core_exceptions import SecuMLcoreException
@@ -28,6 +31,11 @@ class InvalidAnnotations(SecuMLcoreException):
         return self.message
 
 
+# Labels codes: -1 for unlabeled instances, 0 for benign, 1 for malicious.
+# The families are stored as categorical codes (-1 for no family).
+UNLABELED = -1
+
+
 class Annotations(object):
 
     def __init__(self, labels, families, ids):
@@ -37,42 +45,58 @@ class Annotations(object):
 
     def check_validity(self):
         num_instances = self.ids.num_instances()
-        if len(self.labels) != num_instances:
+        if len(self._labels) != num_instances:
             raise InvalidAnnotations('There are %d instances '
                                      'but %d labels are provided.'
                                      % (num_instances,
-                                        len(self.labels)))
-        elif len(self.families) != num_instances:
+                                        len(self._labels)))
+        elif len(self._families) != num_instances:
             raise InvalidAnnotations('There are %d instances '
                                      'but %d families are provided.'
                                      % (num_instances,
-                                        len(self.families)))
+                                        len(self._families)))
 
     def _set_labels_families(self, labels, families):
+        num_instances = self.ids.num_instances()
         if labels is None:
-            labels = [None for _ in range(self.ids.num_instances())]
+            self._labels = np.full(num_instances, UNLABELED, dtype=np.int8)
+        else:
+            self.set_labels(labels)
+        self._families_values = []
+        self._families_codes = {}
         if families is None:
-            families = [None for _ in range(self.ids.num_instances())]
-        self.set_labels(labels)
-        self.set_families(families)
+            self._families = np.full(num_instances, -1, dtype=np.int32)
+        else:
+            self.set_families(families)
 
     # The union must be used on instances coming from the same dataset.
     # Otherwise, there may be some collisions on the ids.
     def union(self, annotations):
-        self.labels = self.labels + annotations.labels
-        self.families = self.families + annotations.families
+        codes = [self._get_family_code(f)
+                 for f in annotations._families_values]
+        codes = np.array(codes + [-1], dtype=np.int32)
+        self._labels = np.concatenate((self._labels, annotations._labels))
+        self._families = np.concatenate((self._families,
+                                         codes[annotations._families]))
         self.check_validity()
 
     def get_from_ids(self, ids):
-        return Annotations([self.get_label(i) for i in ids.ids],
-                           [self.get_family(i) for i in ids.ids],
-                           ids)
+        return self.get_from_indexes(self.ids.get_indexes(
+                                                    ids.get_ids_array()), ids)
+
+    def get_from_indexes(self, indexes, ids):
+        annotations = Annotations(None, None, ids)
+        annotations._labels = self._labels[indexes]
+        annotations._families = self._families[indexes]
+        annotations._families_values = list(self._families_values)
+        annotations._families_codes = dict(self._families_codes)
+        return annotations
 
     def num_instances(self, label='all'):
         if label == 'all':
             return self.ids.num_instances()
         else:
-            return len(self.get_annotated_ids(label=label))
+            return int(np.count_nonzero(self.get_annotated_mask(label)))
 
     def get_supervision(self, multiclass):
         if multiclass:
@@ -81,13 +105,13 @@ class Annotations(object):
             return self.get_labels()
 
     def get_labels(self):
-        return self.labels
+        return _LABELS_VALUES[self._labels + 1].tolist()
 
     def get_label(self, instance_id):
-        return self.labels[self.ids.get_index(instance_id)]
+        return _decode_label(self._labels[self.ids.get_index(instance_id)])
 
     def set_label(self, instance_id, label):
-        self.labels[self.ids.get_index(instance_id)] = label
+        self._labels[self.ids.get_index(instance_id)] = _encode_label(label)
 
     def set_labels(self, labels):
         num_instances = self.ids.num_instances()
@@ -95,25 +119,34 @@ class Annotations(object):
             raise InvalidAnnotations('There are %d instances '
                                      'but there %d labels are provided.'
                                      % (num_instances, len(labels)))
-        self.labels = labels
+        labels = np.asarray(labels, dtype=object)
+        annotated = ~np.equal(labels, None)
+        self._labels = np.full(num_instances, UNLABELED, dtype=np.int8)
+        self._labels[annotated] = labels[annotated].astype(bool)
 
     def get_families(self):
-        return self.families
+        values = np.empty(len(self._families_values) + 1, dtype=object)
+        values[:-1] = self._families_values
+        # The code -1 selects the last value: None.
+        return values[self._families].tolist()
 
     def get_family(self, instance_id):
-        return self.families[self.ids.get_index(instance_id)]
+        return self._decode_family(
+                            self._families[self.ids.get_index(instance_id)])
 
     def set_family(self, instance_id, family):
-        self.families[self.ids.get_index(instance_id)] = family
+        self._families[self.ids.get_index(instance_id)] = \
+                self._get_family_code(family)
 
     def set_label_family(self, instance_id, label, family):
         index = self.ids.get_index(instance_id)
-        self.labels[index] = label
-        self.families[index] = family
+        self._labels[index] = _encode_label(label)
+        self._families[index] = self._get_family_code(family)
 
     def get_label_family(self, instance_id):
         index = self.ids.get_index(instance_id)
-        return self.labels[index], self.families[index]
+        return (_decode_label(self._labels[index]),
+                self._decode_family(self._families[index]))
 
     def set_families(self, families):
         num_instances = self.ids.num_instances()
@@ -122,29 +155,38 @@ class Annotations(object):
                                      'but %d families are provided.'
                                      % (num_instances,
                                         len(families)))
-        self.families = families
+        values = np.empty(num_instances, dtype=object)
+        values[:] = families
+        codes, values = pd.factorize(values)
+        self._families_values = list(values)
+        self._families_codes = {f: c for c, f in
+                                enumerate(self._families_values)}
+        self._families = codes.astype(np.int32)
 
     def get_family_ids(self, family):
-        return [i for i in self.ids.get_ids() if self.get_family(i) == family]
+        if family is None:
+            mask = self._families == -1
+        elif family in self._families_codes:
+            mask = self._families == self._families_codes[family]
+        else:
+            return []
+        return self.ids.get_ids_from_indexes(mask)
 
     def get_families_values(self, label='all'):
         if label == 'all':
-            indexes = range(self.ids.num_instances())
+            codes = self._families
         else:
             label_b = labels_tools.label_str_to_bool(label)
-            indexes = [i for i in range(self.ids.num_instances())
-                       if self.labels[i] is not None
-                       and self.labels[i] == label_b]
-        families = set([self.families[i]
-                        for i in indexes if self.families[i] is not None])
-        return families
+            codes = self._families[self._labels == label_b]
+        return set(self._families_values[c] for c in np.unique(codes)
+                   if c != -1)
 
     def get_families_count(self, label='all'):
         families_values = self.get_families_values(label=label)
-        families_count = {}
-        for family in families_values:
-            families_count[family] = len(self.get_family_ids(family))
-        return families_count
+        counts = np.bincount(self._families[self._families != -1],
+                             minlength=len(self._families_values))
+        return {family: int(counts[self._families_codes[family]])
+                for family in families_values}
 
     def get_families_prop(self, label='all'):
         families_prop = self.get_families_count(label=label)
@@ -153,16 +195,48 @@ class Annotations(object):
         return families_prop
 
     def get_annotated_ids(self, label='all'):
-        annotated_ids = [i for i in self.ids.get_ids() if self.is_annotated(i)]
+        return self.ids.get_ids_from_indexes(self.get_annotated_mask(label))
+
+    def get_unlabeled_ids(self):
+        return self.ids.get_ids_from_indexes(self.get_unlabeled_mask())
+
+    def is_annotated(self, instance_id):
+        return bool(self._labels[self.ids.get_index(instance_id)] !=
+                    UNLABELED)
+
+    def get_unlabeled_mask(self):
+        return self._labels == UNLABELED
+
+    def get_annotated_mask(self, label='all'):
         if label == 'all':
-            return annotated_ids
+            return self._labels != UNLABELED
         elif label == MALICIOUS:
-            return [i for i in annotated_ids if self.get_label(i)]
+            return self._labels == 1
         elif label == BENIGN:
-            return [i for i in annotated_ids if not self.get_label(i)]
+            return self._labels == 0
 
-    def get_unlabeled_ids(self):
-        return [i for i in self.ids.get_ids() if not self.is_annotated(i)]
+    def _get_family_code(self, family):
+        if family is None:
+            return -1
+        if family not in self._families_codes:
+            self._families_codes[family] = len(self._families_values)
+            self._families_values.append(family)
+        return self._families_codes[family]
 
-    def is_annotated(self, instance_id):
-        return self.get_label(instance_id) is not None
+    def _decode_family(self, code):
+        if code == -1:
+            return None
+        return self._families_values[code]
+
+
+_LABELS_VALUES = np.array([None, False, True], dtype=object)
+
+
+def _encode_label(label):
+    if label is None:
+        return UNLABELED
+    return int(bool(label))
+
+
+def _decode_label(code):
+    return _LABELS_VALUES[code + 1]
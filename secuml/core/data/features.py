@@ -88,26 +88,48 @@ class FeaturesInfo(object):
 
 class Features(object):
 
-    def __init__(self, values, info, instance_ids):
-        self.values = np.array(values)
+    # When indexes is not None, the features are a view on the rows indexes
+    # of values. The selected rows are copied only when the whole matrix is
+    # requested or modified.
+    def __init__(self, values, info, instance_ids, indexes=None):
+        self._values = np.asarray(values)
+        self._indexes = indexes
         self.info = info
         self.instance_ids = instance_ids
         self._check_validity()
 
+    @property
+    def values(self):
+        if self._indexes is not None:
+            self._values = self._values[self._indexes]
+            self._indexes = None
+        return self._values
+
+    @values.setter
+    def values(self, values):
+        self._values = np.asarray(values)
+        self._indexes = None
+
     def _check_validity(self):
         num_instances = self.instance_ids.num_instances()
+        if self._indexes is not None:
+            num_rows = len(self._indexes)
+            size = num_rows * int(np.prod(self._values.shape[1:]))
+        else:
+            num_rows = self._values.shape[0]
+            size = self._values.size
         if num_instances != 0:
-            if self.values.shape[0] != num_instances:
+            if num_rows != num_instances:
                 raise InvalidFeatures('There are %d instances '
                                       'but the features of %d are provided.'
-                                      % (num_instances, self.values.shape[0]))
+                                      % (num_instances, num_rows))
             num_features = self.info.num_features()
-            if self.values.shape[1] != num_features:
+            if self._values.shape[1] != num_features:
                 raise InvalidFeatures('There are %d features ids '
                                       'but the features of %d are provided.'
-                                      % (num_features, self.values.shape[1]))
+                                      % (num_features, self._values.shape[1]))
         else:
-            if self.values.size != 0:
+            if size != 0:
                 raise InvalidFeatures('There is 0 instance but some features '
                                       'are provided.')
 
@@ -124,8 +146,14 @@ class Features(object):
         return np.all(self.values >= 0)
 
     def get_from_ids(self, instance_ids):
-        values = [self.get_instance_features(i) for i in instance_ids.ids]
-        return Features(values, self.info, instance_ids)
+        indexes = self.instance_ids.get_indexes(instance_ids.get_ids_array())
+        return self.get_from_indexes(indexes, instance_ids)
+
+    def get_from_indexes(self, indexes, instance_ids):
+        if self._indexes is not None:
+            indexes = self._indexes[indexes]
+        return Features(self._values, self.info, instance_ids,
+                        indexes=indexes)
 
     def get_names(self):
         return self.info.names
@@ -148,10 +176,23 @@ class Features(object):
 
     def get_instance_features(self, instance_id):
         index = self.instance_ids.get_index(instance_id)
-        return self.values[index]
+        if self._indexes is not None:
+            index = self._indexes[index]
+        return self._values[index]
+
+    # Features [start, end) of all the instances.
+    def get_columns(self, start, end):
+        if self.instance_ids.num_instances() == 0:
+            return np.empty((0, end - start))
+        elif self._indexes is not None:
+            return self._values[self._indexes, start:end]
+        else:
+            return self._values[:, start:end]
 
     def get_values_from_index(self, feature_index):
         if self.instance_ids.num_instances() == 0:
             return []
+        elif self._indexes is not None:
+            return self._values[self._indexes, feature_index]
         else:
-            return self.values[:, feature_index]
+            return self._values[:, feature_index]
@@ -14,61 +14,113 @@
 # You should have received a copy of the GNU General Public License along
 # with SecuML. If not, see <http://www.gnu.org/licenses/>.
 
+import numpy as np
+
 
 class Ids(object):
 
     def __init__(self, ids, idents=None, timestamps=None):
-        self.ids = ids
+        self._ids = np.asarray(ids, dtype=np.int64)
         self._set_idents_timetamps(idents, timestamps)
-        self.indexes = {}
-        for i in range(len(self.ids)):
-            self.indexes[self.ids[i]] = i
+        self._set_indexes()
+
+    # The ids, idents and timestamps are stored in NumPy arrays. The lists
+    # returned by the attributes ids, idents and timestamps are built lazily
+    # since Python objects are required to export them (DB, JSON).
+    @property
+    def ids(self):
+        if self._ids_list is None:
+            self._ids_list = self._ids.tolist()
+        return self._ids_list
+
+    @property
+    def idents(self):
+        if self._idents_list is None:
+            self._idents_list = self._idents.tolist()
+        return self._idents_list
+
+    @property
+    def timestamps(self):
+        if self._timestamps_list is None:
+            self._timestamps_list = self._timestamps.tolist()
+        return self._timestamps_list
 
     # The union must be used on instances coming from the same dataset.
     # Otherwise, there may be some collisions on the ids.
     def union(self, ids):
         if ids.num_instances() == 0:
             return
-        self.__init__(self.ids + ids.get_ids(),
-                      idents=self.idents + ids.idents,
-                      timestamps=self.timestamps + ids.timestamps)
+        self._ids = np.concatenate((self._ids, ids._ids))
+        self._idents = np.concatenate((self._idents, ids._idents))
+        self._timestamps = np.concatenate((self._timestamps, ids._timestamps))
+        self._set_indexes()
 
     def get_from_ids(self, instance_ids):
-        return Ids(instance_ids,
-                   idents=[self.get_ident(i) for i in instance_ids],
-                   timestamps=[self.get_timestamp(i) for i in instance_ids])
+        return self.get_from_indexes(self.get_indexes(instance_ids))
+
+    def get_from_indexes(self, indexes):
+        return Ids(self._ids[indexes], idents=self._idents[indexes],
+                   timestamps=self._timestamps[indexes])
 
     def num_instances(self):
-        return len(self.ids)
+        return len(self._ids)
 
     def get_index(self, instance_id):
-        return self.indexes[instance_id]
+        pos = np.searchsorted(self._sorted_ids, instance_id)
+        if (pos == len(self._sorted_ids) or
+                self._sorted_ids[pos] != instance_id):
+            raise KeyError(instance_id)
+        return int(self._sorter[pos])
+
+    def get_indexes(self, instance_ids):
+        instance_ids = np.asarray(instance_ids, dtype=np.int64)
+        if len(self._sorted_ids) == 0 and len(instance_ids) > 0:
+            raise KeyError(int(instance_ids[0]))
+        pos = np.searchsorted(self._sorted_ids, instance_ids)
+        pos[pos == len(self._sorted_ids)] = 0
+        missing = self._sorted_ids[pos] != instance_ids
+        if missing.any():
+            raise KeyError(int(instance_ids[missing][0]))
+        return self._sorter[pos]
 
     def get_ids(self):
         return self.ids
 
+    def get_ids_array(self):
+        return self._ids
+
+    def get_ids_from_indexes(self, indexes):
+        return self._ids[indexes].tolist()
+
     def get_ident(self, instance_id):
-        return self.idents[self.get_index(instance_id)]
+        return self._idents[self.get_index(instance_id)]
 
     def get_timestamp(self, instance_id):
-        return self.timestamps[self.get_index(instance_id)]
+        return self._timestamps[self.get_index(instance_id)]
 
     def get_ids_before(self, cutoff_time):
-        return [self.ids[i] for i, t in enumerate(self.timestamps)
-                if t < cutoff_time]
+        return self.get_ids_from_indexes(self._timestamps < cutoff_time)
 
     def get_ids_after(self, cutoff_time):
-        return [self.ids[i] for i, t in enumerate(self.timestamps)
-                if t >= cutoff_time]
+        return self.get_ids_from_indexes(self._timestamps >= cutoff_time)
 
     def get_ids_between(self, start, end):
-        return [self.ids[i] for i, t in enumerate(self.timestamps)
-                if t < end and t >= start]
+        return self.get_ids_from_indexes((self._timestamps < end) &
+                                         (self._timestamps >= start))
 
     def _set_idents_timetamps(self, idents, timestamps):
-        self.idents = idents
-        self.timestamps = timestamps
-        if self.idents is None:
-            self.idents = [None for _ in range(self.num_instances())]
-        if self.timestamps is None:
-            self.timestamps = [None for _ in range(self.num_instances())]
+        self._idents = self._get_object_array(idents)
+        self._timestamps = self._get_object_array(timestamps)
+
+    def _get_object_array(self, values):
+        array = np.empty(self.num_instances(), dtype=object)
+        if values is not None:
+            array[:] = values
+        return array
+
+    def _set_indexes(self):
+        self._sorter = np.argsort(self._ids, kind='mergesort')
+        self._sorted_ids = self._ids[self._sorter]
+        self._ids_list = None
+        self._idents_list = None
+        self._timestamps_list = None
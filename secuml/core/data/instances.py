@@ -57,11 +57,15 @@ class Instances(object):
         instance_ids = self.annotations.get_annotated_ids(label=label)
         return self.get_from_ids(instance_ids)
 
+    # The features, annotations and ground-truth are aligned with the ids:
+    # the indexes of the selected instances are computed only once.
+    # The features of the subset are a view on the features of self.
     def get_from_ids(self, instance_ids):
-        ids = self.ids.get_from_ids(instance_ids)
-        features = self.features.get_from_ids(ids)
-        annotations = self.annotations.get_from_ids(ids)
-        ground_truth = self.ground_truth.get_from_ids(ids)
+        indexes = self.ids.get_indexes(instance_ids)
+        ids = self.ids.get_from_indexes(indexes)
+        features = self.features.get_from_indexes(indexes, ids)
+        annotations = self.annotations.get_from_indexes(indexes, ids)
+        ground_truth = self.ground_truth.get_from_indexes(indexes, ids)
         return Instances(ids, features, annotations, ground_truth)
 
     def get_features_ids(self):
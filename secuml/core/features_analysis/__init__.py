@@ -14,32 +14,75 @@
 # You should have received a copy of the GNU General Public License along
 # with SecuML. If not, see <http://www.gnu.org/licenses/>.
 
+import numpy as np
+from sklearn.externals import joblib
+
+from secuml.core.data.labels_tools import BENIGN, MALICIOUS
+
 from .plots import FeaturePlots
 from .scores import FeaturesScoring
 
+# Maximum number of values read at once (block of features).
+MAX_BLOCK_VALUES = 25 * 10 ** 6
+# Number of chunks of columns per worker process (load balancing).
+CHUNKS_PER_JOB = 4
+
 
+# Executed in the worker processes when the plots are generated in parallel.
+# Each task processes a chunk of columns: the label masks and the features
+# info are sent once per chunk rather than once per feature.
+def _export_features_plots(features_info, start, chunk, label_masks,
+                           output_dir):
+    for i in range(chunk.shape[1]):
+        plots = FeaturePlots(features_info, start + i, chunk[:, i],
+                             label_masks)
+        plots.compute()
+        plots.export(output_dir)
+
+
+# The features are processed block of columns by block of columns in a single
+# pass: the plots of a block are exported and the scores of a block are
+# computed before the next block is read.
 class FeaturesAnalysis(object):
 
-    def __init__(self, instances):
+    # n_jobs: number of processes generating the plots (matplotlib rendering)
+    def __init__(self, instances, n_jobs=1):
         self.instances = instances
+        self.n_jobs = n_jobs
+        self.num_chunks = joblib.effective_n_jobs(n_jobs) * CHUNKS_PER_JOB
         self.num_features = self.instances.num_features()
+        self.block_size = max(1, MAX_BLOCK_VALUES //
+                              max(1, self.instances.num_instances()))
+        self._set_label_masks()
 
-    def compute(self):
-        self._gen_features_plots()
-        self._gen_features_scoring()
-
-    def export(self, output_dir):
-        for feature_index in range(self.num_features):
-            self.plots[feature_index].export(output_dir)
+    def run(self, output_dir):
+        self.scoring = FeaturesScoring(self.instances,
+                                       self.label_masks['all'])
+        # The pool of workers is shared by all the blocks.
+        with joblib.Parallel(n_jobs=self.n_jobs) as parallel:
+            for start in range(0, self.num_features, self.block_size):
+                end = min(start + self.block_size, self.num_features)
+                block = self.instances.features.get_columns(start, end)
+                self._export_features_plots(parallel, output_dir, start,
+                                            block)
+                self.scoring.add_block(start, block)
+        self.scoring.final_computations()
         self.scoring.export(output_dir)
 
-    def _gen_features_plots(self):
-        self.plots = [None for _ in range(self.num_features)]
-        for feature_index in range(self.num_features):
-            self.plots[feature_index] = FeaturePlots(self.instances,
-                                                     feature_index)
-            self.plots[feature_index].compute()
+    def _set_label_masks(self):
+        annotations = self.instances.annotations
+        self.label_masks = {
+                label: annotations.get_annotated_mask(label=label)
+                for label in ['all', MALICIOUS, BENIGN]}
+        self.label_masks['unlabeled'] = annotations.get_unlabeled_mask()
 
-    def _gen_features_scoring(self):
-        self.scoring = FeaturesScoring(self.instances)
-        self.scoring.compute()
+    def _export_features_plots(self, parallel, output_dir, start, block):
+        features_info = self.instances.features.info
+        num_chunks = min(self.num_chunks, block.shape[1])
+        bounds = np.linspace(0, block.shape[1], num_chunks + 1).astype(int)
+        parallel(joblib.delayed(_export_features_plots)(features_info,
+                                                        start + b,
+                                                        block[:, b:e],
+                                                        self.label_masks,
+                                                        output_dir)
+                 for b, e in zip(bounds[:-1], bounds[1:]))
@@ -29,15 +29,15 @@ from secuml.core.tools.plots.density import Density
 
 class FeaturePlots(object):
 
-    def __init__(self, instances, feature_index):
+    # all_values: values of the feature for all the instances.
+    # label_masks: instances of each label (MALICIOUS, BENIGN, 'unlabeled').
+    def __init__(self, features_info, feature_index, all_values, label_masks):
         self.feature_index = feature_index
-        features_info = instances.features.info
         self.feature_type = features_info.types[self.feature_index]
         self.feature_name = features_info.names[self.feature_index]
         self.feature_id = features_info.ids[self.feature_index]
-        self.all_values = instances.features.get_values_from_index(
-                                                            self.feature_index)
-        self._gen_plot_datasets(instances)
+        self.all_values = all_values
+        self._gen_plot_datasets(label_masks)
 
     def compute(self):
         if self.feature_type == FeatureType.binary:
@@ -69,19 +69,13 @@ class FeaturePlots(object):
                                                   'histogram.json'))
             self.density.display(path.join(output_dir, 'density.png'))
 
-    def _gen_plot_datasets(self, instances):
+    def _gen_plot_datasets(self, label_masks):
         self.plot_datasets = {}
-        self._gen_label_plot_dataset(instances, MALICIOUS)
-        self._gen_label_plot_dataset(instances, BENIGN)
-        self._gen_label_plot_dataset(instances, 'unlabeled')
+        for label in [MALICIOUS, BENIGN, 'unlabeled']:
+            self._gen_label_plot_dataset(label_masks[label], label)
 
-    def _gen_label_plot_dataset(self, instances, label):
-        if label != 'unlabeled':
-            instances = instances.get_annotated_instances(label=label)
-        else:
-            instances = instances.get_unlabeled_instances()
-        values = instances.features.get_values_from_index(self.feature_index)
-        dataset = PlotDataset(values, label)
+    def _gen_label_plot_dataset(self, mask, label):
+        dataset = PlotDataset(self.all_values[mask], label)
         dataset.set_color(get_label_color(label))
         self.plot_datasets[label] = dataset
 
@@ -109,8 +103,8 @@ class FeaturePlots(object):
         self.barplot = BarPlot(['0', '1'])
         for label, dataset in self.plot_datasets.items():
             if len(dataset.values) > 0:
-                num_0 = sum(dataset.values == 0)
-                num_1 = sum(dataset.values == 1)
+                num_0 = np.count_nonzero(dataset.values == 0)
+                num_1 = np.count_nonzero(dataset.values == 1)
                 hist_dataset = PlotDataset([num_0, num_1], label)
                 hist_dataset.set_color(dataset.color)
                 self.barplot.add_dataset(hist_dataset)
@@ -16,6 +16,7 @@
 
 from decimal import Decimal
 import json
+import numpy as np
 import os.path as path
 import pandas as pd
 from sklearn.feature_selection import chi2
@@ -71,35 +72,53 @@ class FeatureScoring(object):
             self.scores[func] = ScoreValueRank(value, pvalue)
 
 
+# The scores are computed block of features by block of features
+# (see FeaturesAnalysis.run).
 class FeaturesScoring(object):
 
-    def __init__(self, instances):
+    def __init__(self, instances, annotated_mask):
         self.instances = instances
-        self.annotated_instances = instances.get_annotated_instances()
+        self.annotated_mask = annotated_mask
+        labels = np.array(instances.annotations.get_labels(), dtype=object)
+        self.annotations = labels[annotated_mask].tolist()
+        # chi2 requires positive features. It is discarded as soon as a
+        # block contains a negative value.
+        self.all_positives = True
         self._set_scoring_func()
+        self.blocks_scores = []
 
-    def compute(self):
-        self._compute_scores()
+    def add_block(self, start, block):
+        if self.all_positives and not np.all(block >= 0):
+            self.all_positives = False
+            self._set_scoring_func()
+        scores_dict = {}
+        for func, has_pvalue in self.scoring_func:
+            scores, p_values = self.compute_scoring_func(func, start, block)
+            scores_dict[func] = scores
+            if has_pvalue:
+                scores_dict['_'.join([func, 'pvalues'])] = p_values
+        ids = self.instances.features.info.ids[start:start + block.shape[1]]
+        self.blocks_scores.append(pd.DataFrame(scores_dict, index=ids))
+
+    def final_computations(self):
+        # The scores of chi2 computed on the first blocks are discarded if a
+        # following block contains a negative value.
+        columns = []
+        for func, has_pvalue in self.scoring_func:
+            columns.append(func)
+            if has_pvalue:
+                columns.append('_'.join([func, 'pvalues']))
+        self.scores = pd.concat(self.blocks_scores)[columns]
         self._compute_features_scoring_ranking()
 
     def _set_scoring_func(self):
         self.scoring_func = [('variance', False)]
-        if self.annotated_instances.num_instances() > 0:
+        if len(self.annotations) > 0:
             self.scoring_func.append(('f_classif', True))
             self.scoring_func.append(('mutual_info_classif', False))
-            if self.instances.features.all_positives():
+            if self.all_positives:
                 self.scoring_func.append(('chi2', True))
 
-    def _compute_scores(self):
-        scores_dict = {}
-        for func, has_pvalue in self.scoring_func:
-            scores, p_values = self.compute_scoring_func(func)
-            scores_dict[func] = scores
-            if has_pvalue:
-                scores_dict['_'.join([func, 'pvalues'])] = p_values
-        self.scores = pd.DataFrame(scores_dict,
-                                   index=self.instances.features.info.ids)
-
     def _compute_features_scoring_ranking(self):
         self.features_scores = {}
         for i, feature_id in enumerate(self.instances.features.info.ids):
@@ -120,17 +139,16 @@ class FeaturesScoring(object):
         for _, feature_scores in self.features_scores.items():
             feature_scores.export(output_dir)
 
-    def compute_scoring_func(self, func):
+    def compute_scoring_func(self, func, start, block):
         if func == 'variance':
-            features = self.instances.features.get_values()
-            annotations = self.instances.annotations.get_labels()
-            return features.var(axis=0), None
-        features = self.annotated_instances.features.get_values()
-        annotations = self.annotated_instances.annotations.get_labels()
+            return block.var(axis=0), None
+        features = block[self.annotated_mask]
+        annotations = self.annotations
         if func == 'f_classif':
             return f_classif(features, annotations)
         elif func == 'mutual_info_classif':
             features_types = self.instances.features.info.types
+            features_types = features_types[start:start + block.shape[1]]
             discrete_indexes = [i for i, t in enumerate(features_types)
                                 if t == FeatureType.binary]
             if not discrete_indexes:
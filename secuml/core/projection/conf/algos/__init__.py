@@ -19,13 +19,17 @@ import abc
 from secuml.core.conf import Conf
 from secuml.core.conf import ConfFactory
 from secuml.core.conf import exportFieldMethod
+from secuml.core.projection.conf.class_separation import ClassSeparationConf
 
 
 class ProjectionConf(Conf):
 
-    def __init__(self, logger, num_components):
+    def __init__(self, logger, num_components, class_sep_conf=None):
         Conf.__init__(self, logger)
         self.num_components = num_components
+        self.class_sep_conf = class_sep_conf
+        if self.class_sep_conf is None:
+            self.class_sep_conf = ClassSeparationConf(logger)
         self._set_algo()
 
     @abc.abstractmethod
@@ -41,13 +45,24 @@ class ProjectionConf(Conf):
 
     def fields_to_export(self):
         return [('algo', exportFieldMethod.obj_class),
-                ('num_components', exportFieldMethod.primitive)]
+                ('num_components', exportFieldMethod.primitive),
+                ('class_sep_conf', exportFieldMethod.obj)]
 
     @staticmethod
     def gen_parser(parser):
         parser.add_argument('--num-components',
                             type=int,
                             default=None)
+        ClassSeparationConf.gen_parser(parser)
+
+    @staticmethod
+    def class_sep_conf_from_args(args, logger):
+        return ClassSeparationConf.from_args(args, logger)
+
+    @staticmethod
+    def class_sep_conf_from_json(obj, logger):
+        return ClassSeparationConf.from_json(obj.get('class_sep_conf'),
+                                             logger)
 
 
 class UnsupervisedProjectionConf(ProjectionConf):
@@ -57,8 +72,10 @@ class UnsupervisedProjectionConf(ProjectionConf):
 
 class SemiSupervisedProjectionConf(ProjectionConf):
 
-    def __init__(self, logger, num_components=None, multiclass=None):
-        ProjectionConf.__init__(self, logger, num_components)
+    def __init__(self, logger, num_components=None, multiclass=None,
+                 class_sep_conf=None):
+        ProjectionConf.__init__(self, logger, num_components,
+                                class_sep_conf=class_sep_conf)
         self.multiclass = multiclass
 
     def get_exp_name(self):
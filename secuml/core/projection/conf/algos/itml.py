@@ -26,8 +26,12 @@ class ItmlConf(SemiSupervisedProjectionConf):
 
     @staticmethod
     def from_json(obj, logger):
-        return ItmlConf(logger, obj['num_components'], obj['multiclass'])
+        class_sep_conf = ItmlConf.class_sep_conf_from_json(obj, logger)
+        return ItmlConf(logger, obj['num_components'], obj['multiclass'],
+                        class_sep_conf=class_sep_conf)
 
     @staticmethod
     def from_args(args, logger):
-        return ItmlConf(logger, args.multiclass)
+        class_sep_conf = ItmlConf.class_sep_conf_from_args(args, logger)
+        return ItmlConf(logger, args.multiclass,
+                        class_sep_conf=class_sep_conf)
@@ -25,8 +25,12 @@ class LdaConf(SemiSupervisedProjectionConf):
 
     @staticmethod
     def from_args(args, logger):
-        return LdaConf(logger, args.num_components, args.multiclass)
+        class_sep_conf = LdaConf.class_sep_conf_from_args(args, logger)
+        return LdaConf(logger, args.num_components, args.multiclass,
+                       class_sep_conf=class_sep_conf)
 
     @staticmethod
     def from_json(obj, logger):
-        return LdaConf(logger, obj['num_components'], obj['multiclass'])
+        class_sep_conf = LdaConf.class_sep_conf_from_json(obj, logger)
+        return LdaConf(logger, obj['num_components'], obj['multiclass'],
+                       class_sep_conf=class_sep_conf)
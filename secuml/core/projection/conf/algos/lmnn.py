@@ -25,8 +25,12 @@ class LmnnConf(SemiSupervisedProjectionConf):
 
     @staticmethod
     def from_json(obj, logger):
-        return LmnnConf(logger, obj['num_components'], obj['multiclass'])
+        class_sep_conf = LmnnConf.class_sep_conf_from_json(obj, logger)
+        return LmnnConf(logger, obj['num_components'], obj['multiclass'],
+                        class_sep_conf=class_sep_conf)
 
     @staticmethod
     def from_args(args, logger):
-        return LmnnConf(logger, multiclass=args.multiclass)
+        class_sep_conf = LmnnConf.class_sep_conf_from_args(args, logger)
+        return LmnnConf(logger, multiclass=args.multiclass,
+                        class_sep_conf=class_sep_conf)
@@ -25,8 +25,12 @@ class NcaConf(SemiSupervisedProjectionConf):
 
     @staticmethod
     def from_json(obj, logger):
-        return NcaConf(logger, obj['num_components'], obj['multiclass'])
+        class_sep_conf = NcaConf.class_sep_conf_from_json(obj, logger)
+        return NcaConf(logger, obj['num_components'], obj['multiclass'],
+                       class_sep_conf=class_sep_conf)
 
     @staticmethod
     def from_args(args, logger):
-        return NcaConf(logger, args.num_components, args.multiclass)
+        class_sep_conf = NcaConf.class_sep_conf_from_args(args, logger)
+        return NcaConf(logger, args.num_components, args.multiclass,
+                       class_sep_conf=class_sep_conf)
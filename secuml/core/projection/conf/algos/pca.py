@@ -25,8 +25,12 @@ class PcaConf(UnsupervisedProjectionConf):
 
     @staticmethod
     def from_args(args, logger):
-        return PcaConf(logger, args.num_components)
+        class_sep_conf = PcaConf.class_sep_conf_from_args(args, logger)
+        return PcaConf(logger, args.num_components,
+                       class_sep_conf=class_sep_conf)
 
     @staticmethod
     def from_json(obj, logger):
-        return PcaConf(logger, obj['num_components'])
+        class_sep_conf = PcaConf.class_sep_conf_from_json(obj, logger)
+        return PcaConf(logger, obj['num_components'],
+                       class_sep_conf=class_sep_conf)
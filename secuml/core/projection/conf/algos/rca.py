@@ -25,8 +25,12 @@ class RcaConf(SemiSupervisedProjectionConf):
 
     @staticmethod
     def from_json(obj, logger):
-        return RcaConf(logger, obj['num_components'], obj['multiclass'])
+        class_sep_conf = RcaConf.class_sep_conf_from_json(obj, logger)
+        return RcaConf(logger, obj['num_components'], obj['multiclass'],
+                       class_sep_conf=class_sep_conf)
 
     @staticmethod
     def from_args(args, logger):
-        return RcaConf(logger, args.num_components, args.multiclass)
+        class_sep_conf = RcaConf.class_sep_conf_from_args(args, logger)
+        return RcaConf(logger, args.num_components, args.multiclass,
+                       class_sep_conf=class_sep_conf)
@@ -25,8 +25,12 @@ class SdmlConf(SemiSupervisedProjectionConf):
 
     @staticmethod
     def from_json(obj, logger):
-        return SdmlConf(logger, obj['num_components'], obj['multiclass'])
+        class_sep_conf = SdmlConf.class_sep_conf_from_json(obj, logger)
+        return SdmlConf(logger, obj['num_components'], obj['multiclass'],
+                        class_sep_conf=class_sep_conf)
 
     @staticmethod
     def from_args(args, logger):
-        return SdmlConf(logger, multiclass=args.multiclass)
+        class_sep_conf = SdmlConf.class_sep_conf_from_args(args, logger)
+        return SdmlConf(logger, multiclass=args.multiclass,
+                        class_sep_conf=class_sep_conf)
@@ -0,0 +1,71 @@
+# SecuML
+# Copyright (C) 2016-2019  ANSSI
+#
+# SecuML is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# SecuML is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with SecuML. If not, see <http://www.gnu.org/licenses/>.
+
+
+from secuml.core.conf import Conf
+from secuml.core.conf import exportFieldMethod
+
+
+# Parameters of the class separation computed on the projected instances
+# when the ground truth is available.
+# By default the mean distances are computed exactly over all the pairs of
+# instances (by blocks of rows). When sample_size is set, they are estimated
+# from sample_size random pairs per class, and a confidence interval of the
+# class separation is computed.
+class ClassSeparationConf(Conf):
+
+    def __init__(self, logger, sample_size=None, confidence=0.95):
+        Conf.__init__(self, logger)
+        self.sample_size = sample_size
+        self.confidence = confidence
+
+    def fields_to_export(self):
+        return [('sample_size', exportFieldMethod.primitive),
+                ('confidence', exportFieldMethod.primitive)]
+
+    @staticmethod
+    def gen_parser(parser):
+        group = parser.add_argument_group('Class separation parameters')
+        group.add_argument(
+                '--class-sep-sample-size',
+                type=int,
+                default=None,
+                help='Number of random pairs of instances per class used to '
+                     'estimate the class separation. '
+                     'By default, all the pairs are considered.')
+        group.add_argument(
+                '--class-sep-confidence',
+                type=float,
+                default=0.95,
+                help='Confidence level of the interval computed when the '
+                     'class separation is estimated from a sample. '
+                     'Default: 0.95.')
+
+    @staticmethod
+    def from_args(args, logger):
+        # The projection parameters of the clustering experiments do not
+        # include the class separation arguments.
+        if not hasattr(args, 'class_sep_sample_size'):
+            return ClassSeparationConf(logger)
+        return ClassSeparationConf(logger, args.class_sep_sample_size,
+                                   args.class_sep_confidence)
+
+    @staticmethod
+    def from_json(obj, logger):
+        if obj is None:
+            return ClassSeparationConf(logger)
+        return ClassSeparationConf(logger, obj['sample_size'],
+                                   obj['confidence'])
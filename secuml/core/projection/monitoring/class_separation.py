@@ -14,15 +14,23 @@
 # You should have received a copy of the GNU General Public License along
 # with SecuML. If not, see <http://www.gnu.org/licenses/>.
 
+
 import numpy as np
+from scipy.stats import norm
 from sklearn.metrics import pairwise_distances
 
+# Maximum number of distances computed at once.
+MAX_BLOCK_DISTANCES = 10 ** 7
+
 
 class ClassSeparation(object):
 
     def __init__(self, projection):
         self.projection = projection
         self.class_separation = None
+        # Confidence interval when the class separation is estimated from a
+        # sample of pairs of instances.
+        self.confidence_interval = None
 
     def computer_perf(self, instances):
         X = instances.features.get_values()
@@ -34,10 +42,82 @@ class ClassSeparation(object):
             if self.projection.conf.multiclass:
                 labels = instances.ground_truth.get_families()
         unique_labels, label_inds = np.unique(labels, return_inverse=True)
-        ratio = 0
-        for li in range(len(unique_labels)):
-            Xc = X[label_inds == li]
-            Xnc = X[label_inds != li]
-            ratio += pairwise_distances(Xc).mean() / \
-                pairwise_distances(Xc, Xnc).mean()
-        self.class_separation = ratio / len(unique_labels)
+        conf = self.projection.conf.class_sep_conf
+        if conf.sample_size is None:
+            self._exact(X, label_inds, len(unique_labels))
+        else:
+            self._sampled(X, label_inds, len(unique_labels), conf.sample_size,
+                          conf.confidence)
+
+    def to_json(self):
+        interval = None
+        if self.confidence_interval is not None:
+            interval = [float(x) for x in self.confidence_interval]
+        return {'class_separation': float(self.class_separation),
+                'confidence_interval': interval}
+
+    # The distances are computed by blocks of rows, and only their sums
+    # within each class and between each class and the others are kept.
+    def _exact(self, X, label_inds, num_labels):
+        num_instances = X.shape[0]
+        one_hot = np.zeros((num_instances, num_labels))
+        one_hot[np.arange(num_instances), label_inds] = 1
+        within = np.zeros(num_labels)
+        total = np.zeros(num_labels)
+        block_size = max(1, MAX_BLOCK_DISTANCES // num_instances)
+        for start in range(0, num_instances, block_size):
+            end = min(start + block_size, num_instances)
+            distances = pairwise_distances(X[start:end], X)
+            # Sum of the distances of each row to each class.
+            class_sums = np.dot(distances, one_hot)
+            block_labels = label_inds[start:end]
+            within += np.bincount(
+                    block_labels,
+                    weights=class_sums[np.arange(end - start), block_labels],
+                    minlength=num_labels)
+            total += np.bincount(block_labels, weights=class_sums.sum(axis=1),
+                                 minlength=num_labels)
+        counts = np.bincount(label_inds, minlength=num_labels)
+        within_mean = within / (counts ** 2)
+        between_mean = (total - within) / (counts * (num_instances - counts))
+        self.class_separation = np.mean(within_mean / between_mean)
+        self.confidence_interval = None
+
+    # The mean distances are estimated from sample_size random pairs of
+    # instances. The confidence interval of each ratio is derived from the
+    # intervals of the two mean distances.
+    def _sampled(self, X, label_inds, num_labels, sample_size, confidence):
+        z = norm.ppf(0.5 + confidence / 2)
+        ratios = np.zeros(num_labels)
+        lower = np.zeros(num_labels)
+        upper = np.zeros(num_labels)
+        for li in range(num_labels):
+            class_indexes = np.where(label_inds == li)[0]
+            other_indexes = np.where(label_inds != li)[0]
+            within = self._sample_distances(X, class_indexes, class_indexes,
+                                            sample_size)
+            between = self._sample_distances(X, class_indexes, other_indexes,
+                                             sample_size)
+            within_mean, within_error = self._mean_error(within, z)
+            between_mean, between_error = self._mean_error(between, z)
+            ratios[li] = within_mean / between_mean
+            lower[li] = max(within_mean - within_error, 0) / \
+                (between_mean + between_error)
+            if between_mean > between_error:
+                upper[li] = (within_mean + within_error) / \
+                    (between_mean - between_error)
+            else:
+                upper[li] = np.inf
+        self.class_separation = np.mean(ratios)
+        self.confidence_interval = (np.mean(lower), np.mean(upper))
+
+    # Pairs drawn uniformly with replacement, as the pairwise mean includes
+    # the distance of each instance to itself.
+    def _sample_distances(self, X, indexes_1, indexes_2, sample_size):
+        rows_1 = X[np.random.choice(indexes_1, sample_size)]
+        rows_2 = X[np.random.choice(indexes_2, sample_size)]
+        return np.sqrt(((rows_1 - rows_2) ** 2).sum(axis=1))
+
+    def _mean_error(self, distances, z):
+        return (distances.mean(),
+                z * distances.std(ddof=1) / np.sqrt(len(distances)))
@@ -14,6 +14,9 @@
 # You should have received a copy of the GNU General Public License along
 # with SecuML. If not, see <http://www.gnu.org/licenses/>.
 
+import json
+import os.path as path
+
 from .class_separation import ClassSeparation
 
 
@@ -31,3 +34,7 @@ class PerfMonitoring(object):
 
     def display(self):
         return
+
+    def export(self, output_dir):
+        with open(path.join(output_dir, 'perf_monitoring.json'), 'w') as f:
+            json.dump(self.class_separation.to_json(), f, indent=2)
@@ -92,6 +92,7 @@ class Projection(object):
             return None
         evaluation = PerfMonitoring(self)
         evaluation.computer_perf(projected_instances)
+        evaluation.export(output_dir)
         return evaluation
 
     def export_projection_matrix(self, output_dir, features_names):
@@ -17,15 +17,57 @@
 import math
 import matplotlib.pyplot as plt
 import numpy as np
+from scipy.signal import fftconvolve
 from sklearn.neighbors import KernelDensity
 
+# The exact KDE is computed for small datasets.
+MAX_EXACT_VALUES = 1000
+# Maximum number of points of the grid of the binned KDE.
+MAX_GRID_POINTS = 2 ** 16
+
+
+# Gaussian KDE of values evaluated on x.
+# values are linearly binned on a regular grid (bandwidth / 4 spacing) and
+# the counts are convolved with the Gaussian kernel (FFT). The density on x
+# is then interpolated from the grid.
+# Returns None if the grid would be too large (range of values much larger
+# than the bandwidth).
+def binned_kde(values, x, bandwidth):
+    spacing = bandwidth / 4.
+    # The kernel is truncated at 5 bandwidths.
+    radius = int(math.ceil(5 * bandwidth / spacing))
+    low = min(np.amin(values), np.amin(x)) - radius * spacing
+    high = max(np.amax(values), np.amax(x)) + radius * spacing
+    num_points = int(math.ceil((high - low) / spacing)) + 1
+    if num_points > MAX_GRID_POINTS:
+        return None
+    grid = low + spacing * np.arange(num_points)
+    # Linear binning
+    pos = (values - low) / spacing
+    left = np.floor(pos).astype(int)
+    right_weights = pos - left
+    counts = np.bincount(left, weights=1. - right_weights,
+                         minlength=num_points + 1)
+    counts += np.bincount(left + 1, weights=right_weights,
+                          minlength=num_points + 1)
+    counts = counts[:num_points]
+    # Convolution with the Gaussian kernel
+    offsets = spacing * np.arange(-radius, radius + 1)
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2)
+    kernel /= len(values) * bandwidth * math.sqrt(2 * math.pi)
+    density = np.maximum(fftconvolve(counts, kernel, mode='same'), 0)
+    return np.interp(x, grid, density)
+
 
 class Density(object):
 
+    # exact: the KDE is always computed exactly with sklearn KernelDensity.
+    # Otherwise, it is approximated with binned_kde for large datasets.
     def __init__(self, num_points=200, bandwidth=0.3, title=None,
-                 min_value=None, max_value=None):
+                 min_value=None, max_value=None, exact=False):
         self.num_points = num_points
         self.bandwidth = bandwidth
+        self.exact = exact
         self.title = title
         self.datasets = []
         self.min_value = min_value
@@ -72,16 +114,19 @@ class Density(object):
                           density_delta / self.num_points)
         else:
             x = np.array([self.min_value - 2*eps, self.max_value + 2*eps])
-        if np.var(dataset.values) < eps:
+        values = np.asarray(dataset.values, dtype=float)
+        if np.var(values) < eps:
             linewidth += 2
-            mean = np.mean(dataset.values)
+            mean = np.mean(values)
             x = np.sort(np.append(x, [mean, mean - eps, mean + eps]))
-            density = [1 if v == mean else 0 for v in x]
+            density = (x == mean).astype(float)
         else:
-            self.kde.fit(np.asarray([[x] for x in dataset.values]))
-            x_density = [[y] for y in x]
-            # kde.score_samples returns the 'log' of the density
-            log_density = self.kde.score_samples(x_density).tolist()
-            density = list(map(math.exp, log_density))
+            density = None
+            if not self.exact and len(values) > MAX_EXACT_VALUES:
+                density = binned_kde(values, x, self.bandwidth)
+            if density is None:
+                self.kde.fit(values.reshape(-1, 1))
+                # kde.score_samples returns the 'log' of the density
+                density = np.exp(self.kde.score_samples(x.reshape(-1, 1)))
         self.ax.plot(x, density, label=dataset.label, color=dataset.color,
                      linewidth=linewidth, linestyle=dataset.linestyle)
@@ -0,0 +1,198 @@
+# SecuML
+# Copyright (C) 2016-2019  ANSSI
+#
+# SecuML is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# SecuML is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with SecuML. If not, see <http://www.gnu.org/licenses/>.
+
+
+# Evolution of some indicators along the iterations of an active learning
+# experiment.
+# The values are kept in memory between the iterations and exported in a JSON
+# lines file: the first line contains the display parameters of the plotted
+# series, and each following line the values of one iteration. The line of
+# the new iteration is appended to the file, so the export does not depend
+# on the number of iterations. The figures are not rendered at each
+# iteration: they are generated on demand from the file (web UI, end of the
+# experiment).
+
+import json
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import numpy as np
+import os
+import os.path as path
+import threading
+
+evolutions = {}
+
+
+class Evolution(object):
+
+    def __init__(self, columns, ylabel, ymax=None, legend_ncol=2):
+        self.columns = columns
+        self.ylabel = ylabel
+        self.ymax = ymax
+        self.legend_ncol = legend_ncol
+        self.iterations = []
+        self.values = {c: [] for c in self.columns}
+        self.series = []
+        # Indexes of the iterations not written in the file yet. None if the
+        # file has not been created yet.
+        self.to_export = None
+
+    # plot: PlotDataset defining how the column is displayed
+    def add_series(self, column, plot):
+        self.series.append({'column': column,
+                            'label': plot.label,
+                            'color': plot.color,
+                            'linewidth': plot.linewidth,
+                            'linestyle': plot.linestyle,
+                            'marker': plot.marker})
+
+    # The values of an iteration already present (e.g. the iteration has been
+    # run again after a restart) are replaced.
+    def add_iteration(self, iter_num, values):
+        values = [float(v) if v is not None else None for v in values]
+        if iter_num in self.iterations:
+            index = self.iterations.index(iter_num)
+            for column, value in zip(self.columns, values):
+                self.values[column][index] = value
+        else:
+            index = len(self.iterations)
+            self.iterations.append(iter_num)
+            for column, value in zip(self.columns, values):
+                self.values[column].append(value)
+        if self.to_export is not None:
+            self.to_export.append(index)
+
+    def header_to_json(self):
+        return {'columns': self.columns,
+                'ylabel': self.ylabel,
+                'ymax': self.ymax,
+                'legend_ncol': self.legend_ncol,
+                'series': self.series}
+
+    def iteration_to_json(self, index):
+        return {'iteration': self.iterations[index],
+                'values': [self.values[c][index] for c in self.columns]}
+
+    @staticmethod
+    def header_from_json(obj):
+        evolution = Evolution(obj['columns'], obj['ylabel'], ymax=obj['ymax'],
+                              legend_ncol=obj['legend_ncol'])
+        evolution.series = obj['series']
+        return evolution
+
+    # Appends the iterations added since the previous export. The file is
+    # created with the header at the first export: it is written under a
+    # temporary name and then atomically renamed since it may be read
+    # concurrently by the web server.
+    def export(self, filename):
+        if self.to_export is None or not path.isfile(filename):
+            tmp_filename = '%s.%d.tmp' % (filename, os.getpid())
+            with open(tmp_filename, 'w') as f:
+                self._write_lines(f, [self.header_to_json()],
+                                  range(len(self.iterations)))
+            os.replace(tmp_filename, filename)
+        else:
+            with open(filename, 'a') as f:
+                self._write_lines(f, [], self.to_export)
+        self.to_export = []
+
+    def _write_lines(self, f, lines, indexes):
+        lines.extend(self.iteration_to_json(i) for i in indexes)
+        f.write(''.join('%s\n' % json.dumps(line) for line in lines))
+
+    # The last line may be incomplete if the file is being appended: it is
+    # ignored.
+    @staticmethod
+    def load(filename):
+        with open(filename, 'r') as f:
+            evolution = Evolution.header_from_json(json.loads(f.readline()))
+            for line in f:
+                if not line.endswith('\n'):
+                    break
+                obj = json.loads(line)
+                evolution.add_iteration(obj['iteration'], obj['values'])
+        evolution.to_export = []
+        return evolution
+
+    # Plots the evolution until the iteration last_iter.
+    # The figures are rendered in the threads of the web server: the Agg
+    # canvas is used rather than pyplot which relies on a global state and
+    # on the default (possibly GUI) backend.
+    def plot(self, filename, last_iter=None, eps=False):
+        selection = [i for i, iter_num in enumerate(self.iterations)
+                     if last_iter is None or iter_num <= last_iter]
+        iterations = [self.iterations[i] for i in selection]
+        fig = Figure()
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(1, 1, 1)
+        max_value = 0
+        for series in self.series:
+            values = np.array([self.values[series['column']][i]
+                               for i in selection], dtype=float)
+            if np.any(np.isfinite(values)):
+                max_value = max(max_value,
+                                np.max(values[np.isfinite(values)]))
+            ax.plot(iterations, values, label=series['label'],
+                    color=series['color'],
+                    linewidth=series['linewidth'],
+                    linestyle=series['linestyle'],
+                    marker=series['marker'])
+        ymax = self.ymax if self.ymax is not None else max_value
+        ax.set_ylim(0, ymax)
+        ax.set_xlabel('Iteration')
+        ax.set_ylabel(self.ylabel)
+        lgd = ax.legend(bbox_to_anchor=(0., 1.02, 1., .102), loc=3,
+                        ncol=self.legend_ncol, mode='expand',
+                        borderaxespad=0., fontsize='large')
+        _savefig(fig, filename, lgd, 'png')
+        if eps:
+            _savefig(fig, '%s.eps' % path.splitext(filename)[0], lgd, 'eps',
+                     dpi=1000)
+
+
+def _savefig(fig, filename, lgd, fig_format, dpi=None):
+    tmp_filename = '%s.%d.%d.tmp' % (filename, os.getpid(),
+                                     threading.get_ident())
+    fig.savefig(tmp_filename, bbox_extra_artists=(lgd,), bbox_inches='tight',
+                format=fig_format, dpi=dpi)
+    os.replace(tmp_filename, filename)
+
+
+# Returns the evolution kept in memory since the previous iteration. It is
+# loaded from its JSON file if the process has been restarted in-between.
+# new_evolution creates the evolution at the first iteration.
+def get_evolution(filename, iter_num, new_evolution):
+    if iter_num == 1 or not path.isfile(filename):
+        evolution = new_evolution()
+    elif filename in evolutions:
+        evolution = evolutions[filename]
+    else:
+        evolution = Evolution.load(filename)
+    evolutions[filename] = evolution
+    return evolution
+
+
+# Renders the figure of the iteration last_iter if it does not exist yet.
+# The figure is not generated if the evolution does not contain the iteration.
+def plot_evolution(evolution_file, output_file, last_iter, eps=False):
+    if path.isfile(output_file) or not path.isfile(evolution_file):
+        return
+    if not path.isdir(path.dirname(output_file)):
+        return
+    evolution = Evolution.load(evolution_file)
+    if last_iter not in evolution.iterations:
+        return
+    evolution.plot(output_file, last_iter=last_iter, eps=eps)
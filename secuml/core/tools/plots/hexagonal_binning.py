@@ -51,11 +51,11 @@ class HexagonalBin(object):
     def has_instances(self):
         return (len(self.malicious_ids) + len(self.ok_ids)) > 0
 
-    def add_data(self, index, malicious_ids):
-        if index in malicious_ids:
-            self.malicious_ids.append(index)
-        else:
-            self.ok_ids.append(index)
+    # ids: NumPy array of the instances ids in the bin
+    # malicious: boolean mask of the malicious instances
+    def set_data(self, ids, malicious):
+        self.malicious_ids = ids[malicious].tolist()
+        self.ok_ids = ids[~malicious].tolist()
 
     def center(self):
         [x_center, y_center] = [0, 0]
@@ -104,7 +104,7 @@ class HexagonalBinning(object):
 
         self.x = np.array(x, float)
         self.y = np.array(y, float)
-        self.ids = ids
+        self.ids = np.asarray(ids)
 
         self.xmin = np.amin(x)
         self.xmax = np.amax(x)
@@ -159,25 +159,28 @@ class HexagonalBinning(object):
         d2 = 3 * (self.x_scale - x_2) ** 2 + (self.y_scale - y_2) ** 2
         bdist = (d1 < d2)
 
-        self.lattice1 = np.empty((self.nx, self.ny), dtype=object)
-        self.lattice2 = np.empty((self.nx, self.ny), dtype=object)
-        for i in range(self.nx):
-            for j in range(self.ny):
-                self.lattice1[i, j] = HexagonalBin(1, self.size,
-                                                   self.xmin, self.ymin, i, j)
-                self.lattice2[i, j] = HexagonalBin(2, self.size,
-                                                   self.xmin, self.ymin, i, j)
-        for i in range(len(self.x)):
-            if bdist[i]:
-                self.lattice1[i_1[i], j_1[i]].add_data(self.ids[i],
-                                                       self.malicious_ids)
-            else:
-                self.lattice2[i_2[i], j_2[i]].add_data(self.ids[i],
-                                                       self.malicious_ids)
+        lattice = np.where(bdist, 1, 2)
+        i = np.where(bdist, i_1, i_2)
+        j = np.where(bdist, j_1, j_2)
+
+        # Only the non-empty bins are created. They are sorted by (i, j,
+        # lattice).
+        keys = (i * self.ny + j) * 2 + (lattice - 1)
+        keys, first_points, inverse = np.unique(keys, return_index=True,
+                                                return_inverse=True)
+        # The points of each bin are kept in their original order.
+        order = np.argsort(inverse, kind='mergesort')
+        splits = np.cumsum(np.bincount(inverse))[:-1]
+        malicious = np.isin(self.ids, np.asarray(self.malicious_ids))
+        self.bins = []
+        for first, points in zip(first_points, np.split(order, splits)):
+            hex_bin = HexagonalBin(lattice[first], self.size, self.xmin,
+                                   self.ymin, i[first], j[first])
+            hex_bin.set_data(self.ids[points], malicious[points])
+            self.bins.append(hex_bin)
 
     def print_binning(self, pc_x_index, pc_y_index, output_file):
         with open(output_file, 'w') as f:
-            k = 0
             f.write('[\n')
             # Prints xmin, xmax, ymin, ymax
             min_max = {'xmin': self.xmin,
@@ -187,18 +190,6 @@ class HexagonalBinning(object):
             json.dump(min_max, f)
             f.write(',')
             # Prints information about each hexagonal bin
-            for i in range(self.nx):
-                for j in range(self.ny):
-                    if self.lattice1[i, j].has_instances():
-                        if k != 0:
-                            f.write(',')
-                        json.dump(self.lattice1[i, j].to_json(), f,
-                                  sort_keys=True)
-                        k += 1
-                    if self.lattice2[i, j].has_instances():
-                        if k != 0:
-                            f.write(',')
-                        json.dump(self.lattice2[i, j].to_json(), f,
-                                  sort_keys=True)
-                        k += 1
+            f.write(','.join(json.dumps(hex_bin.to_json(), sort_keys=True)
+                             for hex_bin in self.bins))
             f.write('\n]')
@@ -0,0 +1,146 @@
+# SecuML
+# Copyright (C) 2016-2019  ANSSI
+#
+# SecuML is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# SecuML is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with SecuML. If not, see <http://www.gnu.org/licenses/>.
+
+
+# Nested timing spans recorded while a profiler is active (see
+# start_profiling). The spans opened while no profiler is active are ignored,
+# so that the instrumented code can be run outside of active learning.
+
+from contextlib import contextmanager
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_profiler = None
+
+
+# Peak resident set size of the process in bytes since its start.
+# None when it is not available on the platform.
+def get_peak_rss():
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux.
+    if sys.platform == 'darwin':
+        return peak_rss
+    return peak_rss * 1024
+
+
+# peak_rss is only set for the root span of a profiler: ru_maxrss is the high
+# water mark of the process since its start, so it cannot be attributed to
+# the nested spans.
+class Span(object):
+
+    def __init__(self, name):
+        self.name = name
+        self.duration = None
+        self.peak_rss = None
+        self.children = []
+        self._start = time.perf_counter()
+
+    def end(self):
+        self.duration = time.perf_counter() - self._start
+
+    def to_json(self):
+        return {'name': self.name,
+                'duration': self.duration,
+                'peak_rss': self.peak_rss,
+                'children': [c.to_json() for c in self.children]}
+
+
+class Profiler(object):
+
+    def __init__(self, name):
+        self.root = Span(name)
+        self._stack = [self.root]
+
+    @contextmanager
+    def span(self, name):
+        span = Span(name)
+        self._stack[-1].children.append(span)
+        self._stack.append(span)
+        try:
+            yield span
+        finally:
+            span.end()
+            self._stack.pop()
+
+    # Attaches spans recorded by another profiler (e.g. in a worker process)
+    # to the current span.
+    def add_spans(self, spans):
+        self._stack[-1].children.extend(spans)
+
+    def end(self):
+        self.root.end()
+        self.root.peak_rss = get_peak_rss()
+
+    def get_duration(self):
+        return self.root.duration
+
+    def to_json(self):
+        return self.root.to_json()
+
+
+def is_active():
+    return _profiler is not None
+
+
+def start_profiling(name):
+    global _profiler
+    _profiler = Profiler(name)
+    return _profiler
+
+
+def stop_profiling():
+    global _profiler
+    profiler = _profiler
+    _profiler = None
+    if profiler is not None:
+        profiler.end()
+    return profiler
+
+
+@contextmanager
+def span(name):
+    if _profiler is None:
+        yield None
+    else:
+        with _profiler.span(name) as s:
+            yield s
+
+
+# Records the spans in a new profiler, e.g. in a worker process, and restores
+# the current profiler afterwards. The spans are then sent to the parent
+# process and attached with add_spans.
+@contextmanager
+def collect(name):
+    global _profiler
+    previous = _profiler
+    _profiler = Profiler(name)
+    try:
+        yield _profiler
+    finally:
+        _profiler.end()
+        _profiler = previous
+
+
+def add_spans(spans):
+    if _profiler is not None:
+        _profiler.add_spans(spans)
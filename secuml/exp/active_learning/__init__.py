@@ -83,6 +83,8 @@ class ActiveLearning(CoreActiveLearning):
         stop = False
         while not stop:
             stop = self.run_next_iter(output_dir)
+        if self.prev_iter is not None:
+            self.prev_iter.plot_monitoring()
         # Update the database. The active learning experiment is finished.
         query = self.exp.session.query(ActiveLearningExpAlchemy)
         query = query.filter(ActiveLearningExpAlchemy.id == self.exp.exp_id)
@@ -15,6 +15,7 @@
 # with SecuML. If not, see <http://www.gnu.org/licenses/>.
 
 from secuml.core.active_learning.datasets import Datasets as CoreDatasets
+from secuml.core.data import labels_tools
 
 from secuml.exp.data import annotations_db_tools
 from secuml.exp.data.export_instances import ExportInstances
@@ -25,43 +26,40 @@ class Datasets(CoreDatasets):
     # Users can update the annotation of previously annotated instances
     # with the predictions and errors analysis interfaces.
     def check_annotations_with_db(self, exp):
-        for instance_id in self.instances.annotations.get_annotated_ids():
-            label = self.instances.annotations.get_label(instance_id)
-            family = self.instances.annotations.get_family(instance_id)
-            annotations_conf = exp.exp_conf.annotations_conf
-            annotations_type = annotations_conf.annotations_type
-            annotations_id = annotations_conf.annotations_id
-            dataset_id = exp.exp_conf.dataset_conf.dataset_id
-            annotation = annotations_db_tools.get_annotation(exp.session,
-                                                             annotations_type,
-                                                             annotations_id,
-                                                             dataset_id,
-                                                             instance_id)
+        db_annotations = self._get_db_annotations(exp)
+        annotations = self.instances.annotations
+        for instance_id in annotations.get_annotated_ids():
+            annotation = db_annotations.get(instance_id)
             if annotation is None:
                 # The instance is not annotated anymore
                 self.update(instance_id, None, None)
             else:
                 DB_label, DB_family = annotation
-                if DB_label != label or DB_family != family:
+                label, family = annotations.get_label_family(instance_id)
+                if (DB_label != labels_tools.label_bool_to_str(label) or
+                        DB_family != family):
                     self.update(instance_id, DB_label, DB_family)
 
     # Users can annotate instances that have not been selected by the active
     # learning strategy with the test panel (predictions barplot).
     def check_new_annotations_with_db(self, exp):
+        db_annotations = self._get_db_annotations(exp)
         for instance_id in self.instances.annotations.get_unlabeled_ids():
-            annotations_conf = exp.exp_conf.annotations_conf
-            annotations_type = annotations_conf.annotations_type
-            annotations_id = annotations_conf.annotations_id
-            dataset_id = exp.exp_conf.dataset_conf.dataset_id
-            annotation = annotations_db_tools.get_annotation(exp.session,
-                                                             annotations_type,
-                                                             annotations_id,
-                                                             dataset_id,
-                                                             instance_id)
+            annotation = db_annotations.get(instance_id)
             if annotation is not None:
                 DB_label, DB_family = annotation
                 self.update(instance_id, DB_label, DB_family)
 
+    # All the annotations are fetched with a single query, and compared
+    # with the annotations in memory.
+    def _get_db_annotations(self, exp):
+        annotations_conf = exp.exp_conf.annotations_conf
+        return annotations_db_tools.get_annotations(
+                                    exp.session,
+                                    annotations_conf.annotations_type,
+                                    annotations_conf.annotations_id,
+                                    exp.exp_conf.dataset_conf.dataset_id)
+
     def save_annotations(self, output_filename, exp):
         instances = self.instances.get_annotated_instances()
         export_instances = ExportInstances(instances, exp,
@@ -18,12 +18,17 @@ import os
 import os.path as path
 
 from secuml.core.active_learning.iteration import Iteration as CoreIteration
+from secuml.core.active_learning.monitoring.suggestions_accuracy \
+    import SuggestionsAccuracy
+from secuml.core.tools import profiling
 from secuml.core.tools.color import display_in_green
 
 from secuml.exp.tools.db_tables import ActiveLearningExpAlchemy
 
 from . import strategies
 from .monitoring.exec_times import ExecutionTimesMonitoring
+from .monitoring.model_perf import ModelPerfEvolution
+from .monitoring.profiling import ProfilingMonitoring
 from .update_model import UpdateModel
 
 
@@ -57,7 +62,8 @@ class Iteration(CoreIteration):
     def update_model(self):
         self.update_model = UpdateModel(self)
         self.update_model.execute()
-        self.update_model.monitoring(self.al_dir, self.iteration_dir)
+        with profiling.span('model_perf_monitoring'):
+            self.update_model.monitoring(self.al_dir, self.iteration_dir)
 
     def generate_queries(self):
         # Update the iteration number in the DB.
@@ -69,7 +75,8 @@ class Iteration(CoreIteration):
         predictions = self.update_model.model_exp.get_predictions('test')
         CoreIteration.generate_queries(self, predictions)
         exp_db.annotations = True
-        self._exec_times_monitoring()
+        with profiling.span('exec_times_monitoring'):
+            self._exec_times_monitoring()
         if not self.conf.auto:
             print(display_in_green(
                     '\nAnnotation queries for iteration %d have been '
@@ -82,6 +89,18 @@ class Iteration(CoreIteration):
         self.exec_times_monitoring = ExecutionTimesMonitoring(self)
         self.exec_times_monitoring.export(self.al_dir, self.iteration_dir)
 
+    def export_profiling(self):
+        ProfilingMonitoring(self).export(self.al_dir, self.iteration_dir)
+
+    # The monitoring figures are rendered on demand by the web UI, and for the
+    # last iteration at the end of the experiment.
+    def plot_monitoring(self):
+        ExecutionTimesMonitoring.plot(self.al_dir, self.iteration_dir,
+                                      self.iter_num, eps=True)
+        ModelPerfEvolution.plot(self.al_dir, self.iteration_dir, self.iter_num)
+        SuggestionsAccuracy.plot(self.al_dir, self.iteration_dir,
+                                 self.iter_num)
+
     def answer_queries(self):
         if self.conf.auto:
             CoreIteration.answer_queries(self)
@@ -15,9 +15,11 @@
 # with SecuML. If not, see <http://www.gnu.org/licenses/>.
 
 import csv
-import matplotlib.pyplot as plt
 import os.path as path
-import pandas as pd
+
+from secuml.core.tools.plots.evolution import Evolution
+from secuml.core.tools.plots.evolution import get_evolution
+from secuml.core.tools.plots.evolution import plot_evolution
 
 
 class ExecutionTimesMonitoring(object):
@@ -28,11 +30,12 @@ class ExecutionTimesMonitoring(object):
     def generate(self):
         return
 
+    # The figure is rendered on demand (see ExecutionTimesMonitoring.plot).
     def export(self, al_dir, iter_dir):
         monitoring_dir, evolution_file = self._get_output_dirs(al_dir,
                                                                iter_dir)
         self._display_csv_line(evolution_file)
-        self._plot_evolution(evolution_file, monitoring_dir)
+        self._update_evolution(al_dir)
 
     def _display_csv_line(self, evolution_file):
         if self.iteration.iter_num == 1:
@@ -50,38 +53,34 @@ class ExecutionTimesMonitoring(object):
             csv_writer = csv.writer(f)
             csv_writer.writerow(header)
 
-    def _load_evolution(self, evolution_file):
-        with open(evolution_file, 'r') as f:
-            data = pd.read_csv(f, header=0, index_col=0)
-            return data
+    def _update_evolution(self, al_dir):
+        filename = ExecutionTimesMonitoring.get_evolution_file(al_dir)
+        evolution = get_evolution(filename, self.iteration.iter_num,
+                                  self._new_evolution)
+        evolution.add_iteration(self.iteration.iter_num,
+                                self.iteration.strategy.get_exec_times())
+        evolution.export(filename)
 
-    def _plot_evolution(self, evolution_file, monitoring_dir):
-        data = self._load_evolution(evolution_file)
-        iterations = list(range(1, self.iteration.iter_num + 1))
-        plt.clf()
-        max_value = data.max().max()
-        monitoring = self.iteration.strategy.get_exec_times_display()
-        header = self.iteration.strategy.get_exec_times_header()
-        for i, m in enumerate(monitoring):
-            label = header[i]
-            plt.plot(iterations, data[label],
-                     label=m.label,
-                     linestyle=m.linestyle,
-                     color=m.color, linewidth=m.linewidth, marker=m.marker)
-        plt.ylim(0, max_value)
-        plt.xlabel('Iteration')
-        plt.ylabel('Execution Time (seconds)')
-        lgd = plt.legend(bbox_to_anchor=(0., 1.02, 1., .102), loc=3,
-                         ncol=2, mode='expand', borderaxespad=0.,
-                         fontsize='large')
-        filename = path.join(monitoring_dir, 'execution_times.png')
-        plt.savefig(filename, bbox_extra_artists=(lgd,), bbox_inches='tight')
-        filename = path.join(monitoring_dir, 'execution_times.eps')
-        plt.savefig(filename, bbox_extra_artists=(lgd,), bbox_inches='tight',
-                    dpi=1000, format='eps')
-        plt.clf()
+    def _new_evolution(self):
+        strategy = self.iteration.strategy
+        header = strategy.get_exec_times_header()
+        evolution = Evolution(header, 'Execution Time (seconds)')
+        for column, display in zip(header,
+                                   strategy.get_exec_times_display()):
+            evolution.add_series(column, display)
+        return evolution
 
     def _get_output_dirs(self, al_dir, iteration_dir):
         monitoring_dir = iteration_dir
         evolution_file = path.join(al_dir, 'execution_times.csv')
         return monitoring_dir, evolution_file
+
+    @staticmethod
+    def get_evolution_file(al_dir):
+        return path.join(al_dir, 'execution_times.jsonl')
+
+    @staticmethod
+    def plot(al_dir, iteration_dir, iter_num, eps=False):
+        plot_evolution(ExecutionTimesMonitoring.get_evolution_file(al_dir),
+                       path.join(iteration_dir, 'execution_times.png'),
+                       iter_num, eps=eps)
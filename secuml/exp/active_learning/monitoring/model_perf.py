@@ -15,12 +15,15 @@
 # with SecuML. If not, see <http://www.gnu.org/licenses/>.
 
 import csv
-import matplotlib.pyplot as plt
 import os
 import os.path as path
-import pandas as pd
 
 from secuml.core.tools.plots.dataset import PlotDataset
+from secuml.core.tools.plots.evolution import Evolution
+from secuml.core.tools.plots.evolution import get_evolution
+from secuml.core.tools.plots.evolution import plot_evolution
+
+KINDS = ['train', 'cv', 'test', 'validation']
 
 
 class _ModelPerfEvolution(object):
@@ -39,10 +42,11 @@ class _ModelPerfEvolution(object):
     def generate(self):
         return
 
+    # The figure is rendered on demand (see _ModelPerfEvolution.plot).
     def export(self, monitoring_dir, evolution_dir):
         evolution_file = self.get_evol_file(evolution_dir)
         self.display_csv_line(evolution_file)
-        self.plot_evolution(evolution_file, monitoring_dir)
+        self.update_evolution(evolution_dir)
 
     def display_csv_line(self, evolution_file):
         if self.iter_num == 1:
@@ -60,40 +64,37 @@ class _ModelPerfEvolution(object):
             csv_writer = csv.writer(f)
             csv_writer.writerow(header)
 
-    def load_evolution(self, evolution_file):
-        with open(evolution_file, 'r') as f:
-            data = pd.read_csv(f, header=0, index_col=0)
-            return data
-
-    def plot_evolution(self, evolution_file, monitoring_dir):
-        data = self.load_evolution(evolution_file)
+    def update_evolution(self, evolution_dir):
+        filename = _ModelPerfEvolution.get_evolution_file(evolution_dir,
+                                                          self.kind)
+        evolution = get_evolution(filename, self.iter_num,
+                                  self.new_evolution)
+        evolution.add_iteration(self.iter_num,
+                                self.perf_indicators.get_csv_line())
+        evolution.export(filename)
+
+    def new_evolution(self):
+        evolution = Evolution(self.perf_indicators.get_csv_header(),
+                              'Performance', ymax=1, legend_ncol=3)
         if self.multiclass:
-            self.plot_perf_evolution(['accuracy'], 'accuracy', data,
-                                     monitoring_dir)
-            # self.plot_perf_evolution(['f1-micro', 'f1-macro'],
-            #                           'f_micro_macro', data, monitoring_dir)
+            estimators = ['accuracy']
         else:
-            self.plot_perf_evolution(['auc'], 'auc', data, monitoring_dir)
-            # self.plot_perf_evolution(['fscore', 'precision', 'recall'],
-            #                          'fscore', data, monitoring_dir)
-
-    def plot_perf_evolution(self, estimators, output_filename, data,
-                            output_dir):
-        iterations = list(range(1, self.iter_num + 1))
-        plt.clf()
+            estimators = ['auc']
         for estimator in estimators:
-            plot = PlotDataset(data[estimator], estimator)
-            plt.plot(iterations, plot.values, label=plot.label,
-                     color=plot.color, linewidth=plot.linewidth,
-                     marker=plot.marker)
-        plt.ylim(0, 1)
-        plt.xlabel('Iteration')
-        plt.ylabel('Performance')
-        lgd = plt.legend(bbox_to_anchor=(0., 1.02, 1., .102), loc=3, ncol=3,
-                         mode='expand', borderaxespad=0., fontsize='large')
-        filename = path.join(output_dir, '%s.png' % self.kind)
-        plt.savefig(filename, bbox_extra_artists=(lgd,), bbox_inches='tight')
-        plt.clf()
+            evolution.add_series(estimator, PlotDataset(None, estimator))
+        return evolution
+
+    @staticmethod
+    def get_evolution_file(evolution_dir, kind):
+        return path.join(evolution_dir, '%s_perf_monitoring.jsonl' % kind)
+
+    @staticmethod
+    def plot(al_dir, iteration_dir, iter_num, kind):
+        evolution_file = _ModelPerfEvolution.get_evolution_file(
+                                        path.join(al_dir, 'model_perf'), kind)
+        plot_evolution(evolution_file,
+                       path.join(iteration_dir, 'model_perf', '%s.png' % kind),
+                       iter_num)
 
 
 class ModelPerfEvolution(object):
@@ -131,6 +132,15 @@ class ModelPerfEvolution(object):
         for _, monitoring in self.monitorings.items():
             monitoring.export(monitoring_dir, evolution_dir)
 
+    # kind: None to plot all the kinds of performance
+    @staticmethod
+    def plot(al_dir, iteration_dir, iter_num, kind=None):
+        kinds = KINDS if kind is None else [kind]
+        for kind in kinds:
+            if kind in KINDS:
+                _ModelPerfEvolution.plot(al_dir, iteration_dir, iter_num,
+                                         kind)
+
     def _get_output_dirs(self, iteration_dir, al_dir):
         monitoring_dir = self._get_monitoring_dir(iteration_dir)
         evolution_dir = self._get_evoluation_dir(al_dir)
@@ -0,0 +1,58 @@
+# SecuML
+# Copyright (C) 2016-2019  ANSSI
+#
+# SecuML is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# SecuML is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with SecuML. If not, see <http://www.gnu.org/licenses/>.
+
+
+import csv
+import json
+import os.path as path
+
+# Top level spans of an iteration (see core.active_learning.Iteration.run).
+PHASES = ['init_computations', 'update_model', 'generate_queries',
+          'answer_queries']
+
+
+class ProfilingMonitoring(object):
+
+    def __init__(self, iteration):
+        self.iteration = iteration
+        self.profiler = iteration.profiler
+
+    # The nested spans are exported in the iteration directory, and the
+    # durations of the top level spans are appended to a CSV file.
+    def export(self, al_dir, iter_dir):
+        with open(ProfilingMonitoring.get_json_file(iter_dir), 'w') as f:
+            json.dump(self.profiler.to_json(), f, indent=2)
+        self._display_csv_line(path.join(al_dir, 'profiling.csv'))
+
+    def _display_csv_line(self, filename):
+        root = self.profiler.root
+        durations = {s.name: s.duration for s in root.children}
+        header = ['iteration', 'total']
+        header.extend(PHASES)
+        header.append('peak_rss')
+        v = [self.iteration.iter_num, root.duration]
+        v.extend([durations.get(phase, 0) for phase in PHASES])
+        v.append(root.peak_rss)
+        mode = 'w' if self.iteration.iter_num == 1 else 'a'
+        with open(filename, mode) as f:
+            csv_writer = csv.writer(f)
+            if mode == 'w':
+                csv_writer.writerow(header)
+            csv_writer.writerow(v)
+
+    @staticmethod
+    def get_json_file(iter_dir):
+        return path.join(iter_dir, 'profiling.json')
@@ -39,11 +39,28 @@ class UpdateModel(CoreUpdateModel):
                               self.model_conf, name=name,
                               parent=self.exp.exp_id)
         self.model_exp = DiademExp(exp_conf, session=self.exp.session)
+        tune_hyperparam, init_classifier = self._get_model_update()
         self.model_exp.run(instances=self.iteration.datasets.instances,
-                           cv_monitoring=True)
+                           cv_monitoring=True,
+                           tune_hyperparam=tune_hyperparam,
+                           init_classifier=init_classifier)
         self._set_exec_time()
         self.classifier = self.model_exp.get_train_exp().classifier
 
+    # The hyperparameters are optimized every retune_every iterations.
+    # In-between, the previous hyperparameters are used, and the model is
+    # warm-started from the model of the previous iteration if warm_start.
+    def _get_model_update(self):
+        conf = self.iteration.conf
+        prev_iter = self.iteration.prev_iter
+        if (prev_iter is None or
+                (self.iteration.iter_num - 1) % conf.retune_every == 0):
+            return True, None
+        init_classifier = None
+        if conf.warm_start:
+            init_classifier = prev_iter.update_model.classifier
+        return False, init_classifier
+
     def _set_exec_time(self):
         training = self.model_exp.get_train_exp().monitoring
         training_detect = self.model_exp.get_detection_exp('train').monitoring
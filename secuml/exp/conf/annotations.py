@@ -33,6 +33,9 @@ class AnnotationsConf(Conf):
         self.annotations_filename = annotations_filename
         self.annotations_id = None
         self.annotations_type = None
+        # Id of the dataset for which the annotations have been loaded by an
+        # experiment. It is not exported.
+        self.loaded_dataset_id = None
         if annotations_id is not None:
             self.set_annotations_id(annotations_id)
         else:
@@ -50,6 +53,9 @@ class AnnotationsConf(Conf):
         self.annotations_id = annotations_id
         self.annotations_type = annotations_type
 
+    def set_loaded_dataset_id(self, dataset_id):
+        self.loaded_dataset_id = dataset_id
+
     def set_annotations_filename(self, annotations_filename):
         self.annotations_filename = annotations_filename
         self.set_annotations_type()
@@ -28,6 +28,10 @@ class DatasetConf(Conf):
         self.dataset = dataset
         self.dataset_id = None
         self.has_ground_truth = None
+        # Set once the dataset has been checked and loaded by an experiment.
+        # The child experiments sharing the configuration do not load it
+        # again. It is not exported.
+        self.loaded = False
 
     def input_dir(self, secuml_conf):
         return os.path.join(secuml_conf.input_data_dir, self.project,
@@ -43,6 +47,9 @@ class DatasetConf(Conf):
     def set_has_ground_truth(self, has_ground_truth):
         self.has_ground_truth = has_ground_truth
 
+    def set_loaded(self):
+        self.loaded = True
+
     def fields_to_export(self):
         return [('project', exportFieldMethod.primitive),
                 ('dataset', exportFieldMethod.primitive),
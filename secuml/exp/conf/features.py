@@ -38,6 +38,10 @@ class FeaturesConf(Conf):
         self.set_id = None
         self.files = None
         self.info = None
+        # Id of the dataset for which the features have been loaded by an
+        # experiment. The child experiments sharing the configuration reuse
+        # the set id, the files and their masks. It is not exported.
+        self.loaded_dataset_id = None
 
     def set_input_type(self, input_type):
         self.input_type = input_type
@@ -51,6 +55,9 @@ class FeaturesConf(Conf):
     def set_files(self, files):
         self.files = files
 
+    def set_loaded_dataset_id(self, dataset_id):
+        self.loaded_dataset_id = dataset_id
+
     def fields_to_export(self):
         return [('input_features', exportFieldMethod.primitive),
                 ('input_type', exportFieldMethod.enum_value),
@@ -20,9 +20,12 @@ import yaml
 
 from secuml.core.tools.logging import close_logger, get_logger
 from secuml.exp.tools.db_tables import Base
+from secuml.exp.tools.db_tables import create_missing_indexes
 from secuml.exp.tools.db_tables import call_specific_db_func
 from secuml.exp.tools.exp_exceptions import SecuMLexpException
 
+HASH_ALGORITHMS = ['md5', 'blake2b']
+
 
 class SecumlConfMissing(SecuMLexpException):
 
@@ -50,6 +53,16 @@ class WrongDatabase(SecuMLexpException):
                'postgresql://<user>:<password>@<host>/<db_name>"')
 
 
+class InvalidHashAlgorithm(SecuMLexpException):
+
+    def __init__(self, hash_algorithm):
+        self.hash_algorithm = hash_algorithm
+
+    def __str__(self):
+        return ('Invalid hash_algorithm %s. Available algorithms: %s.'
+                % (self.hash_algorithm, ', '.join(HASH_ALGORITHMS)))
+
+
 class SecuMLConf(object):
 
     def __init__(self, conf_filename):
@@ -64,10 +77,13 @@ class SecuMLConf(object):
             self.set_db_uri(cfg['db_uri'])
             self._set_logger(cfg)
             self._set_host_port(cfg)
+            self._set_server_conf(cfg)
+            self._set_hash_algorithm(cfg)
 
     def _set_session(self):
         self.engine = self.get_engine()
         Base.metadata.create_all(self.engine)
+        create_missing_indexes(self.engine, self.logger)
         self.Session = sessionmaker(bind=self.engine)
 
     def _set_logger(self, cfg):
@@ -88,6 +104,24 @@ class SecuMLConf(object):
         if 'port' in cfg:
             self.port = int(cfg['port'])
 
+    # Parameters of the production web server (SecuML_server --production)
+    def _set_server_conf(self, cfg):
+        self.server_workers = int(cfg.get('server_workers', 4))
+        self.server_threads = int(cfg.get('server_threads', 4))
+        # seconds
+        self.server_timeout = int(cfg.get('server_timeout', 120))
+        self.db_pool_size = int(cfg.get('db_pool_size', 5))
+        self.db_pool_timeout = int(cfg.get('db_pool_timeout', 30))
+        self.db_pool_recycle = int(cfg.get('db_pool_recycle', 3600))
+
+    # Hash algorithm of the input files of the datasets loaded from now on.
+    # The datasets already loaded are checked with the algorithm of their
+    # stored hashes.
+    def _set_hash_algorithm(self, cfg):
+        self.hash_algorithm = cfg.get('hash_algorithm', 'md5')
+        if self.hash_algorithm not in HASH_ALGORITHMS:
+            raise InvalidHashAlgorithm(self.hash_algorithm)
+
     def close_log_handler(self):
         close_logger(self.logger, self.log_handler)
 
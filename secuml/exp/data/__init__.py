@@ -26,12 +26,26 @@ def get_dataset_ids(session, dataset_id):
     return [r.id for r in query.all()]
 
 
+# The blake2b digests are 15 bytes long so that the algorithm of a hash stored
+# in the database can be identified from its length (the hexadecimal md5
+# digests have 32 characters).
+BLAKE2B_DIGEST_SIZE = 15
+
+
+def get_hash_kind(file_hash):
+    if len(file_hash) == 2 * BLAKE2B_DIGEST_SIZE:
+        return 'blake2b'
+    return 'md5'
+
+
 def compute_hash(filename, kind='md5'):
-    BLOCKSIZE = 65536
+    BLOCKSIZE = 1 << 20
     if kind == 'md5':
         hasher = hashlib.md5()
     elif kind == 'sha1':
         hasher = hashlib.sha1()
+    elif kind == 'blake2b':
+        hasher = hashlib.blake2b(digest_size=BLAKE2B_DIGEST_SIZE)
     else:
         assert(False)
     with open(filename, 'rb') as f:
@@ -31,6 +31,9 @@ class Annotations(object):
         self.session = session
 
     def load(self):
+        dataset_id = self.dataset_conf.dataset_id
+        if self.annotations_conf.loaded_dataset_id == dataset_id:
+            return
         annotations_id = self.annotations_conf.annotations_id
         annotations_type = self.annotations_conf.annotations_type
         filename = self.annotations_conf.annotations_filename
@@ -42,6 +45,7 @@ class Annotations(object):
             annotations_type = self.get_annotations_type(annotations_id)
         self.annotations_conf.set_exp_annotations(annotations_id,
                                                   annotations_type)
+        self.annotations_conf.set_loaded_dataset_id(dataset_id)
 
     def add_exp_annotations_in_db(self):
         annotations_type = self.annotations_conf.annotations_type
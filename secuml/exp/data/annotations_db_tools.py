@@ -34,6 +34,23 @@ def get_annotation(session, annotations_type, annotations_id, dataset_id,
         return None
 
 
+def get_annotations(session, annotations_type, annotations_id, dataset_id):
+    if annotations_type == AnnotationsTypes.partial:
+        query = session.query(AnnotationsAlchemy.instance_id,
+                              AnnotationsAlchemy.label,
+                              AnnotationsAlchemy.family)
+        query = query.filter(AnnotationsAlchemy.annotations_id ==
+                             annotations_id)
+    elif annotations_type == AnnotationsTypes.ground_truth:
+        query = session.query(GroundTruthAlchemy.instance_id,
+                              GroundTruthAlchemy.label,
+                              GroundTruthAlchemy.family)
+        query = query.filter(GroundTruthAlchemy.dataset_id == dataset_id)
+    else:
+        return {}
+    return {r.instance_id: (r.label, r.family) for r in query.all()}
+
+
 def get_instance_partial_annotation_row(session, annotations_id, instance_id):
     query = session.query(AnnotationsAlchemy)
     query = query.filter(AnnotationsAlchemy.annotations_id == annotations_id)
@@ -19,6 +19,12 @@ from .load_features import LoadFeatures
 from .project_dataset import ProjectDataset
 
 
+# The dataset, the annotations and the features are checked and loaded only
+# once per configuration object. The child experiments share the
+# configurations of their parent (e.g. the train and detection experiments of
+# DIADEM, or the DIADEM experiments of each active learning iteration), so
+# they reuse the ids, the features files and their masks set by the first
+# load.
 class Dataset(object):
 
     def __init__(self, exp_conf, session):
@@ -14,7 +14,6 @@
 # You should have received a copy of the GNU General Public License along
 # with SecuML. If not, see <http://www.gnu.org/licenses/>.
 
-import csv
 import numpy as np
 
 from secuml.core.data.features import Features
@@ -22,6 +21,9 @@ from secuml.core.data.ids import Ids
 from secuml.exp.data import get_dataset_ids
 from secuml.exp.tools.db_tables import InstancesAlchemy
 
+from .features_cache import get_cache_paths
+from .features_cache import load_matrix
+
 
 class FeaturesFromExp(Features):
 
@@ -29,25 +31,32 @@ class FeaturesFromExp(Features):
         if instance_ids is None:
             dataset_id = exp.exp_conf.dataset_conf.dataset_id
             instance_ids = Ids(get_dataset_ids(exp.session, dataset_id))
-        values = FeaturesFromExp.get_matrix(exp.exp_conf.features_conf.files)
-        Features.__init__(self, values, exp.exp_conf.features_conf.info,
-                          instance_ids)
+        features_conf = exp.exp_conf.features_conf
+        cache_paths = FeaturesFromExp._get_cache_paths(exp)
+        values = FeaturesFromExp.get_matrix(features_conf.files,
+                                            cache_paths=cache_paths)
+        Features.__init__(self, values, features_conf.info, instance_ids)
+
+    @staticmethod
+    def _get_cache_paths(exp):
+        return get_cache_paths(exp.session, exp.exp_conf.secuml_conf,
+                               exp.exp_conf.dataset_conf,
+                               exp.exp_conf.features_conf.files)
 
     @staticmethod
-    def get_matrix(features_files):
+    def get_matrix(features_files, cache_paths=None):
+        if cache_paths is None:
+            cache_paths = [None for _ in features_files]
         features = None
-        for _, f_path, f_mask in features_files:
-            with open(f_path, 'r') as f:
-                f.readline()  # skip header
-                reader = csv.reader(f, quoting=csv.QUOTE_NONNUMERIC)
-                matrix = list(list(rec) for rec in reader)
-                matrix = np.array([l[1:] for l in matrix])
-                if f_mask is not None:
-                    matrix = matrix[:, f_mask]
-                if features is None:
-                    features = matrix
-                else:
-                    features = np.hstack((features, matrix))
+        for (_, f_path, f_mask), cache_path in zip(features_files,
+                                                   cache_paths):
+            matrix = load_matrix(f_path, cache_path=cache_path)
+            if f_mask is not None:
+                matrix = matrix[:, f_mask]
+            if features is None:
+                features = matrix
+            else:
+                features = np.hstack((features, matrix))
         return features
 
     @staticmethod
@@ -57,20 +66,15 @@ class FeaturesFromExp(Features):
         query = query.filter(InstancesAlchemy.dataset_id == dataset_id)
         query = query.filter(InstancesAlchemy.id == instance_id)
         row_number = query.one().row_number
-        values = []
         features_conf = exp.exp_conf.features_conf
-        for _, f_path, f_mask in features_conf.files:
-            line = 1
-            with open(f_path, 'r') as f_file:
-                next(f_file)  # skip header
-                while line < row_number:
-                    next(f_file)
-                    line = line + 1
-                row = next(f_file).rstrip(),
-                features_reader = csv.reader(row)
-                v = np.array(next(features_reader)[1:])
-                if f_mask is not None:
-                    v = v[f_mask]
-                values = np.hstack((values, v))
+        cache_paths = FeaturesFromExp._get_cache_paths(exp)
+        values = []
+        for (_, f_path, f_mask), cache_path in zip(features_conf.files,
+                                                   cache_paths):
+            # row_number starts at 1.
+            v = load_matrix(f_path, cache_path=cache_path)[row_number - 1]
+            if f_mask is not None:
+                v = v[f_mask]
+            values = np.hstack((values, v))
         values = [float(x) for x in values]
         return features_conf.info.names, values
@@ -0,0 +1,102 @@
+# SecuML
+# Copyright (C) 2016-2019  ANSSI
+#
+# SecuML is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# SecuML is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with SecuML. If not, see <http://www.gnu.org/licenses/>.
+
+# The features CSV files are converted once into binary .npy files stored in
+# the output directory of the dataset. The cached files are named after the
+# hash of the CSV file stored in the DB (FeaturesFilesAlchemy.hash), and they
+# are opened with memory mapping. The experiments working on the same
+# features share the same pages.
+
+import csv
+import numpy as np
+import os
+
+from secuml.exp.tools.db_tables import FeaturesFilesAlchemy
+
+CHUNK_SIZE = 10000
+
+
+def get_cache_dir(secuml_conf, dataset_conf):
+    return os.path.join(dataset_conf.output_dir(secuml_conf),
+                        'features_cache')
+
+
+def get_cache_path(secuml_conf, dataset_conf, file_hash):
+    return os.path.join(get_cache_dir(secuml_conf, dataset_conf),
+                        '%s.npy' % file_hash)
+
+
+def get_cache_paths(session, secuml_conf, dataset_conf, features_files):
+    files_ids = [f_id for f_id, _, _ in features_files]
+    query = session.query(FeaturesFilesAlchemy)
+    query = query.filter(FeaturesFilesAlchemy.id.in_(files_ids))
+    hashes = {r.id: r.hash for r in query.all()}
+    return [get_cache_path(secuml_conf, dataset_conf, hashes[f_id])
+            for f_id in files_ids]
+
+
+def read_csv(f_path):
+    with open(f_path, 'r') as f:
+        f.readline()  # skip header
+        reader = csv.reader(f, quoting=csv.QUOTE_NONNUMERIC)
+        return np.array([rec[1:] for rec in reader])
+
+
+def read_csv_chunks(f_path, chunk_size=CHUNK_SIZE):
+    with open(f_path, 'r') as f:
+        f.readline()  # skip header
+        reader = csv.reader(f, quoting=csv.QUOTE_NONNUMERIC)
+        chunk = []
+        for rec in reader:
+            chunk.append(rec[1:])
+            if len(chunk) == chunk_size:
+                yield np.array(chunk)
+                chunk = []
+        if chunk:
+            yield np.array(chunk)
+
+
+def get_csv_shape(f_path):
+    with open(f_path, 'r') as f:
+        num_features = len(next(csv.reader(f))) - 1
+        num_instances = sum(1 for _ in f)
+    return num_instances, num_features
+
+
+def write_cache(f_path, cache_path):
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    # Several experiments may create the same cache file concurrently:
+    # the file is written under a temporary name and then atomically renamed.
+    tmp_path = '%s.%d.tmp' % (cache_path, os.getpid())
+    # The CSV file is converted chunk by chunk to avoid holding the whole
+    # matrix in memory.
+    matrix = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=np.float64,
+                                       shape=get_csv_shape(f_path))
+    start = 0
+    for chunk in read_csv_chunks(f_path):
+        matrix[start:start + chunk.shape[0]] = chunk
+        start += chunk.shape[0]
+    matrix.flush()
+    del matrix
+    os.replace(tmp_path, cache_path)
+
+
+def load_matrix(f_path, cache_path=None):
+    if cache_path is None:
+        return read_csv(f_path)
+    if not os.path.isfile(cache_path):
+        write_cache(f_path, cache_path)
+    return np.load(cache_path, mmap_mode='r')
@@ -16,7 +16,8 @@
 
 import os.path as path
 
-from . import compute_hash
+from .hashes_cache import get_file_hash
+from .hashes_cache import is_unchanged
 from secuml.exp.tools.db_tables import call_specific_db_func
 from secuml.exp.tools.db_tables import DatasetsAlchemy
 from secuml.exp.tools.exp_exceptions import UpdatedFile
@@ -32,7 +33,7 @@ class GroundTruth(object):
         self.exists = None
 
     def load(self):
-        filepath, _ = self.get_filepath_hash()
+        filepath = self.get_filepath()
         self.exists = filepath is not None
         if not self.exists:
             return
@@ -46,7 +47,7 @@ class GroundTruth(object):
                                         filepath))
 
     def check(self):
-        filepath, curr_hash = self.get_filepath_hash()
+        filepath = self.get_filepath()
         self.exists = filepath is not None
         if not self.exists:
             self.secuml_conf.logger.warning('No ground-truth available for '
@@ -59,12 +60,21 @@ class GroundTruth(object):
         query = query.filter(DatasetsAlchemy.id == dataset_id)
         res = query.one()
         ground_truth_hash = res.ground_truth_hash
-        if ground_truth_hash != curr_hash:
+        if (ground_truth_hash is None or
+                not is_unchanged(self.secuml_conf, self.dataset_conf,
+                                 filepath, ground_truth_hash)):
             raise UpdatedFile(filepath, self.dataset_conf.dataset)
 
-    def get_filepath_hash(self):
+    def get_filepath(self):
         input_dir = self.dataset_conf.input_dir(self.secuml_conf)
         filepath = path.join(input_dir, 'annotations', 'ground_truth.csv')
         if not path.isfile(filepath):
+            return None
+        return filepath
+
+    def get_filepath_hash(self):
+        filepath = self.get_filepath()
+        if filepath is None:
             return None, None
-        return filepath, compute_hash(filepath)
+        return filepath, get_file_hash(self.secuml_conf, self.dataset_conf,
+                                       filepath)
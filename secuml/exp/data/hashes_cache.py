@@ -0,0 +1,85 @@
+# SecuML
+# Copyright (C) 2016-2019  ANSSI
+#
+# SecuML is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# SecuML is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with SecuML. If not, see <http://www.gnu.org/licenses/>.
+
+
+# The hashes of the input files are stored in a JSON file in the output
+# directory of the dataset, along with the size, the modification time and the
+# inode of the files when they were hashed. A file is hashed again only if one
+# of these values has changed.
+# Several experiments may update the file concurrently: it is written under a
+# temporary name and then atomically renamed. A lost update only causes a file
+# to be hashed again.
+
+import json
+import os
+
+from . import compute_hash
+from . import get_hash_kind
+
+HASHES_FILE = 'files_hashes.json'
+
+
+def get_hashes_filename(secuml_conf, dataset_conf):
+    return os.path.join(dataset_conf.output_dir(secuml_conf), HASHES_FILE)
+
+
+def _get_stats(filepath):
+    stats = os.stat(filepath)
+    return [stats.st_size, stats.st_mtime_ns, stats.st_ino]
+
+
+def _read_hashes(hashes_filename):
+    try:
+        with open(hashes_filename, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def _write_hashes(hashes_filename, hashes):
+    os.makedirs(os.path.dirname(hashes_filename), exist_ok=True)
+    tmp_filename = '%s.%d.tmp' % (hashes_filename, os.getpid())
+    with open(tmp_filename, 'w') as f:
+        json.dump(hashes, f, indent=2)
+    os.replace(tmp_filename, hashes_filename)
+
+
+# kind: hash algorithm. By default, the one set in the SecuML configuration.
+def get_file_hash(secuml_conf, dataset_conf, filepath, kind=None):
+    if kind is None:
+        kind = secuml_conf.hash_algorithm
+    hashes_filename = get_hashes_filename(secuml_conf, dataset_conf)
+    hashes = _read_hashes(hashes_filename)
+    # The stats are read before the file so that a concurrent update
+    # invalidates the entry.
+    stats = _get_stats(filepath)
+    entry = hashes.get(filepath)
+    if entry is None or entry['stats'] != stats:
+        entry = {'stats': stats, 'hashes': {}}
+    elif kind in entry['hashes']:
+        return entry['hashes'][kind]
+    file_hash = compute_hash(filepath, kind=kind)
+    entry['hashes'][kind] = file_hash
+    hashes[filepath] = entry
+    _write_hashes(hashes_filename, hashes)
+    return file_hash
+
+
+# The file is hashed with the algorithm of the hash stored in the database.
+def is_unchanged(secuml_conf, dataset_conf, filepath, stored_hash):
+    curr_hash = get_file_hash(secuml_conf, dataset_conf, filepath,
+                              kind=get_hash_kind(stored_hash))
+    return curr_hash == stored_hash
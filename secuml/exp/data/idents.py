@@ -16,7 +16,8 @@
 
 import os.path as path
 
-from . import compute_hash
+from .hashes_cache import get_file_hash
+from .hashes_cache import is_unchanged
 from secuml.exp.tools.db_tables import DatasetsAlchemy
 from secuml.exp.tools.db_tables import call_specific_db_func
 from secuml.exp.tools.exp_exceptions import SecuMLexpException
@@ -41,7 +42,7 @@ class Idents(object):
         self.cursor = cursor
 
     def load(self):
-        filepath, _ = self.get_filepath_hash()
+        filepath = self.get_filepath()
         call_specific_db_func(self.secuml_conf.db_type, 'load_idents',
                               (self.cursor, filepath,
                                self.dataset_conf.dataset_id))
@@ -52,17 +53,23 @@ class Idents(object):
                                         filepath))
 
     def check(self):
-        filepath, curr_idents_hash = self.get_filepath_hash()
+        filepath = self.get_filepath()
         dataset_id = self.dataset_conf.dataset_id
         query = self.session.query(DatasetsAlchemy)
         query = query.filter(DatasetsAlchemy.id == dataset_id)
         idents_hash = query.one().idents_hash
-        if idents_hash != curr_idents_hash:
+        if not is_unchanged(self.secuml_conf, self.dataset_conf, filepath,
+                            idents_hash):
             raise UpdatedFile(filepath, self.dataset_conf.dataset)
 
-    def get_filepath_hash(self):
+    def get_filepath(self):
         input_dir = self.dataset_conf.input_dir(self.secuml_conf)
         filepath = path.join(input_dir, 'idents.csv')
         if not path.isfile(filepath):
             raise IdentsFileNotFound(filepath)
-        return filepath, compute_hash(filepath)
+        return filepath
+
+    def get_filepath_hash(self):
+        filepath = self.get_filepath()
+        return filepath, get_file_hash(self.secuml_conf, self.dataset_conf,
+                                       filepath)
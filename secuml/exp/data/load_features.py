@@ -15,6 +15,7 @@
 # with SecuML. If not, see <http://www.gnu.org/licenses/>.
 
 import csv
+import numpy as np
 import os
 import pandas as pd
 from sqlalchemy.orm.exc import NoResultFound
@@ -29,8 +30,11 @@ from secuml.exp.tools.exp_exceptions import SecuMLexpException
 from secuml.exp.tools.exp_exceptions import UpdatedDirectory
 from secuml.exp.tools.exp_exceptions import UpdatedFile
 
-from . import compute_hash
-from .features import FeaturesFromExp
+from .features_cache import CHUNK_SIZE
+from .features_cache import get_cache_path
+from .features_cache import write_cache
+from .hashes_cache import get_file_hash
+from .hashes_cache import is_unchanged
 
 
 class FeaturesNotFound(SecuMLexpException):
@@ -62,6 +66,9 @@ class LoadFeatures(object):
         self.session = session
 
     def load(self):
+        dataset_id = self.dataset_conf.dataset_id
+        if self.features_conf.loaded_dataset_id == dataset_id:
+            return
         dataset_dir = self.dataset_conf.input_dir(self.secuml_conf)
         self.input_path = os.path.join(dataset_dir, 'features',
                                        self.features_conf.input_features)
@@ -71,6 +78,7 @@ class LoadFeatures(object):
             self._load_features_files(set_id, input_type)
         self.session.flush()
         self._set_features_conf(set_id, input_type)
+        self.features_conf.set_loaded_dataset_id(dataset_id)
 
     def _set_features_conf(self, set_id, input_type):
         self.features_conf.set_set_id(set_id)
@@ -145,17 +153,21 @@ class LoadFeatures(object):
             self._load_features_file(set_id, file_path, filename)
 
     def _load_features_file(self, set_id, file_path, filename):
-        file_hash = compute_hash(file_path)
+        file_hash = get_file_hash(self.secuml_conf, self.dataset_conf,
+                                  file_path)
         features_file = FeaturesFilesAlchemy(set_id=set_id, filename=filename,
                                              path=file_path, hash=file_hash)
         self.session.add(features_file)
         self.session.flush()
-        self._load_features(set_id, features_file.id, file_path)
+        cache_path = get_cache_path(self.secuml_conf, self.dataset_conf,
+                                    file_hash)
+        write_cache(file_path, cache_path)
+        self._load_features(set_id, features_file.id, file_path, cache_path)
 
-    def _load_features(self, set_id, file_id, file_path):
+    def _load_features(self, set_id, file_id, file_path, cache_path):
         user_ids = self._get_user_ids(file_path)
         names, descrips = self._get_names_descr(file_path, user_ids)
-        types = self._get_types(file_path)
+        types = self._get_types(file_path, cache_path)
         for u_id, name, desc, type_ in zip(user_ids, names, descrips, types):
             feature = FeaturesAlchemy(user_id=u_id, file_id=file_id,
                                       set_id=set_id, name=name,
@@ -191,17 +203,23 @@ class LoadFeatures(object):
             descriptions = user_ids
         return names, descriptions
 
-    def _get_types(self, file_path):
-        features = FeaturesFromExp.get_matrix([(None, file_path, None)])
-        num_features = features.shape[1]
-        types = [None for _ in range(num_features)]
-        for i in range(num_features):
-            values = features[:, i]
-            if all(v in [0, 1] for v in values):
-                types[i] = FeatureType.binary
-            else:
-                types[i] = FeatureType.numeric
-        return types
+    def _get_types(self, file_path, cache_path):
+        # The types are inferred chunk by chunk from the memory-mapped cache
+        # to avoid loading the whole matrix in memory.
+        features = np.load(cache_path, mmap_mode='r')
+        num_instances, num_features = features.shape
+        binary = np.ones(num_features, dtype=bool)
+        nan_count = np.zeros(num_features, dtype=int)
+        for start in range(0, num_instances, CHUNK_SIZE):
+            chunk = np.asarray(features[start:start + CHUNK_SIZE])
+            binary &= np.all((chunk == 0) | (chunk == 1), axis=0)
+            nan_count += np.isnan(chunk).sum(axis=0)
+        if nan_count.any():
+            self.secuml_conf.logger.warning(
+                    '%s: %i features contain missing values.'
+                    % (file_path, np.count_nonzero(nan_count)))
+        return [FeatureType.binary if b else FeatureType.numeric
+                for b in binary]
 
     def _check(self):
         input_type = self._check_path_exists()
@@ -247,6 +265,6 @@ class LoadFeatures(object):
             features_path = self.input_path
         for filename in files:
             file_path = os.path.join(features_path, filename)
-            file_hash = compute_hash(file_path)
-            if file_hash != db_files[filename]:
+            if not is_unchanged(self.secuml_conf, self.dataset_conf,
+                                file_path, db_files[filename]):
                 raise UpdatedFile(file_path, self.dataset_conf.dataset)
@@ -115,8 +115,11 @@ class ProjectDataset(object):
         self.cursor = self.raw_connection.cursor()
 
     def load(self):
+        if self.dataset_conf.loaded:
+            return
         self._check_input_dataset_dir()
         self._set_dataset_id()
+        self.dataset_conf.set_loaded()
 
     def _check_input_dataset_dir(self):
         # Check project directory
@@ -15,9 +15,11 @@
 # with SecuML. If not, see <http://www.gnu.org/licenses/>.
 
 import os.path as path
+from sklearn.externals import joblib
 from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy.sql.expression import null
 
+from secuml.core.tools import profiling
 from secuml.exp import experiment
 from secuml.exp.conf.annotations import AnnotationsConf
 from secuml.exp.conf.dataset import DatasetConf
@@ -93,6 +95,25 @@ def add_diadem_exp_to_db(session, exp_id, fold_id, kind, alerts_conf=None,
     session.flush()
 
 
+# Executed in the worker processes (see DiademExp._train_test_folds).
+# The DB session cannot be shared: only core objects are exchanged.
+# When profile is True, the spans recorded by the worker are returned too.
+def _train_test_fold(classifier_conf, datasets, fold_id, profile):
+    if not profile:
+        return _train_test_fold_core(classifier_conf, datasets), None
+    with profiling.collect('fold_%d' % fold_id) as profiler:
+        fold_result = _train_test_fold_core(classifier_conf, datasets)
+    return fold_result, profiler.root
+
+
+def _train_test_fold_core(classifier_conf, datasets):
+    classifier = classifier_conf.model_class(classifier_conf)
+    _, train_time = classifier.training(datasets.train_instances)
+    train_predictions = classifier.testing(datasets.train_instances)
+    test_predictions = classifier.testing(datasets.test_instances)
+    return classifier, train_time, train_predictions, test_predictions
+
+
 def _get_exp_row(session, exp_id):
     query = session.query(ExpAlchemy)
     query = query.filter(ExpAlchemy.id == exp_id)
@@ -110,13 +131,20 @@ class DiademExp(Experiment):
         self.validation_conf = self.exp_conf.core_conf.validation_conf
         self._init_children_exps()
 
-    def run(self, instances=None, cv_monitoring=False):
+    # tune_hyperparam and init_classifier are used by active learning to
+    # update the detection model incrementally (see Classifier.training).
+    # They are ignored when the test method builds several folds.
+    def run(self, instances=None, cv_monitoring=False, tune_hyperparam=True,
+            init_classifier=None):
         Experiment.run(self)
-        datasets = self._gen_datasets(instances)
+        with profiling.span('datasets'):
+            datasets = self._gen_datasets(instances)
         if self.test_conf.method in ['cv', 'temporal_cv', 'sliding_window']:
             self._run_cv(datasets, cv_monitoring)
         else:
-            self._run_one_fold(datasets, cv_monitoring)
+            self._run_one_fold(datasets, cv_monitoring,
+                               tune_hyperparam=tune_hyperparam,
+                               init_classifier=init_classifier)
 
     def web_template(self):
         return 'diadem/main.html'
@@ -220,35 +248,53 @@ class DiademExp(Experiment):
             return None
         return self.exp_conf.core_conf.test_conf.alerts_conf
 
-    def _run_one_fold(self, datasets, cv_monitoring, fold_id=None):
-        classifier, train_time = self._train(datasets, cv_monitoring, fold_id)
+    # fold_result: (classifier, train_time, train_predictions,
+    # test_predictions) computed beforehand by _train_test_fold.
+    def _run_one_fold(self, datasets, cv_monitoring, fold_id=None,
+                      tune_hyperparam=True, init_classifier=None,
+                      fold_result=None):
+        if fold_result is None:
+            fold_result = (None, None, None, None)
+        trained, train_t, train_predictions, test_predictions = fold_result
+        classifier, train_time = self._train(datasets, cv_monitoring, fold_id,
+                                             tune_hyperparam, init_classifier,
+                                             trained=trained,
+                                             train_time=train_t)
         self._detection('train', classifier, datasets.train_instances,
-                        fold_id)
-        test_predictions, test_time = self._detection('test', classifier,
-                                                      datasets.test_instances,
-                                                      fold_id)
+                        fold_id, predictions=train_predictions)
+        test_predictions, test_time = self._detection(
+                                           'test', classifier,
+                                           datasets.test_instances, fold_id,
+                                           predictions=test_predictions)
         if self.validation_conf:
             self._detection('validation', classifier, None, fold_id)
         return classifier, train_time, test_predictions, test_time
 
-    def _train(self, datasets, cv_monitoring, fold_id):
+    def _train(self, datasets, cv_monitoring, fold_id, tune_hyperparam=True,
+               init_classifier=None, trained=None, train_time=None):
         if self.exp_conf.already_trained is not None:
             train_exp_id = self._set_train_exp_id()
             return self._get_trained_classifier(train_exp_id), 0
         else:
             train_exp = self._create_train_exp(fold_id=fold_id)
-            train_exp.run(datasets.train_instances, cv_monitoring)
+            with profiling.span('train'):
+                train_exp.run(datasets.train_instances, cv_monitoring,
+                              tune_hyperparam=tune_hyperparam,
+                              init_classifier=init_classifier,
+                              classifier=trained, train_time=train_time)
             if fold_id is None:
                 self._set_train_exp(train_exp)
             return train_exp.classifier, train_exp.train_time
 
     # kind: train, test, validation
-    def _detection(self, kind, classifier, instances, fold_id):
+    def _detection(self, kind, classifier, instances, fold_id,
+                   predictions=None):
         detection_exp = self._create_detection_exp(kind, classifier.conf,
                                                    fold_id=fold_id)
         if fold_id is None:
             self._set_detection_exp(kind, detection_exp)
-        detection_exp.run(instances, classifier)
+        with profiling.span('detection_%s' % kind):
+            detection_exp.run(instances, classifier, predictions=predictions)
         return detection_exp.predictions, detection_exp.prediction_time
 
     def _run_cv(self, cv_datasets, cv_monitoring):
@@ -257,17 +303,36 @@ class DiademExp(Experiment):
         add_diadem_exp_to_db(self.session, self.exp_conf.exp_id, None, 'cv',
                              classifier_conf=classifier_conf)
         global_cv_monitoring = CvMonitoring(self, self.test_conf.num_folds)
+        fold_results = self._train_test_folds(cv_datasets)
         for fold_id, datasets in enumerate(cv_datasets._datasets):
             classifier, train_t, predictions, test_t = self._run_one_fold(
-                                                                 datasets,
-                                                                 cv_monitoring,
-                                                                 fold_id)
+                                           datasets, cv_monitoring, fold_id,
+                                           fold_result=fold_results[fold_id])
             global_cv_monitoring.add_fold(classifier, train_t, predictions,
                                           test_t, fold_id)
             classifiers[fold_id] = classifier
         global_cv_monitoring.display(self.output_dir())
         return classifiers
 
+    # When n_jobs > 1, the folds are trained and tested in worker processes.
+    # The children experiments are then created by the parent process.
+    def _train_test_folds(self, cv_datasets):
+        n_jobs = self.test_conf.n_jobs
+        if n_jobs == 1 or self.exp_conf.already_trained is not None:
+            return [None for _ in range(self.test_conf.num_folds)]
+        classifier_conf = self.exp_conf.core_conf.classifier_conf
+        profile = profiling.is_active()
+        with profiling.span('folds'):
+            results = joblib.Parallel(n_jobs=n_jobs)(
+                        joblib.delayed(_train_test_fold)(classifier_conf,
+                                                         datasets, fold_id,
+                                                         profile)
+                        for fold_id, datasets in enumerate(
+                                                    cv_datasets._datasets))
+            profiling.add_spans([span for _, span in results
+                                 if span is not None])
+        return [fold_result for fold_result, _ in results]
+
     def _gen_datasets(self, instances):
         if instances is None:
             instances = self.get_instances()
@@ -14,6 +14,7 @@
 # You should have received a copy of the GNU General Public License along
 # with SecuML. If not, see <http://www.gnu.org/licenses/>.
 
+from secuml.core.tools import profiling
 from secuml.exp import experiment
 from secuml.exp.tools.db_tables import DiademExpAlchemy
 from secuml.exp.experiment import Experiment
@@ -43,11 +44,13 @@ class DetectionExp(Experiment):
                                            self,
                                            alerts_conf=self.exp_conf.core_conf)
 
-    def run(self, test_instances, classifier):
+    # predictions: (predictions, prediction_time) when the predictions have
+    # already been computed in a worker process.
+    def run(self, test_instances, classifier, predictions=None):
         Experiment.run(self)
         self.classifier = classifier
         self.test_instances = self.get_instances(test_instances)
-        self._test(classifier)
+        self._test(classifier, predictions=predictions)
         self._export()
 
     def web_template(self):
@@ -60,15 +63,17 @@ class DetectionExp(Experiment):
                                           type=self.kind))
         self.session.flush()
 
-    def _test(self, classifier):
+    def _test(self, classifier, predictions=None):
         if self.test_instances.has_ground_truth():
             diadem_set_perf_monitoring(self.session, self.exp_conf.exp_id)
-        self.predictions, self.prediction_time = classifier.testing(
-                                                           self.test_instances)
+        if predictions is None:
+            predictions = classifier.testing(self.test_instances)
+        self.predictions, self.prediction_time = predictions
         self.monitoring.add_predictions(self.predictions, self.prediction_time)
 
     def _export(self):
-        self.monitoring.display(self.output_dir())
+        with profiling.span('monitoring_export'):
+            self.monitoring.display(self.output_dir())
         self._set_diadem_conf()
 
     def _set_diadem_conf(self):
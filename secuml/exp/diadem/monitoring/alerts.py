@@ -56,7 +56,9 @@ class AlertsMonitoring(object):
         self._check_num_clusters(alerts_instances)
         core_clustering_conf = self.alerts_conf.clustering_conf
         clustering_exp = self._create_clustering_exp(core_clustering_conf)
-        clustering_exp.run(instances=alerts_instances, quick=True)
+        # The silhouette is computed only if it is estimated from a sample.
+        quick = core_clustering_conf.silhouette_sample_size is None
+        clustering_exp.run(instances=alerts_instances, quick=quick)
 
     def _classify(self, alerts_instances, train_instances):
         model = self._train_multiclass(train_instances)
@@ -14,10 +14,43 @@
 # You should have received a copy of the GNU General Public License along
 # with SecuML. If not, see <http://www.gnu.org/licenses/>.
 
+import csv
+import tempfile
+
 from secuml.core.classif.monitoring.prediction import PredictionsMonitoring \
         as PredictionsMonitoringCore
+from secuml.core.data.labels_tools import label_bool_to_str
+from secuml.core.tools import profiling
+
+from secuml.exp.tools.db_tables import call_specific_db_func
+
+# Number of predictions loaded into the DB at once.
+CHUNK_SIZE = 100000
+
+# NULL value in the CSV files loaded with COPY / LOAD DATA.
+NULL = '\\N'
+
 
-from secuml.exp.tools.db_tables import PredictionsAlchemy
+def _values_to_str(predictions, start, end):
+    values = predictions.values[start:end]
+    if predictions.info.multiclass:
+        return [str(v) for v in values]
+    return [label_bool_to_str(v) for v in values]
+
+
+def _probas_to_str(predictions, start, end):
+    if not predictions.info.with_probas:
+        return [NULL] * (end - start)
+    return [repr(float(p)) for p in predictions.probas[start:end]]
+
+
+def write_predictions_csv(f, exp_id, predictions, start, end):
+    writer = csv.writer(f)
+    instance_ids = predictions.ids.get_ids_array()[start:end]
+    writer.writerows(zip([exp_id] * (end - start),
+                         instance_ids.tolist(),
+                         _values_to_str(predictions, start, end),
+                         _probas_to_str(predictions, start, end)))
 
 
 class PredictionsMonitoring(PredictionsMonitoringCore):
@@ -27,14 +60,25 @@ class PredictionsMonitoring(PredictionsMonitoringCore):
         self.exp = exp
 
     def add_fold(self, predictions):
-        def to_float(x):
-            if x is None:
-                return None
-            return float(x)
         PredictionsMonitoringCore.add_fold(self, predictions)
-        predictions_db = [PredictionsAlchemy(exp_id=self.exp.exp_id,
-                                             instance_id=p.instance_id,
-                                             value=p.value_to_str(),
-                                             proba=to_float(p.proba))
-                          for p in predictions.to_list()]
-        self.exp.session.bulk_save_objects(predictions_db)
+        with profiling.span('predictions_db_write'):
+            self._load_predictions(predictions)
+
+    # The predictions are loaded chunk by chunk with COPY (PostgreSQL) or
+    # LOAD DATA (MySQL) rather than with one ORM object per instance.
+    def _load_predictions(self, predictions):
+        num_instances = predictions.num_instances()
+        if num_instances == 0:
+            return
+        db_type = self.exp.exp_conf.secuml_conf.db_type
+        cursor = self.exp.session.connection().connection.cursor()
+        for start in range(0, num_instances, CHUNK_SIZE):
+            end = min(start + CHUNK_SIZE, num_instances)
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.csv',
+                                             newline='') as f:
+                write_predictions_csv(f, self.exp.exp_id, predictions, start,
+                                      end)
+                f.flush()
+                call_specific_db_func(db_type, 'load_predictions',
+                                      (cursor, f.name))
+        self.exp.session.flush()
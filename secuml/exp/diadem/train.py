@@ -15,6 +15,7 @@
 # with SecuML. If not, see <http://www.gnu.org/licenses/>.
 
 from secuml.core.classif.classifiers import NoCvMonitoring
+from secuml.core.tools import profiling
 from secuml.exp import experiment
 from secuml.exp.experiment import Experiment
 
@@ -31,12 +32,20 @@ class TrainExp(Experiment):
         self.train_time = None
         self.monitoring = TrainMonitoring(self)
 
-    def run(self, train_instances, cv_monitoring=False):
+    # classifier and train_time are set when the classifier has already been
+    # trained in a worker process (see DiademExp._train_test_folds).
+    def run(self, train_instances, cv_monitoring=False, tune_hyperparam=True,
+            init_classifier=None, classifier=None, train_time=None):
         Experiment.run(self)
-        self._train(train_instances)
+        if classifier is None:
+            self._train(train_instances, tune_hyperparam, init_classifier)
+        else:
+            self._set_classifier(classifier, train_time)
         if cv_monitoring:
-            self._cv_monitoring(train_instances)
-        self.monitoring.display(self.output_dir())
+            with profiling.span('cv_monitoring'):
+                self._cv_monitoring(train_instances)
+        with profiling.span('monitoring_export'):
+            self.monitoring.display(self.output_dir())
 
     def add_to_db(self):
         from secuml.exp.diadem import add_diadem_exp_to_db
@@ -45,10 +54,18 @@ class TrainExp(Experiment):
                              self.exp_conf.fold_id, 'train',
                              classifier_conf=self.exp_conf.core_conf)
 
-    def _train(self, train_instances):
+    def _train(self, train_instances, tune_hyperparam, init_classifier):
         classifier_conf = self.exp_conf.core_conf
         self.classifier = classifier_conf.model_class(classifier_conf)
-        _, self.train_time = self.classifier.training(train_instances)
+        _, self.train_time = self.classifier.training(
+                                            train_instances,
+                                            tune_hyperparam=tune_hyperparam,
+                                            init_classifier=init_classifier)
+        self.monitoring.set_classifier(self.classifier, self.train_time)
+
+    def _set_classifier(self, classifier, train_time):
+        self.classifier = classifier
+        self.train_time = train_time
         self.monitoring.set_classifier(self.classifier, self.train_time)
 
     def _cv_monitoring(self, train_instances):
@@ -37,9 +37,9 @@ class FeaturesAnalysisExperiment(Experiment):
 
     def run(self):
         Experiment.run(self)
-        stats = FeaturesAnalysis(self.get_instances())
-        stats.compute()
-        stats.export(self.output_dir())
+        stats = FeaturesAnalysis(self.get_instances(),
+                                 n_jobs=self.exp_conf.n_jobs)
+        stats.run(self.output_dir())
 
     def web_template(self):
         return 'features_analysis/main.html'
@@ -16,6 +16,7 @@
 
 import argparse
 
+from secuml.core.conf import exportFieldMethod
 from secuml.exp.conf.annotations import AnnotationsConf
 from secuml.exp.conf.dataset import DatasetConf
 from secuml.exp.conf.exp import ExpConf
@@ -24,6 +25,18 @@ from secuml.exp.conf.features import FeaturesConf
 
 class FeaturesAnalysisConf(ExpConf):
 
+    def __init__(self, secuml_conf, dataset_conf, features_conf,
+                 annotations_conf, core_conf, name=None, parent=None,
+                 n_jobs=1):
+        ExpConf.__init__(self, secuml_conf, dataset_conf, features_conf,
+                         annotations_conf, core_conf, name=name, parent=parent)
+        self.n_jobs = n_jobs
+
+    def fields_to_export(self):
+        fields = ExpConf.fields_to_export(self)
+        fields.extend([('n_jobs', exportFieldMethod.primitive)])
+        return fields
+
     @staticmethod
     def gen_parser():
         parser = argparse.ArgumentParser(description='Features Analysis')
@@ -32,6 +45,12 @@ class FeaturesAnalysisConf(ExpConf):
                     parser, required=False,
                     message='CSV file containing the annotations of some or '
                             'all the instances.')
+        parser.add_argument('--n-jobs',
+                            type=int,
+                            default=1,
+                            help='Number of processes generating the plots '
+                                 'of the features in parallel. '
+                                 '-1 means all the CPUs. Default: 1.')
         return parser
 
     @staticmethod
@@ -43,7 +62,7 @@ class FeaturesAnalysisConf(ExpConf):
                                            secuml_conf.logger)
         return FeaturesAnalysisConf(secuml_conf, dataset_conf,
                                     features_conf, annotations_conf, None,
-                                    name=args.exp_name)
+                                    name=args.exp_name, n_jobs=args.n_jobs)
 
     @staticmethod
     def from_json(conf_json, secuml_conf):
@@ -57,6 +76,7 @@ class FeaturesAnalysisConf(ExpConf):
         conf = FeaturesAnalysisConf(secuml_conf, dataset_conf, features_conf,
                                     annotations_conf, None,
                                     name=conf_json['name'],
-                                    parent=conf_json['parent'])
+                                    parent=conf_json['parent'],
+                                    n_jobs=conf_json.get('n_jobs', 1))
         conf.exp_id = conf_json['exp_id']
         return conf
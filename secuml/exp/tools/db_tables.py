@@ -15,7 +15,9 @@
 # with SecuML. If not, see <http://www.gnu.org/licenses/>.
 
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import Column, ForeignKey, Index
+from sqlalchemy import inspect
+from sqlalchemy.exc import DatabaseError
 from sqlalchemy import Boolean, DateTime, Enum, Float, Integer, String, Text
 from sqlalchemy.orm import relationship
 
@@ -131,6 +133,13 @@ class PredictionsAlchemy(Base):
     instance = relationship('InstancesAlchemy', back_populates='predictions',
                             uselist=False)
 
+    # The web server filters the predictions on their probability or value,
+    # and pages through them ordered by (proba, instance_id) or instance_id.
+    __table_args__ = (Index('ix_predictions_exp_proba', 'exp_id', 'proba',
+                            'instance_id'),
+                      Index('ix_predictions_exp_value', 'exp_id', 'value',
+                            'instance_id'))
+
 
 class ActiveLearningExpAlchemy(Base):
 
@@ -354,6 +363,32 @@ class FeaturesAlchemy(Base):
                                 back_populates='features', uselist=False)
 
 
+# Base.metadata.create_all does not add the indexes of the tables that
+# already exist (e.g. the indexes of the predictions added after the creation
+# of the database). The missing indexes are created at startup.
+def create_missing_indexes(engine, logger):
+    inspector = inspect(engine)
+    tables = inspector.get_table_names()
+    for table in Base.metadata.sorted_tables:
+        if table.name not in tables:
+            continue
+        indexes = [index['name'] for index in inspector.get_indexes(
+                                                                table.name)]
+        for index in table.indexes:
+            if index.name in indexes:
+                continue
+            logger.info('Creating the index %s of the table %s. It may take '
+                        'a while on large tables.' % (index.name, table.name))
+            try:
+                index.create(bind=engine)
+            except DatabaseError:
+                # The index may have been created by another process.
+                existing = [i['name'] for i in inspect(engine).get_indexes(
+                                                                table.name)]
+                if index.name not in existing:
+                    raise
+
+
 # db_type: mysql or postgresql
 def call_specific_db_func(db_type, function, args):
     if db_type == 'mysql':
@@ -117,6 +117,16 @@ def load_partial_annotations(cursor, filename, annotations_id, dataset_id):
                    'FROM labels_import;')
 
 
+# The CSV file has no header, and NULL values are written \N.
+def load_predictions(cursor, filename):
+    cursor.execute('LOAD DATA LOCAL INFILE \'%s\' '
+                   'INTO TABLE predictions '
+                   'FIELDS TERMINATED BY \',\' '
+                   'OPTIONALLY ENCLOSED BY \'"\' '
+                   'LINES TERMINATED BY \'\\r\\n\' '
+                   '(exp_id,instance_id,value,proba);' % filename)
+
+
 def get_engine(db_uri):
     return sqlalchemy.create_engine(db_uri + '?charset=utf8', echo=False)
 
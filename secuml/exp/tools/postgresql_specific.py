@@ -119,6 +119,16 @@ def load_partial_annotations(cursor, filename, annotations_id, dataset_id):
     cursor.execute('DROP TABLE annotations_import;')
 
 
+# The CSV file has no header, and NULL values are written \N.
+def load_predictions(cursor, filename):
+    with open(filename, 'r') as f:
+        cursor.copy_expert(sql='COPY predictions(exp_id,instance_id,value,'
+                               'proba) '
+                               'FROM STDIN '
+                               'WITH CSV DELIMITER AS \',\' NULL AS \'\\N\';',
+                           file=f)
+
+
 def get_engine(db_uri):
     return sqlalchemy.create_engine(db_uri, echo=False)
 
@@ -0,0 +1,79 @@
+# SecuML
+# Copyright (C) 2016-2019  ANSSI
+#
+# SecuML is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# SecuML is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with SecuML. If not, see <http://www.gnu.org/licenses/>.
+
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+
+from secuml.exp.tools.exp_exceptions import SecuMLexpException
+from secuml.web import setApp, setSession, setSecuMlConf, setUserExp
+
+
+class GunicornMissing(SecuMLexpException):
+
+    def __str__(self):
+        return ('gunicorn must be installed to run the production server '
+                '(pip install gunicorn).')
+
+
+# The views are imported once the global variables of secuml.web are set.
+# create_app must be called only once per process.
+def create_app(secuml_conf, user_exp=False):
+    setSecuMlConf(secuml_conf)
+    setUserExp(user_exp)
+    app = Flask('secuml.web')
+    app.config['SQLALCHEMY_DATABASE_URI'] = secuml_conf.db_uri
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    # The scoped session of Flask-SQLAlchemy is removed at the end of each
+    # request: the connections are returned to the pool of the engine.
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+                            'pool_size': secuml_conf.db_pool_size,
+                            'pool_timeout': secuml_conf.db_pool_timeout,
+                            'pool_recycle': secuml_conf.db_pool_recycle,
+                            'pool_pre_ping': True}
+    setApp(app)
+    setSession(SQLAlchemy(app).session)
+    import secuml.web.views  # NOQA
+    return app
+
+
+def run_dev_server(secuml_conf, user_exp=False):
+    app = create_app(secuml_conf, user_exp=user_exp)
+    app.run(host=secuml_conf.host, port=secuml_conf.port, debug=True)
+
+
+# Pre-forking gunicorn server. The application is created in each worker
+# after the fork, so that the workers do not share DB connections.
+def run_production_server(secuml_conf, user_exp=False):
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        raise GunicornMissing()
+
+    class SecuMLApplication(BaseApplication):
+
+        def load_config(self):
+            self.cfg.set('bind', '%s:%d' % (secuml_conf.host,
+                                            secuml_conf.port))
+            self.cfg.set('workers', secuml_conf.server_workers)
+            self.cfg.set('threads', secuml_conf.server_threads)
+            self.cfg.set('timeout', secuml_conf.server_timeout)
+
+        def load(self):
+            # Connections opened by the master process before the fork.
+            secuml_conf.engine.dispose()
+            return create_app(secuml_conf, user_exp=user_exp)
+
+    SecuMLApplication().run()
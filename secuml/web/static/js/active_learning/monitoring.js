@@ -8,6 +8,8 @@ function displayEvolutionMonitoringTabs(conf) {
     menu_labels.push('models_evolution');
     menu_titles.push('Time');
     menu_labels.push('time_evolution');
+    menu_titles.push('Profiling');
+    menu_labels.push('profiling');
   }
   if (conf.query_strategy == 'Ilab') {
     menu_titles.push('Suggestions');
@@ -26,6 +28,7 @@ function updateEvolutionMonitoringDisplay(conf, iteration) {
   if (view == 'ml') {
     updateModelsEvolutionMonitoring(conf, iteration);
     updateExecutionTimeEvolutionMonitoring(conf, iteration);
+    updateProfilingMonitoring(conf, iteration);
   }
 }
 
@@ -93,6 +96,31 @@ function updateExecutionTimeEvolutionMonitoring(conf, iteration) {
                                                              picture);
 }
 
+function addProfilingSpans(body, span, depth) {
+  var name = '&nbsp;'.repeat(4 * depth) + span.name;
+  var peak_rss = '';
+  if (span.peak_rss !== null) {
+    peak_rss = (span.peak_rss / (1024 * 1024)).toFixed(1);
+  }
+  addRow(body, [name, span.duration.toFixed(3), peak_rss]);
+  for (var i in span.children) {
+    addProfilingSpans(body, span.children[i], depth + 1);
+  }
+}
+
+function updateProfilingMonitoring(conf, iteration) {
+  var profiling = cleanDiv('profiling');
+  var query = buildQuery('activeLearningProfiling', [conf.exp_id, iteration]);
+  $.getJSON(query, function(data) {
+      var body = createTable('profiling',
+                             ['Phase', 'Duration (s)', 'Peak RSS (MB)']);
+      addProfilingSpans(body, data, 0);
+  }).fail(function() {
+      profiling.appendChild(document.createTextNode(
+                  'Profiling is not available yet.'));
+  });
+}
+
 function updateFamiliesEvolutionMonitoring(conf, iteration) {
   var families_evolution = cleanDiv('families_evolution');
   var query = buildQuery('activeLearningMonitoring',
@@ -44,15 +44,9 @@ function displayCurrentInstance() {
 }
 
 function displayAlerts(exp_id, analysis) {
-    var query = buildQuery('getAlerts', [exp_id, analysis]);
-    $.getJSON(query,
-            function(data) {
-                instances_list = data['instances'];
-                proba_list = data['proba'];
+    loadFirstPage('getAlerts', [exp_id, analysis],
+            function() {
                 current_instance_index = 0;
-                num_instances = instances_list.length;
-                var num_instances_label = document.getElementById('num_instances_label');
-                num_instances_label.textContent = num_instances;
                 var curr_instance_label = document.getElementById('curr_instance_label');
                 if (num_instances > 0) {
                     curr_instance_label.value = current_instance_index + 1;
@@ -74,6 +68,8 @@ function displayNextInstance() {
         curr_instance_label.value = current_instance_index + 1;
         printInstanceInformation(instances_list[current_instance_index],
                                  proba_list[current_instance_index]);
+    } else {
+        loadNextPage(displayNextInstance);
     }
 }
 
@@ -54,22 +54,18 @@ function updateInstancesDisplay(exp_id, selected_index, label, xlabels) {
     if (!label) {
         label = 'all';
     }
-    var query = null;
+    var route = null;
+    var args = null;
     if (!exp_info.multiclass && exp_info.proba) {
-        query = buildQuery('getPredictionsProbas',
-                           [exp_id, selected_index, label]);
+        route = 'getPredictionsProbas';
+        args = [exp_id, selected_index, label];
     } else {
-        query = buildQuery('getPredictions', [exp_id, xlabels[selected_index],
-                                              label, exp_info.multiclass])
+        route = 'getPredictions';
+        args = [exp_id, xlabels[selected_index], label, exp_info.multiclass];
     }
-    $.getJSON(query,
-        function(data) {
-            instances_list = data['instances'];
-            proba_list = data['proba'];
+    loadFirstPage(route, args,
+        function() {
             current_instance_index = 0;
-            num_instances = instances_list.length;
-            var num_instances_label = document.getElementById('num_instances_label');
-            num_instances_label.textContent = num_instances;
             var curr_instance_label = document.getElementById('curr_instance_label');
             if (num_instances > 0) {
                 curr_instance_label.value = current_instance_index + 1;
@@ -108,6 +104,8 @@ function displayNextInstance() {
         curr_instance_label.value = current_instance_index + 1;
         printInstanceInformation(instances_list[current_instance_index],
                 proba_list[current_instance_index]);
+    } else {
+        loadNextPage(displayNextInstance);
     }
 }
 
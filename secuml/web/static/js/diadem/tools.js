@@ -1,3 +1,63 @@
 function interactiveAnnotations() {
     return !(annotations_type == 'ground_truth');
 }
+
+// The predictions are loaded page by page: the next page is requested when
+// the user goes past the last loaded instance.
+var PAGE_SIZE = 1000;
+var load_next_page = null;
+var page_loading = false;
+// Identifies the list being loaded: the pages of a previous list are ignored.
+var pages_list_id = 0;
+
+// route, args: query returning the predictions page by page
+// (limit and after_id are appended to args).
+function loadFirstPage(route, args, callback) {
+    instances_list = [];
+    proba_list = [];
+    num_instances = 0;
+    pages_list_id += 1;
+    loadPage(route, args, 'None', callback);
+}
+
+function loadPage(route, args, after_id, callback) {
+    page_loading = true;
+    var list_id = pages_list_id;
+    var query = buildQuery(route, args.concat([PAGE_SIZE, after_id]));
+    $.getJSON(query, function(data) {
+        if (list_id != pages_list_id) {
+            return;
+        }
+        instances_list = instances_list.concat(data['instances']);
+        proba_list = proba_list.concat(data['proba']);
+        num_instances = instances_list.length;
+        load_next_page = null;
+        if (data['next']) {
+            load_next_page = function(next_callback) {
+                loadPage(route, args, data['next']['after_id'],
+                         next_callback);
+            };
+        }
+        var num_instances_label = document.getElementById(
+                                                      'num_instances_label');
+        num_instances_label.textContent = num_instances;
+        if (load_next_page) {
+            num_instances_label.textContent += '+';
+        }
+        page_loading = false;
+        callback();
+    });
+}
+
+// Returns true if the next page is being loaded. callback is called once
+// it is loaded.
+function loadNextPage(callback) {
+    if (page_loading) {
+        return true;
+    }
+    if (!load_next_page) {
+        return false;
+    }
+    load_next_page(callback);
+    return true;
+}
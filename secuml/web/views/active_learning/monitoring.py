@@ -18,6 +18,14 @@ from flask import jsonify, send_file
 import json
 import os.path as path
 
+from secuml.core.active_learning.monitoring.suggestions_accuracy \
+    import SuggestionsAccuracy
+from secuml.exp.active_learning.monitoring.exec_times \
+    import ExecutionTimesMonitoring
+from secuml.exp.active_learning.monitoring.model_perf \
+    import ModelPerfEvolution
+from secuml.exp.active_learning.monitoring.profiling \
+    import ProfilingMonitoring
 from secuml.web import app
 from secuml.web.views.experiments import update_curr_exp
 
@@ -41,8 +49,10 @@ def getLabelsMonitoring(exp_id, iteration):
 def activeLearningSuggestionsMonitoring(exp_id, iteration):
     iteration = int(iteration)
     experiment = update_curr_exp(exp_id)
-    filename = path.join(experiment.output_dir(),
-                         str(iteration-1),
+    al_dir = experiment.output_dir()
+    iteration_dir = path.join(al_dir, str(iteration-1))
+    SuggestionsAccuracy.plot(al_dir, iteration_dir, iteration-1)
+    filename = path.join(iteration_dir,
                          'suggestions_accuracy',
                          'labels_families_high_confidence_suggestions.png')
     return send_file(filename)
@@ -51,11 +61,26 @@ def activeLearningSuggestionsMonitoring(exp_id, iteration):
 @app.route('/activeLearningModelsMonitoring/<exp_id>/<iter>/<train_test>/')
 def activeLearningModelsMonitoring(exp_id, iter, train_test):
     experiment = update_curr_exp(exp_id)
-    directory = path.join(experiment.output_dir(), str(iter), 'model_perf')
+    al_dir = experiment.output_dir()
+    ModelPerfEvolution.plot(al_dir, path.join(al_dir, str(iter)), int(iter),
+                            kind=train_test)
+    directory = path.join(al_dir, str(iter), 'model_perf')
     filename = '%s.png' % train_test
     return send_file(path.join(directory, filename), mimetype='image/png')
 
 
+@app.route('/activeLearningProfiling/<exp_id>/<iteration>/')
+def activeLearningProfiling(exp_id, iteration):
+    experiment = update_curr_exp(exp_id)
+    directory = path.join(experiment.output_dir(), str(iteration))
+    # The profiling of the current iteration is exported when it ends.
+    try:
+        return send_file(ProfilingMonitoring.get_json_file(directory),
+                         mimetype='application/json')
+    except FileNotFoundError:
+        return 'FileNotFoundError'
+
+
 @app.route('/activeLearningMonitoring/<exp_id>/<iteration>/<kind>/<sub_kind>/')
 def activeLearningMonitoring(exp_id, iteration, kind, sub_kind):
     experiment = update_curr_exp(exp_id)
@@ -73,6 +98,8 @@ def activeLearningMonitoring(exp_id, iteration, kind, sub_kind):
                              'clustering_evaluation',
                              sub_kind + '_monitoring.png')
     if kind == 'time':
+        ExecutionTimesMonitoring.plot(experiment.output_dir(), directory,
+                                      int(iteration))
         filename = path.join(directory,
                              'execution_times.png')
     try:
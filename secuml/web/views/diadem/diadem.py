@@ -17,10 +17,12 @@
 from flask import render_template, send_file, jsonify
 import numpy as np
 import os.path as path
-from sklearn.externals import joblib
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import aliased
 from sqlalchemy.orm.exc import NoResultFound
 
 from secuml.web import app, secuml_conf, session
+from secuml.web.views import exp_cache
 from secuml.web.views.experiments import update_curr_exp
 
 from secuml.core.tools.plots.barplot import BarPlot
@@ -38,12 +40,58 @@ from secuml.exp.tools.db_tables import InstancesAlchemy
 from secuml.exp.tools.db_tables import PredictionsAlchemy
 
 TOP_N_ALERTS = 100
+# Number of predictions returned when the request does not specify a limit.
+PAGE_SIZE = 1000
 
 
 def db_row_to_json(row):
     return {c.name: getattr(row, c.name) for c in row.__table__.columns}
 
 
+# Keyset pagination of the predictions of the experiment exp_id.
+# The pages are ordered by (proba, instance_id) when by_proba is True, and by
+# instance_id otherwise. after_id is the instance_id of the last prediction
+# of the previous page ('None' for the first page).
+def paginate_predictions(query, exp_id, limit, after_id, by_proba,
+                         desc=False):
+    proba = PredictionsAlchemy.proba
+    instance_id = PredictionsAlchemy.instance_id
+    if after_id != 'None':
+        after_id = int(after_id)
+        after_ids = instance_id < after_id if desc else instance_id > after_id
+        if by_proba:
+            # The proba of the last prediction is read by the query itself:
+            # a value sent to the client and parsed back may differ from the
+            # stored one (e.g. Float is single precision with MySQL).
+            last = aliased(PredictionsAlchemy)
+            query = query.join(last, and_(last.exp_id == exp_id,
+                                          last.instance_id == after_id))
+            after_probas = proba < last.proba if desc else proba > last.proba
+            after_ids = or_(after_probas,
+                            and_(proba == last.proba, after_ids))
+        query = query.filter(after_ids)
+    keys = [proba, instance_id] if by_proba else [instance_id]
+    if desc:
+        keys = [k.desc() for k in keys]
+    query = query.order_by(*keys)
+    return query.limit(int(limit))
+
+
+def predictions_to_json(predictions, limit=None):
+    if predictions:
+        ids, probas = zip(*[(r.instance_id, r.proba) for r in predictions])
+    else:
+        ids = []
+        probas = []
+    res = {'instances': ids, 'proba': probas}
+    if limit is not None:
+        # Cursor of the next page
+        res['next'] = None
+        if len(predictions) == int(limit):
+            res['next'] = {'after_id': ids[-1]}
+    return jsonify(res)
+
+
 @app.route('/getDiademChildInfo/<exp_id>/')
 def getDiademChildInfo(exp_id):
     query = session.query(DiademExpAlchemy)
@@ -128,7 +176,8 @@ def getAlertsClusteringExpId(test_exp_id):
 
 
 @app.route('/getAlerts/<exp_id>/<analysis_type>/')
-def getAlerts(exp_id, analysis_type):
+@app.route('/getAlerts/<exp_id>/<analysis_type>/<limit>/<after_id>/')
+def getAlerts(exp_id, analysis_type, limit=None, after_id='None'):
     exp = update_curr_exp(exp_id)
     # With proba ?
     query = session.query(DiademExpAlchemy)
@@ -143,22 +192,32 @@ def getAlerts(exp_id, analysis_type):
     if with_proba:
         query = query.filter(PredictionsAlchemy.proba >= threshold)
     if analysis_type == 'topN' and with_proba:
-        query = query.order_by(PredictionsAlchemy.proba.desc())
+        # The pages stop once TOP_N_ALERTS alerts have been returned.
+        # The alerts of the previous pages are those ranked before after_id.
+        num_returned = 0
+        if after_id != 'None':
+            previous = paginate_predictions(query, exp_id, TOP_N_ALERTS,
+                                            after_id, True)
+            num_returned = previous.count() + 1
+        limit = min(int(limit or TOP_N_ALERTS),
+                    max(0, TOP_N_ALERTS - num_returned))
+        query = paginate_predictions(query, exp_id, limit, after_id, True,
+                                     desc=True)
+        predictions = query.all() if limit > 0 else []
+        if num_returned + len(predictions) >= TOP_N_ALERTS:
+            limit = None
+        return predictions_to_json(predictions, limit=limit)
     elif analysis_type == 'random':
         query = call_specific_db_func(secuml_conf.db_type, 'random_order',
                                       (query,))
     query = query.limit(TOP_N_ALERTS)
-    predictions = query.all()
-    if predictions:
-        ids, probas = zip(*[(r.instance_id, r.proba) for r in predictions])
-    else:
-        ids = []
-        probas = []
-    return jsonify({'instances': ids, 'proba': probas})
+    return predictions_to_json(query.all())
 
 
 @app.route('/getPredictionsProbas/<exp_id>/<index>/<label>/')
-def getPredictionsProbas(exp_id, index, label):
+@app.route('/getPredictionsProbas/<exp_id>/<index>/<label>/<limit>/'
+           '<after_id>/')
+def getPredictionsProbas(exp_id, index, label, limit=None, after_id='None'):
     index = int(index)
     proba_min = index * 0.1
     proba_max = (index + 1) * 0.1
@@ -170,18 +229,17 @@ def getPredictionsProbas(exp_id, index, label):
         query = query.join(PredictionsAlchemy.instance)
         query = query.join(InstancesAlchemy.ground_truth)
         query = query.filter(GroundTruthAlchemy.label == label)
-    predictions = query.all()
-    if predictions:
-        ids, probas = zip(*[(r.instance_id, r.proba) for r in predictions])
-    else:
-        ids = []
-        probas = []
-    return jsonify({'instances': ids, 'proba': probas})
+    limit = limit or PAGE_SIZE
+    query = paginate_predictions(query, exp_id, limit, after_id, True)
+    return predictions_to_json(query.all(), limit=limit)
 
 
 @app.route('/getPredictions/<exp_id>/<predicted_value>/<right_wrong>/'
            '<multiclass>/')
-def getPredictions(exp_id, predicted_value, right_wrong, multiclass):
+@app.route('/getPredictions/<exp_id>/<predicted_value>/<right_wrong>/'
+           '<multiclass>/<limit>/<after_id>/')
+def getPredictions(exp_id, predicted_value, right_wrong, multiclass,
+                   limit=None, after_id='None'):
     query = session.query(PredictionsAlchemy)
     query = query.filter(PredictionsAlchemy.exp_id == exp_id)
     query = query.filter(PredictionsAlchemy.value == predicted_value)
@@ -197,13 +255,9 @@ def getPredictions(exp_id, predicted_value, right_wrong, multiclass):
                                  predicted_value)
         else:
             assert(False)
-    predictions = query.all()
-    if predictions:
-        ids, probas = zip(*[(r.instance_id, r.proba) for r in predictions])
-    else:
-        ids = []
-        probas = []
-    return jsonify({'instances': ids, 'proba': probas})
+    limit = limit or PAGE_SIZE
+    query = paginate_predictions(query, exp_id, limit, after_id, False)
+    return predictions_to_json(query.all(), limit=limit)
 
 
 @app.route('/supervisedLearningMonitoring/<exp_id>/<kind>/')
@@ -253,7 +307,8 @@ def get_train_exp(exp_id):
 def get_classifier(exp_id):
     train_exp_id = get_train_exp(exp_id)
     train_exp = update_curr_exp(train_exp_id)
-    return joblib.load(path.join(train_exp.output_dir(), 'model.out'))
+    return exp_cache.load_model(path.join(train_exp.output_dir(),
+                                          'model.out'))
 
 
 @app.route('/getTopWeightedFeatures/<exp_id>/<instance_id>/<size>/')
@@ -0,0 +1,103 @@
+# SecuML
+# Copyright (C) 2016-2019  ANSSI
+#
+# SecuML is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# SecuML is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with SecuML. If not, see <http://www.gnu.org/licenses/>.
+
+# The experiments rebuilt from their conf.json files and the models loaded
+# from model.out are kept in LRU caches shared by all the views.
+# An entry is invalidated when the modification time of its file changes,
+# or when the file is removed (e.g. the experiment has been deleted).
+
+from collections import OrderedDict
+from sklearn.externals import joblib
+import os
+import threading
+
+from secuml.exp import experiment
+from secuml.exp.experiment import get_project_dataset
+
+MAX_EXPERIMENTS = 64
+MAX_MODELS = 8
+
+
+def _get_mtime(filename):
+    try:
+        return os.stat(filename).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+class LruCache(object):
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    # Returns the value stored for key if the file has not been modified
+    # since, None otherwise.
+    def get(self, key):
+        with self.lock:
+            if key not in self.entries:
+                return None
+            filename, mtime, value = self.entries[key]
+            if mtime is None or _get_mtime(filename) != mtime:
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, filename, mtime, value):
+        with self.lock:
+            self.entries[key] = (filename, mtime, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+experiments_cache = LruCache(MAX_EXPERIMENTS)
+models_cache = LruCache(MAX_MODELS)
+
+
+def get_conf_filename(secuml_conf, session, exp_id):
+    project, dataset = get_project_dataset(session, exp_id)
+    return os.path.join(secuml_conf.output_data_dir, project, dataset,
+                        str(exp_id), 'conf.json')
+
+
+def get_experiment(secuml_conf, session, exp_id):
+    exp_id = int(exp_id)
+    exp = experiments_cache.get(exp_id)
+    if exp is None:
+        conf_filename = get_conf_filename(secuml_conf, session, exp_id)
+        # The modification time is read before the file so that a concurrent
+        # update invalidates the entry.
+        mtime = _get_mtime(conf_filename)
+        exp = experiment.get_factory().from_exp_id(exp_id, secuml_conf,
+                                                   session)
+        experiments_cache.set(exp_id, conf_filename, mtime, exp)
+    return exp
+
+
+def load_model(model_filename):
+    model = models_cache.get(model_filename)
+    if model is None:
+        mtime = _get_mtime(model_filename)
+        model = joblib.load(model_filename)
+        models_cache.set(model_filename, model_filename, mtime, model)
+    return model
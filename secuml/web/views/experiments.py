@@ -22,7 +22,6 @@ import os
 from sqlalchemy import desc
 from sqlalchemy.sql.expression import null
 
-from secuml.exp import experiment
 from secuml.exp.experiment import get_project_dataset
 from secuml.exp.tools.db_tables import DatasetsAlchemy
 from secuml.exp.tools.db_tables import FeaturesAlchemy
@@ -30,10 +29,11 @@ from secuml.exp.tools.db_tables import FeaturesSetsAlchemy
 from secuml.exp.tools.db_tables import ExpAlchemy
 from secuml.exp.tools.db_tables import ExpRelationshipsAlchemy
 from secuml.exp.tools.db_tables import FeaturesAnalysisExpAlchemy
+from secuml.web.views import exp_cache
 
 
 def update_curr_exp(exp_id):
-    return experiment.get_factory().from_exp_id(exp_id, secuml_conf, session)
+    return exp_cache.get_experiment(secuml_conf, session, exp_id)
 
 
 @app.route('/SecuML/')
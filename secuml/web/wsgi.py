@@ -0,0 +1,24 @@
+# SecuML
+# Copyright (C) 2016-2019  ANSSI
+#
+# SecuML is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# SecuML is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with SecuML. If not, see <http://www.gnu.org/licenses/>.
+
+# WSGI entry point for any WSGI server, e.g.
+#   SECUMLCONF=<conf.yml> gunicorn -w 4 secuml.web.wsgi:application
+# The configuration file is read from the environment variable SECUMLCONF.
+
+from secuml.exp.conf.secuml import SecuMLConf
+from secuml.web.server import create_app
+
+application = create_app(SecuMLConf(None))